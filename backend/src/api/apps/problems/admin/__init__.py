@@ -1,2 +1,6 @@
 from .category import AdminCategory
 from .question import AdminQuestion
+from .category_autocomplete_select import CategoryAutocompleteSelect
+from .category_autocomplete_view import CategoryAutocompleteView
+from .estimated_count_paginator import EstimatedCountPaginator
+from .questions_bulk_edit_form import QuestionsBulkEditForm
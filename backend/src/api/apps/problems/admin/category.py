@@ -1,10 +1,84 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.options import csrf_protect_m
+from django.contrib.admin.utils import unquote
+from django.http import HttpResponseRedirect
+from django.urls import path, reverse
+from django.utils.translation import ngettext
 
-from api.apps.problems.models import Category
+from api.apps.problems.bulk import QuestionsBulkEditor
+from api.apps.problems.models import Category, Question
+from .category_autocomplete_view import CategoryAutocompleteView
 
 
 @admin.register(Category)
 class AdminCategory(admin.ModelAdmin):
+    # Question.category is DO_NOTHING, so Django neither lists nor deletes the questions of a deleted category. They
+    # are counted on the confirmation pages and deleted in chunks of their own transactions before the categories,
+    # a category that gets a new question in the meantime is kept.
     list_display = ("name", "created", "changed")
     search_fields = ("name",)
     sortable_by = ("name", "created")
+
+    def get_urls(self):
+        # goes before the default urls, "autocomplete/" would be taken for the id of a category otherwise
+        autocomplete_view = self.admin_site.admin_view(CategoryAutocompleteView.as_view(admin_site=self.admin_site))
+
+        return [
+            path("autocomplete/", autocomplete_view, name="problems_category_autocomplete"),
+        ] + super().get_urls()
+
+    def get_deleted_objects(self, objs, request):
+        deleted_objects, model_count, perms_needed, protected = super().get_deleted_objects(objs, request)
+        number_of_questions = Question.objects.filter(category__in=objs).count()
+
+        if number_of_questions:
+            question_opts = Question._meta
+            model_count[question_opts.verbose_name_plural] = number_of_questions
+            deleted_objects.append(f"{question_opts.verbose_name_plural}: {number_of_questions}")
+
+            if not self.__can_delete_questions(request):
+                perms_needed.add(question_opts.verbose_name)
+
+        return deleted_objects, model_count, perms_needed, protected
+
+    @csrf_protect_m
+    def delete_view(self, request, object_id, extra_context=None):
+        # The default view deletes the category in one transaction, which can't span the chunks its questions are
+        # deleted in, so the confirmed deletion goes the same way as the deletion of selected categories. Everything
+        # else (the confirmation page, missing permissions) is left to the default view.
+        if request.POST:
+            category = self.get_object(request, unquote(object_id))
+
+            if category is not None and self.has_delete_permission(request, category) \
+                    and self.__can_delete_questions(request):
+                return self.__delete_category(request, category)
+
+        return super().delete_view(request, object_id, extra_context)
+
+    def delete_queryset(self, request, queryset):
+        QuestionsBulkEditor().delete_categories(queryset)
+        kept_categories = queryset.count()
+
+        if kept_categories:
+            message = ngettext("%d category got new questions while being deleted and was kept.",
+                               "%d categories got new questions while being deleted and were kept.",
+                               kept_categories) % kept_categories
+            self.message_user(request, message, messages.WARNING)
+
+    def __delete_category(self, request, category):
+        category_display, category_id = str(category), category.pk
+        queryset = Category.objects.filter(id=category_id)
+        self.delete_queryset(request, queryset)
+
+        if queryset.exists():
+            # kept, delete_queryset has already told why
+            return HttpResponseRedirect(reverse(f"admin:{self.opts.app_label}_{self.opts.model_name}_change",
+                                                args=[category_id], current_app=self.admin_site.name))
+
+        self.log_deletion(request, category, category_display)
+
+        return self.response_delete(request, category_display, category_id)
+
+    def __can_delete_questions(self, request):
+        question_admin = self.admin_site._registry.get(Question)
+        return question_admin is not None and question_admin.has_delete_permission(request)
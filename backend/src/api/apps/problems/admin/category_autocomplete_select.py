@@ -0,0 +1,6 @@
+from django.contrib.admin.widgets import AutocompleteSelect
+
+
+class CategoryAutocompleteSelect(AutocompleteSelect):
+    # loads categories from CategoryAutocompleteView instead of the generic autocomplete of the admin site
+    url_name = "%s:problems_category_autocomplete"
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.core.exceptions import PermissionDenied
+from django.db.models.functions import Lower
+from django.http import HttpResponse
+
+
+class CategoryAutocompleteView(AutocompleteJsonView):
+    # Categories for the autocomplete of the question form. They're looked up by a case insensitive prefix of the name
+    # with the lower(name) index: the range makes the index usable on every database and collation, the prefix filter
+    # keeps the result exact. Pages are kept in this process for PROBLEMS_CATEGORY_AUTOCOMPLETE_CACHE_SECONDS, typing
+    # in the select asks for the same prefixes over and over and categories hardly ever change.
+    max_cache_entries = 1000
+
+    __entries = {}
+    __lock = threading.Lock()
+
+    def get(self, request, *args, **kwargs):
+        # the request is validated and permissions are checked before a cached page is served
+        term, model_admin, source_field, to_field_name = self.process_request(request)
+        self.model_admin = model_admin
+
+        if not self.has_perm(request):
+            raise PermissionDenied
+
+        key = (source_field.model._meta.label, source_field.name, to_field_name, term.strip().lower(),
+               request.GET.get(self.page_kwarg, "1"))
+        now = time.monotonic()
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+        if entry is not None and entry[0] > now:
+            return HttpResponse(entry[1], content_type="application/json")
+
+        response = super().get(request, *args, **kwargs)
+
+        if response.status_code == 200:
+            self.__store(key, now + settings.PROBLEMS_CATEGORY_AUTOCOMPLETE_CACHE_SECONDS, response.content)
+
+        return response
+
+    def get_queryset(self):
+        term = self.term.strip().lower()
+        queryset = self.model_admin.get_queryset(self.request) \
+            .complex_filter(self.source_field.get_limit_choices_to()) \
+            .annotate(name_lower=Lower("name")) \
+            .order_by("name_lower", "id")
+
+        if term:
+            queryset = queryset.filter(name_lower__gte=term, name_lower__lt=term + "\uffff",
+                                       name_lower__startswith=term)
+
+        return queryset
+
+    @classmethod
+    def clear_cache(cls):
+        with cls.__lock:
+            cls.__entries.clear()
+
+    @classmethod
+    def __store(cls, key, expires, content):
+        with cls.__lock:
+            if len(cls.__entries) >= cls.max_cache_entries:
+                now = time.monotonic()
+                cls.__entries = {key: entry for key, entry in cls.__entries.items() if entry[0] > now}
+
+                if len(cls.__entries) >= cls.max_cache_entries:
+                    cls.__entries.clear()
+
+            cls.__entries[key] = (expires, content)
@@ -0,0 +1,44 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    # An exact COUNT(*) reads the whole table (or the whole filtered part of it) on Postgres, which is what makes
+    # changelists of huge tables slow. Above estimate_threshold rows the count is taken from the planner statistics
+    # instead: pg_class.reltuples for the whole table, the row estimate of the query plan for a filtered one.
+    # Small results and other databases are counted exactly, the estimate only affects the number of pages.
+    estimate_threshold = 10_000
+
+    @cached_property
+    def count(self):
+        connection = connections[self.object_list.db]
+
+        if connection.vendor == "postgresql":
+            estimate = self.__estimate(connection)
+
+            if estimate is not None and estimate > self.estimate_threshold:
+                return estimate
+
+        return super().count
+
+    def __estimate(self, connection):
+        queryset = self.object_list
+
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                               [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+
+                # reltuples is -1 for tables that were never analyzed
+                return row[0] if row and row[0] >= 0 else None
+
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        return plan[0]["Plan"]["Plan Rows"]
@@ -1,37 +1,81 @@
+import logging
+
 from django import forms
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
 from django.core.exceptions import ValidationError
+from django.db import router, transaction
 from django.forms import Field
 from django.forms.formsets import DELETION_FIELD_NAME
-from django.utils.translation import gettext_lazy as _
-
+from django.utils import timezone
+from django.template.response import TemplateResponse
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _, ngettext
+
+from api.apps.problems.bulk import QuestionsBulkEditor
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.cache.invalidation import invalidate
 from api.apps.problems.models import Question, Option
+from api.apps.problems.search import QuestionsFullTextSearch
+from api.apps.problems.validation import (
+    QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER,
+    QUESTION_TYPES_WITH_OPTIONS,
+    CORRECT_ANSWER_FIELDS,
+    OPTIONS_ERROR_MESSAGES,
+    validate_correct_answer,
+    find_options_error,
+)
+from .category_autocomplete_select import CategoryAutocompleteSelect
+from .estimated_count_paginator import EstimatedCountPaginator
+from .questions_bulk_edit_form import QuestionsBulkEditForm
+
+logger = logging.getLogger(__name__)
+
+
+class AdminOptionForm(forms.ModelForm):
+    def validate_unique(self):
+        # values are checked against the stored options of the question by the formset, in one query for all forms
+        try:
+            self.instance.validate_unique(exclude=self._get_validation_exclusions() + ["value"])
+        except ValidationError as e:
+            self._update_errors(e)
+
+
+class LoadedModelChoiceField(forms.ModelChoiceField):
+    # resolves ids to objects the formset has already loaded, only other ids are looked up in the database
+    def __init__(self, objects, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.objects = objects
+
+    def to_python(self, value):
+        loaded = None if value in self.empty_values else self.objects.get(str(value))
+        return loaded if loaded is not None else super().to_python(value)
 
 
-def validate_boolean_value(value):
-    return value in ["Yes", "No"]
+class AdminOptionInlineFormset(forms.BaseInlineFormSet):
+    options_error_messages = OPTIONS_ERROR_MESSAGES
+    unique_value_check = ("question", "value")
 
+    def add_fields(self, form, index):
+        super(AdminOptionInlineFormset, self).add_fields(form, index)
 
-QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER = [
-    Question.QuestionType.INTEGER.value.lower(),
-    Question.QuestionType.DECIMAL.value.lower(),
-    Question.QuestionType.BOOLEAN.value.lower(),
-    Question.QuestionType.TEXT.value.lower(),
-]
+        # Django looks every submitted option up by its id, the stored options of the question are loaded anyway
+        pk_name = self._pk_field.name
+        pk_field = form.fields.get(pk_name)
 
+        if type(pk_field) is forms.ModelChoiceField:
+            form.fields[pk_name] = LoadedModelChoiceField(
+                self.__stored_options, pk_field.queryset, initial=pk_field.initial, required=False,
+                widget=pk_field.widget
+            )
 
-class AdminOptionInlineFormset(forms.BaseInlineFormSet):
-    options_error_messages = {
-        "incorrect_number_of_valid_options": _("At least two options should be specified."),
-        "options_have_duplicates": _("Some options have the same values."),
-        "incorrect_number_of_single_choice_options": _(
-            "For single choice question type you need to specify exactly one correct option."),
-        "incorrect_number_of_multiple_choice_options": _(
-            "For multiple choice question type you need to specify at least one correct option."
-        )
-    }
+    @cached_property
+    def __stored_options(self):
+        return {str(option.pk): option for option in self.get_queryset()}
 
     def clean(self):
+        self.__validate_values_are_unique()
+
         if not self.__options_should_be_specified():
             return
 
@@ -40,23 +84,15 @@ class AdminOptionInlineFormset(forms.BaseInlineFormSet):
         if not self.is_valid():
             return
 
-        if number_of_valid_options < 2:
-            raise ValidationError(self.options_error_messages["incorrect_number_of_valid_options"])
-
-        if number_of_distinct_options != number_of_valid_options:
-            raise ValidationError(self.options_error_messages["options_have_duplicates"])
-
-        if self.__single_choice and number_of_correct_options != 1:
-            raise ValidationError(self.options_error_messages["incorrect_number_of_single_choice_options"])
+        error = find_options_error(
+            self.__question_type, number_of_valid_options, number_of_correct_options, number_of_distinct_options
+        )
 
-        if self.__multiple_choice and number_of_correct_options == 0:
-            raise ValidationError(self.options_error_messages["incorrect_number_of_multiple_choice_options"])
+        if error:
+            raise ValidationError(self.options_error_messages[error])
 
     def __options_should_be_specified(self):
-        return self.__question_type in [
-            Question.QuestionType.SINGLE_CHOICE.value,
-            Question.QuestionType.MULTIPLE_CHOICE.value
-        ]
+        return self.__question_type in QUESTION_TYPES_WITH_OPTIONS
 
     @property
     def __question_type(self):
@@ -86,49 +122,134 @@ class AdminOptionInlineFormset(forms.BaseInlineFormSet):
 
         return number_of_valid_options, number_of_correct_options, len(distinct_options)
 
-    @property
-    def __single_choice(self):
-        return self.__question_type == Question.QuestionType.SINGLE_CHOICE
+    def __validate_values_are_unique(self):
+        # the same check Option.validate_unique makes for every form, a value may belong to one option of a question
+        if self.instance.pk is None:
+            return
 
-    @property
-    def __multiple_choice(self):
-        return self.__question_type == Question.QuestionType.MULTIPLE_CHOICE
+        forms_with_values = [form for form in self.forms
+                             if form.cleaned_data.get("value") and not self._should_delete_form(form)]
+
+        if not forms_with_values:
+            return
+
+        stored_values = dict(Option.objects.using(self.__db)
+                             .filter(question=self.instance, value__in=[form.cleaned_data["value"]
+                                                                        for form in forms_with_values])
+                             .order_by()
+                             .values_list("value", "id"))
+
+        for form in forms_with_values:
+            pk = stored_values.get(form.cleaned_data["value"])
+
+            if pk is not None and pk != form.instance.pk:
+                form.add_error(None, form.instance.unique_error_message(Option, self.unique_value_check))
 
     def save(self, commit=True):
         if not self.__options_should_be_specified():
             self.__mark_options_to_delete()
 
-        super(AdminOptionInlineFormset, self).save(commit)
+        if not commit:
+            return super(AdminOptionInlineFormset, self).save(commit)
+
+        return self.__save_in_bulk()
 
     def __mark_options_to_delete(self):
         for form in self.forms:
             form.cleaned_data[DELETION_FIELD_NAME] = True
 
+    def __save_in_bulk(self):
+        # Options are diffed with the stored ones and written with one delete, one update and one insert at most
+        # instead of a query per option. Deleted options go first, so their values can be taken by the other ones.
+        # Bulk writes don't send signals, the cached question is invalidated once for all of them.
+        now = timezone.now()
+        self.new_objects, self.changed_objects, self.deleted_objects = [], [], []
+
+        for form in self.initial_forms:
+            option = form.instance
+
+            if option.pk is None:
+                continue
+
+            if self._should_delete_form(form):
+                self.deleted_objects.append(option)
+            elif form.has_changed():
+                option.changed = now
+                self.changed_objects.append((option, form.changed_data))
+
+        for form in self.extra_forms:
+            if form.has_changed() and not self._should_delete_form(form):
+                setattr(form.instance, self.fk.name, self.instance)
+                self.new_objects.append(form.instance)
+
+        options = Option.objects.using(self.__db)
+
+        with transaction.atomic(using=self.__db):
+            if self.deleted_objects:
+                options.filter(question=self.instance, id__in=[option.pk for option in self.deleted_objects]).delete()
+
+            if self.changed_objects:
+                editable_fields = {field.name for field in Option._meta.concrete_fields if field.editable}
+                changed_fields = {field for _option, fields in self.changed_objects for field in fields
+                                  if field in editable_fields}
+                options.bulk_update([option for option, _fields in self.changed_objects],
+                                    sorted(changed_fields) + ["changed"])
+
+            if self.new_objects:
+                options.bulk_create(self.new_objects)
+
+        if self.changed_objects or self.new_objects:
+            invalidate(ProblemsCache.QUESTION, self.instance.pk)
+
+        return self.new_objects + [option for option, _fields in self.changed_objects]
+
+    @property
+    def __db(self):
+        return router.db_for_write(Option, instance=self.instance)
+
 
 class AdminOptionInline(admin.TabularInline):
     model = Option
+    form = AdminOptionForm
     formset = AdminOptionInlineFormset
     extra = 0
 
 
 class AdminQuestionChangeForm(forms.ModelForm):
-    validators = {
-        Question.QuestionType.BOOLEAN.value.lower(): validate_boolean_value
-    }
-    integer_correct_answer = forms.IntegerField(label=_("Correct Answer"), required=False)
-    decimal_correct_answer = forms.DecimalField(label=_("Correct Answer"), required=False)
-    boolean_correct_answer = forms.ChoiceField(
-        label=_("Correct Answer"),
-        required=False,
-        choices=(("", "---------"), ("Yes", _("Yes")), ("No", _("No")))
-    )
-
-    text_correct_answer = forms.CharField(
-        label=_("Correct Answer"),
-        max_length=255,
-        required=False,
-        widget=forms.Textarea(attrs={"rows": 3, "cols": 40, "class": "vLargeTextField"})
-    )
+    integer_correct_answer = CORRECT_ANSWER_FIELDS[Question.QuestionType.INTEGER.value.lower()]
+    decimal_correct_answer = CORRECT_ANSWER_FIELDS[Question.QuestionType.DECIMAL.value.lower()]
+    boolean_correct_answer = CORRECT_ANSWER_FIELDS[Question.QuestionType.BOOLEAN.value.lower()]
+    text_correct_answer = CORRECT_ANSWER_FIELDS[Question.QuestionType.TEXT.value.lower()]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Only the initial data and the fields of this form are changed. Field instances of base_fields are shared by
+        # the form classes of all requests (and with CORRECT_ANSWER_FIELDS), so changing them would leak the answer of
+        # one question into the form of another one opened at the same time by another thread.
+        self.__initialize_correct_answer_fields()
+        self.__disable_manage_buttons_for_category()
+
+    def __initialize_correct_answer_fields(self):
+        if self.instance.pk is None:
+            return
+
+        obj_type = self.instance.type.lower()
+
+        for question_type in QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER:
+            field_name = f"{question_type}_correct_answer"
+            value = self.instance.correct_answer if obj_type == question_type else None
+
+            self.initial.setdefault(field_name, value)
+
+    def __disable_manage_buttons_for_category(self):
+        if "category" not in self.fields:
+            return
+
+        category_field = self.fields["category"]
+        category_field.widget.can_add_related = False
+        category_field.widget.can_change_related = False
+        category_field.widget.can_delete_related = False
 
     def clean_integer_correct_answer(self):
         return self.__validate_correct_answer(Question.QuestionType.INTEGER.value)
@@ -150,24 +271,10 @@ class AdminQuestionChangeForm(forms.ModelForm):
         correct_answer = self.cleaned_data.get(required_field)
 
         if question_type == required_field_type:
-            if self.__correct_answer_is_empty(correct_answer):
-                raise ValidationError(Field.default_error_messages["required"])
-
-            if question_type in self.validators:
-                if not self.validators[question_type](correct_answer):
-                    raise ValidationError(_('Value of the field is invalid.'))
+            validate_correct_answer(question_type, correct_answer)
 
         return correct_answer
 
-    def __correct_answer_is_empty(self, value):
-        if value in Field.empty_values:
-            return True
-
-        if isinstance(value, str) and value.strip() in Field.empty_values:
-            return True
-
-        return False
-
     def save(self, commit=True):
         model = super().save(commit)
         model.correct_answer = self.__get_correct_answer()
@@ -202,34 +309,114 @@ class AdminQuestionChangeForm(forms.ModelForm):
 
 @admin.register(Question)
 class AdminQuestion(admin.ModelAdmin):
+    # The changelist has to stay fast with millions of questions: categories are joined, the number of rows comes
+    # from planner statistics on Postgres and isn't counted a second time for the "show all" link, the search uses
+    # the full text index and rows are ordered by the (-created, -id) index. Columns aren't sortable, there are no
+    # indexes for that.
     form = AdminQuestionChangeForm
     list_display = ("category", "type", "complexity", "text")
     list_filter = ("category",)
+    autocomplete_fields = ("category",)
+    list_select_related = ("category",)
     list_per_page = 50
-    search_fields = ("category", "type", "complexity")
-    sortable_by = ("-created",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    search_fields = ("text",)
+    max_search_results = 1000
+    # the largest value of the BigAutoField id
+    max_question_id = 2 ** 63 - 1
+    ordering = ("-created", "-id")
+    sortable_by = ()
     inlines = [AdminOptionInline]
+    actions = ["move_to_category", "set_complexity", "set_number_of_points", "delete_in_chunks"]
+    bulk_action_confirmation_template = "admin/problems/question/bulk_action_confirmation.html"
 
-    def get_form(self, request, obj=None, change=False, **kwargs):
-        form = super(AdminQuestion, self).get_form(request, obj, change, **kwargs)
-        self.__initialize_correct_answer_fields(form, obj)
-        self.__disable_manage_buttons_for_category(form)
-        return form
+    def get_actions(self, request):
+        # the default deletion lists every selected question on its confirmation page and deletes all of them in one
+        # transaction, delete_in_chunks replaces it
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
 
-    def __initialize_correct_answer_fields(self, form, obj):
-        if not obj:
-            return
+        return actions
 
-        obj_type = obj.type.lower()
+    @admin.action(description=_("Move selected questions to a category"), permissions=["change"])
+    def move_to_category(self, request, queryset):
+        return self.__bulk_update(request, queryset, "category", _("Move to a category"))
 
-        for question_type in QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER:
-            field_name = f"{question_type}_correct_answer"
-            value = obj.correct_answer if obj_type == question_type else None
+    @admin.action(description=_("Set complexity of selected questions"), permissions=["change"])
+    def set_complexity(self, request, queryset):
+        return self.__bulk_update(request, queryset, "complexity", _("Set complexity"))
 
-            form.base_fields[field_name].initial = value
+    @admin.action(description=_("Set number of points of selected questions"), permissions=["change"])
+    def set_number_of_points(self, request, queryset):
+        return self.__bulk_update(request, queryset, "number_of_points", _("Set number of points"))
+
+    @admin.action(description=_("Delete selected questions"), permissions=["delete"])
+    def delete_in_chunks(self, request, queryset):
+        if "apply" not in request.POST:
+            return self.__confirm_bulk_action(request, queryset, _("Delete questions"))
+
+        deleted = QuestionsBulkEditor().delete(queryset, self.__log_progress("deleted"))
+        message = ngettext("%d question was deleted.", "%d questions were deleted.", deleted) % deleted
+        self.message_user(request, message, messages.SUCCESS)
+
+    def __bulk_update(self, request, queryset, field_name, title):
+        form = QuestionsBulkEditForm(field_name, self.admin_site, request.POST if "apply" in request.POST else None)
+
+        if not form.is_valid():
+            return self.__confirm_bulk_action(request, queryset, title, form)
+
+        updated = QuestionsBulkEditor().update(queryset, {field_name: form.value}, self.__log_progress("updated"))
+        message = ngettext("%d question was updated.", "%d questions were updated.", updated) % updated
+        self.message_user(request, message, messages.SUCCESS)
+
+    def __confirm_bulk_action(self, request, queryset, title, form=None):
+        # Only the ids of the current page are posted with "select across", the action gets the queryset of all
+        # matching questions from the changelist again when the confirmation is posted back
+        context = {
+            **self.admin_site.each_context(request),
+            "title": title,
+            "opts": self.model._meta,
+            "form": form,
+            "media": self.media + form.media if form else self.media,
+            "number_of_questions": queryset.count(),
+            "chunk_size": QuestionsBulkEditor.default_chunk_size,
+            "selected": request.POST.getlist(helpers.ACTION_CHECKBOX_NAME),
+            "select_across": request.POST.get("select_across") == "1",
+            "action": request.POST["action"],
+            "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+        }
+
+        request.current_app = self.admin_site.name
+
+        return TemplateResponse(request, self.bulk_action_confirmation_template, context)
+
+    @staticmethod
+    def __log_progress(verb):
+        def on_progress(done):
+            logger.info("%d questions %s", done, verb)
+
+        return on_progress
+
+    def get_search_results(self, request, queryset, search_term):
+        # the best matches of the full text search (over text, solution and options) or the question with this id
+        search_term = search_term.strip()
+
+        if not search_term:
+            return queryset, False
+
+        ids = QuestionsFullTextSearch(queryset.db).find_ids(search_term, self.max_search_results)
+
+        # isdigit alone lets through digits like "²" that int() rejects, and ids beyond what the column holds
+        if search_term.isascii() and search_term.isdigit() and int(search_term) <= self.max_question_id:
+            ids.append(int(search_term))
+
+        return queryset.filter(id__in=ids), False
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # categories are loaded page by page while typing instead of being rendered into the select
+        if db_field.name == "category":
+            kwargs["widget"] = CategoryAutocompleteSelect(db_field, self.admin_site, using=kwargs.get("using"))
+
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
-    def __disable_manage_buttons_for_category(self, form):
-        category_field = form.base_fields["category"]
-        category_field.widget.can_add_related = False
-        category_field.widget.can_change_related = False
-        category_field.widget.can_delete_related = False
@@ -0,0 +1,24 @@
+from django import forms
+
+from api.apps.problems.models import Question
+from .category_autocomplete_select import CategoryAutocompleteSelect
+
+
+class QuestionsBulkEditForm(forms.Form):
+    # the new value of one field of the selected questions, validated by the form field and the validators of the
+    # model field, the way the change form and the model validation do it
+    def __init__(self, field_name, admin_site, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        model_field = Question._meta.get_field(field_name)
+        field_kwargs = {"validators": model_field.validators}
+
+        if field_name == "category":
+            field_kwargs["widget"] = CategoryAutocompleteSelect(model_field, admin_site)
+
+        self.field_name = field_name
+        self.fields[field_name] = model_field.formfield(**field_kwargs)
+
+    @property
+    def value(self):
+        return self.cleaned_data[self.field_name]
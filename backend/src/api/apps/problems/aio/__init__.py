@@ -0,0 +1,2 @@
+from .database_executor import DatabaseExecutor, database_executor
+from .async_view import AsyncView, AsyncCachedDetailsView
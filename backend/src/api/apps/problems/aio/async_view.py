@@ -0,0 +1,109 @@
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.conditional import conditional_response
+from api.apps.problems.renderers import FastJSONRenderer
+from .database_executor import database_executor
+
+
+class AsyncView:
+    # An async counterpart of a sync (DRF) view for ASGI deployments. Whatever can be answered without blocking is
+    # answered on the event loop by get_async_response(), everything else is delegated to the sync view running in
+    # the bounded pool of the database executor, so the behaviour (permissions, validation, errors) stays the same.
+    sync_view_class = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        sync_view = cls.sync_view_class.as_view(**initkwargs)
+
+        async def view(request, *args, **kwargs):
+            return await cls(sync_view).dispatch(request, *args, **kwargs)
+
+        view.view_class = cls
+        # CSRF is enforced by the authentication of the sync view, the same as for every DRF view
+        view.csrf_exempt = True
+
+        return view
+
+    def __init__(self, sync_view):
+        self.sync_view = sync_view
+
+    async def dispatch(self, request, *args, **kwargs):
+        response = await self.get_async_response(request, *args, **kwargs)
+
+        if response is None:
+            response = await database_executor.run(self.__get_sync_response, request, *args, **kwargs)
+
+        return response
+
+    async def get_async_response(self, request, *args, **kwargs):
+        return None
+
+    def __get_sync_response(self, request, *args, **kwargs):
+        response = self.sync_view(request, *args, **kwargs)
+
+        # responses are rendered lazily, rendering may query the database as well (e.g. the browsable API)
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+
+        return response
+
+
+class AsyncCachedDetailsView(AsyncView):
+    # Serves JSON of objects found in the problems cache without a thread: when the cache is in-process it's read on
+    # the event loop, otherwise only the lookup goes to the executor. Misses, other media types and requests with
+    # parameters (e.g. sparse fieldsets) are delegated to the sync view, which fills the cache.
+    # Authentication needs the database, so hits are only served to whoever the permissions of the sync view let in
+    # without it, i.e. to an anonymous user. Anything else, including permissions that check the object, is left to
+    # the sync view, which authenticates the request.
+    cache_kind = None
+    renderer_class = FastJSONRenderer
+
+    async def get_async_response(self, request, pk=None):
+        if request.method not in ("GET", "HEAD") or request.GET or not self.__accepts_json(request) \
+                or not self.__admits_anonymous(request, pk):
+            return None
+
+        cache_pk = ProblemsCache.canonical_pk(pk)
+
+        if cache_pk is None:
+            return None
+
+        problems_cache = ProblemsCache()
+
+        if problems_cache.is_in_process:
+            entry = problems_cache.get(self.cache_kind, cache_pk)
+        else:
+            entry = await database_executor.run(problems_cache.get, self.cache_kind, cache_pk)
+
+        if entry is None or entry.freshness_state is None:
+            return None
+
+        def get_response():
+            return HttpResponse(self.renderer_class().render(entry.data), content_type="application/json")
+
+        response = conditional_response(request, entry.freshness_state, get_response)
+        response["Allow"] = ", ".join(self.sync_view_class().allowed_methods)
+        patch_vary_headers(response, ("Accept",))
+
+        return response
+
+    def __admits_anonymous(self, request, pk):
+        # the request without authenticators is anonymous, its permissions are checked as the sync view does it
+        view = self.sync_view_class(request=Request(request, authenticators=()), args=(), kwargs={"pk": pk},
+                                    format_kwarg=None)
+
+        for permission in view.get_permissions():
+            if type(permission).has_object_permission is not BasePermission.has_object_permission \
+                    or not permission.has_permission(view.request, view):
+                return False
+
+        return True
+
+    @staticmethod
+    def __accepts_json(request):
+        # browsers ask for HTML, for them the sync view renders the browsable API
+        return "text/html" not in request.META.get("HTTP_ACCEPT", "")
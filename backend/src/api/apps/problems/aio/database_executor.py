@@ -0,0 +1,62 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+class DatabaseExecutor:
+    # Runs the blocking parts of async views (ORM queries, shared cache backends) in a bounded pool of threads, so
+    # the number of database connections opened by a process doesn't grow with the number of concurrent requests.
+    # Every thread keeps its own connection, which is closed or reused between calls according to CONN_MAX_AGE,
+    # the same way it's done between requests of a sync worker.
+    # A pool of 0 threads runs the calls in the thread sync views run in (asgiref's thread sensitive mode).
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    async def run(self, func, *args, **kwargs):
+        if self.__max_workers == 0:
+            # connections of that thread are managed by Django like connections of sync views are
+            return await sync_to_async(func, thread_sensitive=True)(*args, **kwargs)
+
+        # the call sees the context variables of the request (e.g. its database routing), like sync_to_async does
+        call = functools.partial(contextvars.copy_context().run, self.__call, func, *args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(self.__get_executor(), call)
+
+    def shutdown(self):
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+                self.__executor = None
+
+    @property
+    def __max_workers(self):
+        return self.max_workers if self.max_workers is not None else settings.PROBLEMS_ASYNC_DB_THREADS
+
+    def __get_executor(self):
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers,
+                                                     thread_name_prefix="problems-db")
+
+            return self.__executor
+
+    @staticmethod
+    def __call(func, *args, **kwargs):
+        close_old_connections()
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+
+database_executor = DatabaseExecutor()
@@ -0,0 +1,3 @@
+from .answer_key import AnswerKey
+from .answer_index import AnswerIndex, answer_index
+from .sheet_grader import SheetGrader
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+
+from api.apps.problems.answers.answer_key import AnswerKey
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.models import Question, Option
+from api.apps.problems.validation import QUESTION_TYPES_WITH_OPTIONS
+
+
+class AnswerIndex:
+    # Compiled answer keys of this process. A key is stored along with the version token of its question in
+    # ProblemsCache, the token is replaced whenever the question or one of its options is saved or deleted, so a key
+    # is reused only while it's fresh and checking an answer costs a cache lookup instead of database queries.
+    # The generation of questions a key was last verified against is stored too, so keys don't have to be verified one
+    # by one until some question changes.
+    # The least recently used keys are dropped once the index grows over max_size.
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self.__keys = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, pk):
+        # raises Question.DoesNotExist when there's no such question
+        answer_keys = self.get_many([pk])
+
+        if pk not in answer_keys:
+            raise Question.DoesNotExist
+
+        return answer_keys[pk]
+
+    def get_many(self, pks):
+        # returns keys of existing questions by their ids. While the generation of questions stays the same, keys are
+        # served after a single cache call, otherwise versions of the requested questions are read in one more cache
+        # call and all stale or missing keys are compiled with two queries at most
+        problems_cache = ProblemsCache()
+        generation = problems_cache.get_generation(ProblemsCache.QUESTION)
+        answer_keys = {}
+
+        with self.__lock:
+            for pk in pks:
+                entry = self.__keys.get(pk)
+
+                if entry is not None and entry[1] == generation:
+                    self.__keys.move_to_end(pk)
+                    answer_keys[pk] = entry[2]
+
+        if len(answer_keys) == len(pks):
+            return answer_keys
+
+        versions = problems_cache.get_versions(ProblemsCache.QUESTION, {pk for pk in pks if pk not in answer_keys})
+
+        with self.__lock:
+            for pk, version in versions.items():
+                entry = self.__keys.get(pk)
+
+                if entry is not None and entry[0] == version:
+                    entry[1] = generation
+                    answer_keys[pk] = entry[2]
+
+        stale_pks = [pk for pk in versions if pk not in answer_keys]
+
+        if not stale_pks:
+            return answer_keys
+
+        # versions are taken before questions are loaded, so a key compiled from data changed in the meantime is
+        # stored under an already outdated version and is compiled again next time
+        compiled_keys = self.__compile(stale_pks)
+
+        with self.__lock:
+            for pk, answer_key in compiled_keys.items():
+                self.__keys[pk] = [versions[pk], generation, answer_key]
+                self.__keys.move_to_end(pk)
+
+            while len(self.__keys) > self.__max_size:
+                self.__keys.popitem(last=False)
+
+        answer_keys.update(compiled_keys)
+
+        return answer_keys
+
+    def clear(self):
+        with self.__lock:
+            self.__keys.clear()
+
+    @property
+    def __max_size(self):
+        return self.max_size if self.max_size is not None else settings.PROBLEMS_ANSWER_INDEX_MAX_SIZE
+
+    def __compile(self, pks):
+        questions = list(Question.objects.only("id", "type", "number_of_points", "correct_answer").filter(pk__in=pks))
+        choice_question_ids = [question.id for question in questions if question.type in QUESTION_TYPES_WITH_OPTIONS]
+        correct_option_ids = defaultdict(list)
+
+        if choice_question_ids:
+            correct_options = Option.objects.filter(question_id__in=choice_question_ids, is_correct=True)
+
+            for question_id, option_id in correct_options.values_list("question_id", "id"):
+                correct_option_ids[question_id].append(option_id)
+
+        return {
+            question.id: AnswerKey.compile(question, correct_option_ids[question.id])
+            for question in questions
+        }
+
+
+answer_index = AnswerIndex()
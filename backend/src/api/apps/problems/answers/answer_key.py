@@ -0,0 +1,109 @@
+import unicodedata
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from api.apps.problems.models import Question
+from api.apps.problems.validation import QUESTION_TYPES_WITH_OPTIONS
+
+# numbers are compared by subtraction in the default decimal context, which overflows far below what Decimal parses
+# (e.g. "1e999999999"); no answer of a question comes anywhere near this many digits
+MAX_NUMBER_EXPONENT = 1000
+
+
+class AnswerKey:
+    # A question reduced to what is needed to check an answer: the correct answer is parsed once, when the key is
+    # compiled, so checking is a comparison of two plain values. A key of a question with a broken correct answer
+    # (which the admin doesn't allow) has expected set to None and never accepts an answer.
+
+    def __init__(self, question_id, question_type, number_of_points, expected):
+        self.question_id = question_id
+        self.question_type = question_type
+        self.number_of_points = number_of_points
+        self.expected = expected
+
+    @classmethod
+    def compile(cls, question, correct_option_ids=()):
+        if question.type in QUESTION_TYPES_WITH_OPTIONS:
+            expected = frozenset(correct_option_ids) or None
+        else:
+            try:
+                expected = PARSERS[question.type](question.correct_answer)
+            except ValidationError:
+                expected = None
+
+        return cls(question.id, question.type, question.number_of_points, expected)
+
+    def check(self, answer):
+        # raises ValidationError when the answer can't be an answer to the question at all, e.g. a word for a number
+        given = PARSERS[self.question_type](answer)
+
+        if self.expected is None:
+            return False
+
+        if self.question_type == Question.QuestionType.DECIMAL:
+            return abs(given - self.expected) <= settings.PROBLEMS_DECIMAL_ANSWER_TOLERANCE
+
+        return given == self.expected
+
+    def grade(self, answer):
+        return self.number_of_points if self.check(answer) else 0
+
+
+def parse_number(value):
+    if value is None or isinstance(value, bool):
+        raise ValidationError(_("A number is expected."))
+
+    try:
+        number = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValidationError(_("A number is expected."))
+
+    if not number.is_finite() or abs(number.adjusted()) > MAX_NUMBER_EXPONENT:
+        raise ValidationError(_("A number is expected."))
+
+    return number
+
+
+def parse_boolean(value):
+    if isinstance(value, bool):
+        return value
+
+    normalized = value.strip().casefold() if isinstance(value, str) else None
+
+    if normalized not in ("yes", "no"):
+        raise ValidationError(_("Yes or No is expected."))
+
+    return normalized == "yes"
+
+
+def parse_text(value):
+    if value is None or isinstance(value, (bool, list, dict)):
+        raise ValidationError(_("A text is expected."))
+
+    # case, repeated whitespace and compatibility forms of characters (e.g. full-width digits) don't matter
+    return " ".join(unicodedata.normalize("NFKC", str(value)).casefold().split())
+
+
+def parse_option_ids(value):
+    values = value if isinstance(value, list) else [value]
+
+    if any(isinstance(item, (bool, float)) for item in values):
+        raise ValidationError(_("A list of option ids is expected."))
+
+    try:
+        return frozenset(int(item) for item in values)
+    except (TypeError, ValueError):
+        raise ValidationError(_("A list of option ids is expected."))
+
+
+PARSERS = {
+    Question.QuestionType.INTEGER: parse_number,
+    Question.QuestionType.DECIMAL: parse_number,
+    Question.QuestionType.BOOLEAN: parse_boolean,
+    Question.QuestionType.TEXT: parse_text,
+    Question.QuestionType.SINGLE_CHOICE: parse_option_ids,
+    Question.QuestionType.MULTIPLE_CHOICE: parse_option_ids,
+}
@@ -0,0 +1,39 @@
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from api.apps.problems.answers.answer_index import answer_index
+
+
+class SheetGrader:
+    # Grades a whole quiz sheet, a list of {"id": question id, "answer": answer} items. Answer keys of all questions
+    # are taken from the answer index at once, so a sheet costs a cache call plus two queries at most no matter how
+    # many answers it has.
+
+    def __init__(self, index=answer_index):
+        self.index = index
+
+    def grade(self, items):
+        answer_keys = self.index.get_many([item["id"] for item in items])
+        results = []
+        total_points = max_points = 0
+
+        for item in items:
+            answer_key = answer_keys.get(item["id"])
+
+            if answer_key is None:
+                results.append({"id": item["id"], "correct": False, "points": 0,
+                                "errors": [_("Question does not exist.")]})
+                continue
+
+            max_points += answer_key.number_of_points
+
+            try:
+                points = answer_key.grade(item["answer"])
+            except ValidationError as e:
+                results.append({"id": item["id"], "correct": False, "points": 0, "errors": e.messages})
+                continue
+
+            total_points += points
+            results.append({"id": item["id"], "correct": points > 0, "points": points})
+
+        return {"results": results, "total_points": total_points, "max_points": max_points}
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class ProblemsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api.apps.problems'
+
+    def ready(self):
+        from .cache import invalidation  # noqa: F401
+        from .metrics import install_query_stats
+
+        connection_created.connect(install_query_stats, dispatch_uid="problems_install_query_stats")
@@ -0,0 +1,2 @@
+from .benchmark_runner import BenchmarkRunner
+from .problems_benchmarks import ProblemsBenchmarks
@@ -0,0 +1,50 @@
+import time
+
+from api.apps.problems.metrics import query_stats
+
+
+class BenchmarkRunner:
+    # Runs a scenario after a few warmup runs and reports its latency percentiles, throughput and the number of
+    # database queries per run. setup() runs before every timed run and isn't timed (e.g. to clear a cache).
+
+    def __init__(self, repeat=50, warmup=5):
+        self.repeat = repeat
+        self.warmup = warmup
+
+    def measure(self, run, setup=None):
+        for _ in range(self.warmup):
+            self.__run_once(run, setup)
+
+        timings, queries = [], 0
+
+        for _ in range(self.repeat):
+            seconds, run_queries = self.__run_once(run, setup)
+            timings.append(seconds)
+            queries += run_queries
+
+        timings.sort()
+
+        return {
+            "runs": self.repeat,
+            "throughput_per_second": round(self.repeat / sum(timings), 2),
+            "mean_ms": round(sum(timings) / self.repeat * 1000, 4),
+            "p50_ms": round(self.__percentile(timings, 50) * 1000, 4),
+            "p99_ms": round(self.__percentile(timings, 99) * 1000, 4),
+            "queries_per_run": round(queries / self.repeat, 2),
+        }
+
+    @staticmethod
+    def __run_once(run, setup):
+        if setup is not None:
+            setup()
+
+        with query_stats() as stats:
+            started_at = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - started_at
+
+        return seconds, stats.queries
+
+    @staticmethod
+    def __percentile(values, percentile):
+        return values[min(len(values) - 1, len(values) * percentile // 100)]
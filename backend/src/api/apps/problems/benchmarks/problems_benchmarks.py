@@ -0,0 +1,104 @@
+import itertools
+import json
+
+from django.core.cache import caches
+from django.db.models import Min, Max
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Category, Question
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.serializers import CategorySerializer, QuestionSerializer, QuestionWithOptionsSerializer, \
+    QuestionRowsSerializer
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class ProblemsBenchmarks:
+    # Scenarios for the endpoints of the problems API and for its serializers in isolation, run against the questions
+    # that are in the database (see the seed_bank command). Serializers get objects loaded in advance, so only the
+    # serialization is timed. The export isn't included, it streams the whole bank.
+    sample_size = 100
+
+    def __init__(self, client):
+        self.client = client
+        self.questions = self.__sample_questions()
+        self.categories = list(Category.objects.order_by("id")[:self.sample_size])
+
+        if not self.questions:
+            raise ValueError("There are no questions to benchmark, seed the bank first.")
+
+    def scenarios(self):
+        # name: (run, setup)
+        question = self.questions[0]
+        integer_question = next((item for item in self.questions if item.type == Question.QuestionType.INTEGER),
+                                question)
+        category_ids = itertools.cycle([category.id for category in self.categories])
+        question_ids = itertools.cycle([item.id for item in self.questions])
+        ids = ",".join(str(item.id) for item in self.questions)
+        answers = [{"id": item.id, "answer": item.correct_answer or ""} for item in self.questions]
+
+        sample_ids = [item.id for item in self.questions]
+        questions_with_fk = list(Question.objects.all_with_fk().filter(id__in=sample_ids))
+        questions_with_options = list(Question.objects.all_with_fk_and_many().filter(id__in=sample_ids))
+        rows = list(QuestionRowsSerializer().select(Question.objects.filter(id__in=sample_ids)))
+        page = {"next": None, "previous": None, "results": QuestionSerializer(questions_with_fk, many=True).data}
+
+        return {
+            "endpoint: categories-list": (self.__get(ProblemsAppUrls.categories_list_url()), None),
+            "endpoint: category-details": (
+                lambda: self.__check(self.client.get(ProblemsAppUrls.category_details_url(next(category_ids)))), None
+            ),
+            "endpoint: questions-list": (self.__get(ProblemsAppUrls.questions_list_url()), None),
+            "endpoint: questions-list, filtered": (self.__get(
+                f"{ProblemsAppUrls.questions_list_url()}?category={question.category_id}&"
+                f"complexity={Question.Complexity.HARD.value}"
+            ), None),
+            "endpoint: questions-list, sparse fields": (
+                self.__get(f"{ProblemsAppUrls.questions_list_url()}?fields=id,question"), None
+            ),
+            "endpoint: questions-search": (self.__get(f"{ProblemsAppUrls.questions_search_url()}?search=prime"), None),
+            "endpoint: question-details, cached": (self.__get(ProblemsAppUrls.question_details_url(question.id)), None),
+            "endpoint: question-details, not cached": (
+                lambda: self.__check(self.client.get(ProblemsAppUrls.question_details_url(next(question_ids)))),
+                caches[PROBLEMS_CACHE_ALIAS].clear
+            ),
+            "endpoint: questions-batch": (self.__get(f"{ProblemsAppUrls.questions_batch_url()}?ids={ids}"), None),
+            "endpoint: question-check": (self.__post(ProblemsAppUrls.question_check_url(integer_question.id),
+                                                     {"answer": integer_question.correct_answer or ""}), None),
+            "endpoint: questions-grade": (self.__post(ProblemsAppUrls.questions_grade_url(), {"answers": answers}),
+                                          None),
+            "endpoint: quiz": (self.__get(f"{ProblemsAppUrls.quiz_url()}?n=20"), None),
+            "serializer: CategorySerializer": (lambda: CategorySerializer(self.categories, many=True).data, None),
+            "serializer: QuestionSerializer": (lambda: QuestionSerializer(questions_with_fk, many=True).data, None),
+            "serializer: QuestionWithOptionsSerializer": (
+                lambda: QuestionWithOptionsSerializer(questions_with_options, many=True).data, None
+            ),
+            "serializer: QuestionRowsSerializer": (lambda: QuestionRowsSerializer().to_representation(rows), None),
+            "renderer: FastJSONRenderer": (lambda: FastJSONRenderer().render(page), None),
+        }
+
+    def __sample_questions(self):
+        # questions spread over the whole table rather than the first ones only
+        bounds = Question.objects.aggregate(first=Min("id"), last=Max("id"))
+
+        if bounds["first"] is None:
+            return []
+
+        step = max((bounds["last"] - bounds["first"] + 1) // self.sample_size, 1)
+        sample_ids = range(bounds["first"], bounds["last"] + 1, step)
+
+        return list(Question.objects.filter(id__in=list(sample_ids)[:self.sample_size]).order_by("id"))
+
+    def __get(self, url):
+        return lambda: self.__check(self.client.get(url))
+
+    def __post(self, url, data):
+        body = json.dumps(data)
+        return lambda: self.__check(self.client.post(url, body, content_type="application/json"))
+
+    @staticmethod
+    def __check(response):
+        if response.status_code != 200:
+            raise AssertionError(f"{response.request['PATH_INFO']} returned {response.status_code}.")
+
+        # streamed and lazily rendered content is a part of the response time
+        return response.getvalue() if response.streaming else response.content
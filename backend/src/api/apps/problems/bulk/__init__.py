@@ -0,0 +1 @@
+from .questions_bulk_editor import QuestionsBulkEditor
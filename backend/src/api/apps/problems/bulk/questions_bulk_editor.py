@@ -0,0 +1,102 @@
+from django.db import router, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.models import Category, Question, Option
+
+
+class QuestionsBulkEditor:
+    # Mass edits of questions in chunks of ids, every chunk in its own transaction, so rows of problems_questions are
+    # locked for one chunk at a time instead of the whole selection. Chunks are taken by ascending id after the last
+    # one, which stays cheap at any depth and doesn't skip rows when the edit takes them out of the queryset.
+    # Has to be used outside of a transaction, chunks would all be committed together otherwise.
+    default_chunk_size = 1000
+
+    def __init__(self, chunk_size=default_chunk_size):
+        self.chunk_size = chunk_size
+        self.using = router.db_for_write(Question)
+
+    def update(self, queryset, values, on_progress=None):
+        # queryset.update doesn't send signals and skips auto_now, both are made up for here
+        problems_cache = ProblemsCache()
+        updated = 0
+
+        for ids in self.__chunks(queryset):
+            with transaction.atomic(using=self.using):
+                updated += Question.objects.using(self.using).filter(id__in=ids).update(**values,
+                                                                                        changed=timezone.now())
+                problems_cache.invalidate_many(ProblemsCache.QUESTION, ids)
+
+            # once more after the commit, see invalidation.invalidate
+            problems_cache.invalidate_many(ProblemsCache.QUESTION, ids)
+            self.__report(on_progress, updated)
+
+        return updated
+
+    def delete(self, queryset, on_progress=None):
+        # A chunk is deleted with two plain DELETE statements instead of queryset.delete, which would collect every
+        # option and send post_delete with a couple of cache writes for each of them and of the questions. The cache is
+        # invalidated once per chunk instead. Option.question is the only relation to questions, there is nothing else
+        # to cascade to.
+        problems_cache = ProblemsCache()
+        deleted = 0
+
+        for ids in self.__chunks(queryset):
+            with transaction.atomic(using=self.using):
+                # questions go first: their rows stay locked until the commit, so an option can't be added to them
+                # in between, the foreign key of options is only checked at the commit
+                deleted += Question.objects.using(self.using).filter(id__in=ids)._raw_delete(self.using)
+                Option.objects.using(self.using).filter(question_id__in=ids)._raw_delete(self.using)
+                problems_cache.invalidate_many(ProblemsCache.QUESTION, ids)
+
+            # once more after the commit, see invalidation.invalidate
+            problems_cache.invalidate_many(ProblemsCache.QUESTION, ids)
+            # see invalidation.mark_question_deleted and mark_option_deleted, details of the deleted questions are
+            # gone, so only the lists need to know about the deletion
+            problems_cache.mark_deleted(ProblemsCache.QUESTION)
+            problems_cache.mark_deleted(ProblemsCache.OPTION)
+            self.__report(on_progress, deleted)
+
+        return deleted
+
+    def delete_categories(self, queryset, on_progress=None):
+        # Question.category is DO_NOTHING, a category can only be deleted once it has no questions left. Questions are
+        # deleted in chunks first, a category that got a new question in the meantime is kept. Returns the numbers of
+        # deleted categories and questions.
+        deleted_categories = deleted_questions = 0
+
+        for category in queryset.using(self.using).order_by("id"):
+            deleted_questions += self.delete(
+                Question.objects.using(self.using).filter(category=category),
+                None if on_progress is None else lambda deleted: on_progress(deleted_questions + deleted)
+            )
+
+            with transaction.atomic(using=self.using):
+                deleted, _ = Category.objects.using(self.using) \
+                    .filter(id=category.id) \
+                    .exclude(Exists(Question.objects.filter(category=OuterRef("id")))) \
+                    .delete()
+
+            deleted_categories += deleted
+
+        return deleted_categories, deleted_questions
+
+    def __chunks(self, queryset):
+        queryset = queryset.using(self.using).order_by("id").values_list("id", flat=True)
+        last_id = None
+
+        while True:
+            chunk = queryset if last_id is None else queryset.filter(id__gt=last_id)
+            ids = list(chunk[:self.chunk_size])
+
+            if not ids:
+                return
+
+            yield ids
+            last_id = ids[-1]
+
+    @staticmethod
+    def __report(on_progress, done):
+        if on_progress is not None:
+            on_progress(done)
@@ -0,0 +1,2 @@
+from .problems_cache import ProblemsCache
+from .cached_retrieve_mixin import CachedRetrieveMixin
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import DEFAULT_DB_ALIAS
+from django.http import Http404
+from rest_framework.response import Response
+
+from api.apps.problems.validation import is_out_of_id_range
+from .problems_cache import ProblemsCache
+
+
+class CachedRetrieveMixin:
+    cache_kind = None
+
+    def retrieve(self, request, *args, **kwargs):
+        entry = self.get_cached_entry()
+
+        if entry is not None:
+            return Response(self.get_cached_data(entry))
+
+        response = super().retrieve(request, *args, **kwargs)
+
+        if self.__cache_pk is not None and self.should_cache():
+            ProblemsCache().set(self.cache_kind, self.__cache_pk, self.__version, response.data,
+                                self.get_cache_dependencies(response.data),
+                                getattr(self, "freshness_state", None), self.__get_cache_timeout())
+
+        return response
+
+    def get_object(self):
+        # the database would fail on an id the column can't hold instead of finding nothing
+        if is_out_of_id_range(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)):
+            raise Http404
+
+        return super().get_object()
+
+    def get_cached_entry(self):
+        if hasattr(self, "_CachedRetrieveMixin__entry"):
+            return self.__entry
+
+        self.__entry, self.__version, self.__cache_pk = None, None, self.__get_cache_pk()
+
+        if self.__cache_pk is not None:
+            problems_cache = ProblemsCache()
+            self.__entry = problems_cache.get(self.cache_kind, self.__cache_pk)
+
+            # the version is taken before the object is loaded from the database, so an entry built from data
+            # that was changed in the meantime is stored under an already outdated version
+            if self.__entry is None:
+                self.__version = problems_cache.get_version(self.cache_kind, self.__cache_pk)
+
+        return self.__entry
+
+    def get_cached_data(self, entry):
+        return entry.data
+
+    def should_cache(self):
+        return True
+
+    def get_cache_dependencies(self, data):
+        return ()
+
+    def __get_cache_timeout(self):
+        # a replica may still return the row from before the invalidation, such an entry lives no longer than the lag
+        if self.get_queryset().db != DEFAULT_DB_ALIAS:
+            return settings.PROBLEMS_PRIMARY_PIN_SECONDS
+
+        return DEFAULT_TIMEOUT
+
+    def __get_cache_pk(self):
+        return ProblemsCache.canonical_pk(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field))
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from api.apps.problems.models import Category, Question, Option
+from .problems_cache import ProblemsCache
+
+
+def invalidate(kind, pk):
+    problems_cache = ProblemsCache()
+    problems_cache.invalidate(kind, pk)
+
+    # invalidate once more after commit: a concurrent request could have cached the old row between the first
+    # invalidation and the moment the change became visible to other connections
+    transaction.on_commit(lambda: problems_cache.invalidate(kind, pk))
+
+
+@receiver([post_save, post_delete], sender=Category, dispatch_uid="problems_cache_invalidate_category")
+def invalidate_category(sender, instance, **kwargs):
+    invalidate(ProblemsCache.CATEGORY, instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Question, dispatch_uid="problems_cache_invalidate_question")
+def invalidate_question(sender, instance, **kwargs):
+    invalidate(ProblemsCache.QUESTION, instance.pk)
+
+
+# deleted rows don't leave a "changed" date behind, so the time of the last deletion is kept to make sure that
+# Last-Modified of the lists and of the question details never goes back in time
+@receiver(post_delete, sender=Category, dispatch_uid="problems_cache_mark_category_deleted")
+def mark_category_deleted(sender, instance, **kwargs):
+    ProblemsCache().mark_deleted(ProblemsCache.CATEGORY)
+
+
+@receiver(post_delete, sender=Question, dispatch_uid="problems_cache_mark_question_deleted")
+def mark_question_deleted(sender, instance, **kwargs):
+    ProblemsCache().mark_deleted(ProblemsCache.QUESTION)
+
+
+@receiver(post_delete, sender=Option, dispatch_uid="problems_cache_mark_option_deleted")
+def mark_option_deleted(sender, instance, **kwargs):
+    # once for the question and once for all options, which the search results depend on
+    problems_cache = ProblemsCache()
+    problems_cache.mark_deleted(ProblemsCache.OPTION, instance.question_id)
+    problems_cache.mark_deleted(ProblemsCache.OPTION)
+
+
+@receiver([post_save, post_delete], sender=Option, dispatch_uid="problems_cache_invalidate_option")
+def invalidate_option(sender, instance, **kwargs):
+    invalidate(ProblemsCache.QUESTION, instance.question_id)
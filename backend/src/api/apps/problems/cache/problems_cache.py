@@ -0,0 +1,129 @@
+import uuid
+from collections import namedtuple
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+
+PROBLEMS_CACHE_ALIAS = "problems"
+
+CacheEntry = namedtuple("CacheEntry", ["data", "freshness_state"])
+
+
+class ProblemsCache:
+    # Every cached object has a version token stored under its own key. Invalidation replaces the token, so all
+    # entries built for the previous token become unreachable at once. An entry also remembers the tokens of the
+    # objects it embeds (e.g. the category of a question), so renaming a category invalidates all its questions
+    # without touching them one by one.
+    QUESTION = "question"
+    CATEGORY = "category"
+    OPTION = "option"
+
+    def __init__(self, alias=PROBLEMS_CACHE_ALIAS):
+        self.cache = caches[alias]
+
+    @property
+    def is_in_process(self):
+        # reading an in-process cache doesn't block, so async views may do it without leaving the event loop
+        return isinstance(self.cache, LocMemCache)
+
+    @staticmethod
+    def canonical_pk(pk):
+        # only canonical ids are cached: "01" would otherwise be cached apart from "1" and never invalidated
+        try:
+            return int(pk) if str(int(pk)) == str(pk) else None
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, kind, pk):
+        entry_key, version_key = self.__entry_key(kind, pk), self.__version_key(kind, pk)
+        values = self.cache.get_many([entry_key, version_key])
+
+        if entry_key not in values or version_key not in values:
+            return None
+
+        version, data, dependencies, freshness_state = values[entry_key]
+
+        if version != values[version_key] or not self.__dependencies_are_fresh(dependencies):
+            return None
+
+        return CacheEntry(data, freshness_state)
+
+    def get_version(self, kind, pk):
+        return self.__get_or_add_token(self.__version_key(kind, pk))
+
+    def get_generation(self, kind):
+        # the generation is replaced by every invalidation of an object of the kind, after the version of the object,
+        # so whoever sees the same generation twice knows that none of the versions of the kind changed in between
+        return self.__get_or_add_token(self.__generation_key(kind))
+
+    def get_versions(self, kind, pks):
+        version_keys = {self.__version_key(kind, pk): pk for pk in pks}
+        versions = self.cache.get_many(list(version_keys))
+        missing_keys = [version_key for version_key in version_keys if version_key not in versions]
+
+        if missing_keys:
+            for version_key in missing_keys:
+                self.cache.add(version_key, self.__new_version(), timeout=None)
+
+            versions.update(self.cache.get_many(missing_keys))
+
+        return {version_keys[version_key]: version for version_key, version in versions.items()}
+
+    def set(self, kind, pk, version, data, dependencies=(), freshness_state=None, timeout=DEFAULT_TIMEOUT):
+        dependencies = {
+            self.__version_key(dependency_kind, dependency_pk): self.get_version(dependency_kind, dependency_pk)
+            for dependency_kind, dependency_pk in dependencies
+        }
+
+        self.cache.set(self.__entry_key(kind, pk), (version, data, dependencies, freshness_state), timeout)
+
+    def invalidate(self, kind, pk):
+        self.cache.set(self.__version_key(kind, pk), self.__new_version(), timeout=None)
+        self.cache.set(self.__generation_key(kind), self.__new_version(), timeout=None)
+
+    def invalidate_many(self, kind, pks):
+        self.cache.set_many({self.__version_key(kind, pk): self.__new_version() for pk in pks}, timeout=None)
+        self.cache.set(self.__generation_key(kind), self.__new_version(), timeout=None)
+
+    def mark_deleted(self, kind, pk=None):
+        self.cache.set(self.__deleted_at_key(kind, pk), timezone.now(), timeout=None)
+
+    def get_deleted_at(self, kind, pk=None):
+        return self.cache.get(self.__deleted_at_key(kind, pk))
+
+    def __get_or_add_token(self, key):
+        token = self.cache.get(key)
+
+        if token is None:
+            self.cache.add(key, self.__new_version(), timeout=None)
+            token = self.cache.get(key)
+
+        return token
+
+    def __dependencies_are_fresh(self, dependencies):
+        if not dependencies:
+            return True
+
+        return self.cache.get_many(list(dependencies.keys())) == dependencies
+
+    @staticmethod
+    def __entry_key(kind, pk):
+        return f"problems:{kind}:{pk}"
+
+    @staticmethod
+    def __version_key(kind, pk):
+        return f"problems:{kind}:{pk}:version"
+
+    @staticmethod
+    def __generation_key(kind):
+        return f"problems:{kind}:generation"
+
+    @staticmethod
+    def __deleted_at_key(kind, pk):
+        return f"problems:{kind}:deleted_at" if pk is None else f"problems:{kind}:{pk}:deleted_at"
+
+    @staticmethod
+    def __new_version():
+        return uuid.uuid4().hex
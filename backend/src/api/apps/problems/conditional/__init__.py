@@ -0,0 +1,9 @@
+from .conditional_response import make_etag, conditional_response
+from .conditional_get_mixin import ConditionalGetMixin
+from .freshness import (
+    categories_freshness,
+    category_freshness,
+    questions_freshness,
+    question_freshness,
+    questions_search_freshness,
+)
@@ -0,0 +1,23 @@
+from .conditional_response import conditional_response
+
+
+class ConditionalGetMixin:
+    # Answers If-None-Match/If-Modified-Since before the view touches the serializer. Views return the state the
+    # payload depends on from get_freshness_state() as (parts of the ETag, last modification date) or None when the
+    # state can't be determined (e.g. the object doesn't exist), in which case the view is processed as usual.
+    # The state is kept in freshness_state, so it can be cached together with the payload.
+    freshness_state = None
+
+    def get(self, request, *args, **kwargs):
+        state = self.freshness_state = self.get_freshness_state()
+
+        if state is None:
+            return super().get(request, *args, **kwargs)
+
+        def get_response():
+            return super(ConditionalGetMixin, self).get(request, *args, **kwargs)
+
+        return conditional_response(request, state, get_response)
+
+    def get_freshness_state(self):
+        raise NotImplementedError("get_freshness_state() must be implemented.")
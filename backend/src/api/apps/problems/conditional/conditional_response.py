@@ -0,0 +1,31 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(request, etag_parts):
+    # the same state is rendered differently for other query parameters or media types
+    representation = (request.get_full_path(), request.META.get("HTTP_ACCEPT", "")) + tuple(etag_parts)
+    return f'"{hashlib.sha1(repr(representation).encode()).hexdigest()}"'
+
+
+def conditional_response(request, state, get_response):
+    # answers If-None-Match/If-Modified-Since for the state (parts of the ETag, last modification date), the response
+    # is built by get_response() only when the client doesn't have the current representation
+    etag_parts, last_modified = state
+    etag = make_etag(request, etag_parts)
+    last_modified = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    if response is None:
+        response = get_response()
+
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+
+    return response
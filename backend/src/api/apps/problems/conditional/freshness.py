@@ -0,0 +1,82 @@
+from django.db.models import Count, Max
+
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.models import Category, Question, Option
+from api.apps.problems.validation import is_out_of_id_range
+
+
+# The lists only read the latest "changed" of every table, which is an index seek, deletions are told by the time
+# ProblemsCache.mark_deleted keeps. Counting rows to notice them would scan the whole table on every request.
+
+
+def categories_freshness():
+    state = Category.objects.aggregate(changed=Max("changed"))
+    deleted_at = ProblemsCache().get_deleted_at(ProblemsCache.CATEGORY)
+
+    return (state["changed"], deleted_at), _latest(state["changed"], deleted_at)
+
+
+def questions_freshness():
+    # question list items embed their categories, so renaming a category changes the list as well
+    (categories_parts, categories_last_modified) = categories_freshness()
+
+    state = Question.objects.aggregate(changed=Max("changed"))
+    deleted_at = ProblemsCache().get_deleted_at(ProblemsCache.QUESTION)
+
+    return (
+        (state["changed"], deleted_at) + categories_parts,
+        _latest(state["changed"], deleted_at, categories_last_modified)
+    )
+
+
+def questions_search_freshness():
+    # the search matches values of options as well, so they change its results without changing any question
+    (questions_parts, questions_last_modified) = questions_freshness()
+
+    state = Option.objects.aggregate(changed=Max("changed"))
+    deleted_at = ProblemsCache().get_deleted_at(ProblemsCache.OPTION)
+
+    return (
+        (state["changed"], deleted_at) + questions_parts,
+        _latest(state["changed"], deleted_at, questions_last_modified)
+    )
+
+
+def category_freshness(pk):
+    if is_out_of_id_range(pk):
+        return None
+
+    try:
+        changed = Category.objects.filter(pk=pk).values_list("changed", flat=True).first()
+    except (TypeError, ValueError):
+        return None
+
+    return None if changed is None else ((pk, changed), changed)
+
+
+def question_freshness(pk):
+    if is_out_of_id_range(pk):
+        return None
+
+    try:
+        state = Question.objects.filter(pk=pk).values("changed", "category__changed").annotate(
+            options_changed=Max("options__changed"),
+            options_count=Count("options")
+        ).first()
+    except (TypeError, ValueError):
+        return None
+
+    if state is None:
+        return None
+
+    options_deleted_at = ProblemsCache().get_deleted_at(ProblemsCache.OPTION, pk)
+
+    return (
+        (pk, state["changed"], state["category__changed"], state["options_changed"], state["options_count"],
+         options_deleted_at),
+        _latest(state["changed"], state["category__changed"], state["options_changed"], options_deleted_at)
+    )
+
+
+def _latest(*dates):
+    return max([date for date in dates if date is not None], default=None)
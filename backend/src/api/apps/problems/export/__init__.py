@@ -0,0 +1 @@
+from .questions_ndjson_export import QuestionsNDJSONExport
@@ -0,0 +1,36 @@
+from itertools import islice
+
+from django.db.models import prefetch_related_objects
+
+from api.apps.problems.models import Question
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.serializers import QuestionExportSerializer
+
+
+class QuestionsNDJSONExport:
+    # Yields every question as a line of JSON in the format of the question details plus the correct answer, the
+    # solution and the correct options. Questions are read with
+    # iterator(), which uses a server-side cursor on Postgres and fetches rows in chunks elsewhere, and options are
+    # prefetched once per chunk, so the memory used doesn't depend on the size of the bank.
+    # prefetch_related() is ignored by iterator() (Django 3.2), that's why options are prefetched manually.
+    content_type = "application/x-ndjson"
+    default_chunk_size = 2000
+
+    def __init__(self, queryset=None, chunk_size=default_chunk_size):
+        self.queryset = Question.objects.all_with_fk() if queryset is None else queryset
+        self.chunk_size = chunk_size
+        self.renderer = FastJSONRenderer()
+
+    def __iter__(self):
+        questions = self.queryset.order_by("id").iterator(chunk_size=self.chunk_size)
+
+        while True:
+            chunk = list(islice(questions, self.chunk_size))
+
+            if not chunk:
+                return
+
+            prefetch_related_objects(chunk, "options")
+
+            for item in QuestionExportSerializer(chunk, many=True).data:
+                yield self.renderer.render(item) + b"\n"
@@ -0,0 +1,2 @@
+from .serializer_columns import SerializerColumns
+from .sparse_fieldsets_mixin import SparseFieldsetsMixin
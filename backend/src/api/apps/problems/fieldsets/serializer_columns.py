@@ -0,0 +1,75 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+class SerializerColumns:
+    # Translates (some) fields of a model serializer to what a queryset has to load for them: the columns for only(),
+    # the relations to join and the relations to prefetch, themselves pruned the same way. Columns the serializer
+    # doesn't render (e.g. solution or correct_answer of a question) are never read then.
+    # Like QuestionRowsSerializer, the description is built once per serializer class and set of fields.
+    descriptions = {}
+
+    def __init__(self, serializer_class, fields=None):
+        key = (serializer_class, tuple(fields) if fields is not None else None)
+
+        if key not in self.descriptions:
+            serializer = serializer_class()
+            self.descriptions[key] = self.__describe(serializer, serializer.Meta.model, fields)
+
+        self.columns, self.select_related, self.prefetch_related = self.descriptions[key]
+
+    def prune(self, queryset):
+        queryset = queryset.only(*self.columns).select_related(None).prefetch_related(None)
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        return queryset.prefetch_related(*self.prefetch_related)
+
+    def __describe(self, serializer, model, fields=None, prefix=""):
+        columns, select_related, prefetch_related = [f"{prefix}{model._meta.pk.name}"], [], []
+
+        for name, field in serializer.fields.items():
+            if fields is not None and name not in fields:
+                continue
+
+            if field.source == "*" or "." in field.source:
+                raise ImproperlyConfigured(f"Columns of field '{name}' can't be determined.")
+
+            column = f"{prefix}{field.source}"
+
+            if isinstance(field, serializers.ListSerializer):
+                prefetch_related.append(self.__describe_prefetch(field, model, column))
+            elif isinstance(field, serializers.BaseSerializer):
+                related_model = model._meta.get_field(field.source).related_model
+                nested_columns, nested_select_related, nested_prefetch_related = self.__describe(
+                    field, related_model, prefix=f"{column}__"
+                )
+
+                if nested_prefetch_related:
+                    raise ImproperlyConfigured(f"Field '{name}' can't be prefetched through a join.")
+
+                columns.append(column)
+                columns.extend(nested_columns)
+                select_related.append(column)
+                select_related.extend(nested_select_related)
+            elif isinstance(field, serializers.ManyRelatedField):
+                raise ImproperlyConfigured(f"Columns of field '{name}' can't be determined.")
+            else:
+                columns.append(column)
+
+        return list(dict.fromkeys(columns)), select_related, prefetch_related
+
+    def __describe_prefetch(self, field, model, lookup):
+        # the prefetched objects are pruned too, but keep the foreign key they are matched to their owners by
+        related_model = model._meta.get_field(field.source).related_model
+        nested_columns, nested_select_related, nested_prefetch_related = self.__describe(field.child, related_model)
+        remote_field = model._meta.get_field(field.source).remote_field.name
+
+        queryset = related_model._default_manager.only(*nested_columns, remote_field)
+
+        if nested_select_related:
+            queryset = queryset.select_related(*nested_select_related)
+
+        return Prefetch(lookup, queryset=queryset.prefetch_related(*nested_prefetch_related))
@@ -0,0 +1,60 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+from .serializer_columns import SerializerColumns
+
+
+class SparseFieldsetsMixin:
+    # Lets clients ask for some fields only: ?fields=id,type,complexity. The serializer renders the requested fields
+    # and the queryset loads the columns they need, nothing else, even without the parameter.
+    fields_query_param = "fields"
+    fields_separator = ","
+
+    # names of fields of every serializer class, building the fields of a serializer per request is expensive
+    available_fields = {}
+
+    def get_queryset(self):
+        return SerializerColumns(self.get_serializer_class(), self.get_requested_fields()).prune(super().get_queryset())
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_requested_fields(self):
+        if hasattr(self, "_SparseFieldsetsMixin__requested_fields"):
+            return self.__requested_fields
+
+        self.__requested_fields = None
+
+        if self.fields_query_param in self.request.query_params:
+            self.__requested_fields = self.__parse_fields(self.request.query_params[self.fields_query_param])
+
+        return self.__requested_fields
+
+    def select_requested_fields(self, data):
+        fields = self.get_requested_fields()
+        return data if fields is None else {name: value for name, value in data.items() if name in fields}
+
+    def __parse_fields(self, value):
+        requested = [name.strip() for name in value.split(self.fields_separator) if name.strip()]
+        available = self.__get_available_fields()
+        unknown = [name for name in requested if name not in available]
+
+        if not requested:
+            raise ValidationError({self.fields_query_param: [_("Enter at least one field.")]})
+
+        if unknown:
+            raise ValidationError({self.fields_query_param: [
+                _("Unknown fields: %(fields)s.") % {"fields": ", ".join(unknown)}
+            ]})
+
+        # in the order of the serializer, so the same fields always make the same queryset
+        return tuple(name for name in available if name in requested)
+
+    def __get_available_fields(self):
+        serializer_class = self.get_serializer_class()
+
+        if serializer_class not in self.available_fields:
+            self.available_fields[serializer_class] = tuple(serializer_class().fields)
+
+        return self.available_fields[serializer_class]
@@ -0,0 +1 @@
+from .questions_filter_backend import QuestionsFilterBackend
@@ -0,0 +1,102 @@
+from datetime import datetime, time
+
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_naive, make_aware
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from api.apps.problems.models import Question
+from api.apps.problems.validation import ID_RANGE
+
+
+class QuestionsFilterBackend(BaseFilterBackend):
+    values_separator = ","
+    error_messages = {
+        "invalid_integer": _("Enter a whole number."),
+        "invalid_choice": _("Select a valid choice. %(value)s is not one of the available choices."),
+        "invalid_datetime": _("Enter a valid date/time."),
+        "invalid_range": _("Number of points should be between 1 and 10."),
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        filters, errors = {}, {}
+
+        for param, (lookup, parser) in self.__get_param_parsers().items():
+            if param not in params:
+                continue
+
+            try:
+                filters[lookup] = parser(params[param])
+            except ValidationError as e:
+                errors[param] = e.detail
+
+        if errors:
+            raise ValidationError(errors)
+
+        return queryset.filter(**filters)
+
+    def __get_param_parsers(self):
+        return {
+            "category": ("category_id__in", self.__parse_ids),
+            "type": ("type__in", self.__choices_parser(Question.QuestionType.values)),
+            "complexity": ("complexity__in", self.__choices_parser(Question.Complexity.values)),
+            "number_of_points_min": ("number_of_points__gte", self.__parse_number_of_points),
+            "number_of_points_max": ("number_of_points__lte", self.__parse_number_of_points),
+            "created_after": ("created__gte", self.__parse_datetime),
+            "created_before": ("created__lt", self.__parse_datetime),
+            "changed_after": ("changed__gte", self.__parse_datetime),
+            "changed_before": ("changed__lt", self.__parse_datetime),
+        }
+
+    def __split(self, value):
+        return [item.strip() for item in value.split(self.values_separator) if item.strip()]
+
+    def __parse_ids(self, value):
+        try:
+            ids = [int(item) for item in self.__split(value)]
+        except ValueError:
+            raise ValidationError(self.error_messages["invalid_integer"])
+
+        if any(pk not in ID_RANGE for pk in ids):
+            raise ValidationError(self.error_messages["invalid_integer"])
+
+        return ids
+
+    def __choices_parser(self, choices):
+        def parser(value):
+            values = self.__split(value)
+
+            for item in values:
+                if item not in choices:
+                    raise ValidationError(self.error_messages["invalid_choice"] % {"value": item})
+
+            return values
+
+        return parser
+
+    def __parse_number_of_points(self, value):
+        try:
+            number_of_points = int(value)
+        except ValueError:
+            raise ValidationError(self.error_messages["invalid_integer"])
+
+        if not 1 <= number_of_points <= 10:
+            raise ValidationError(self.error_messages["invalid_range"])
+
+        return number_of_points
+
+    def __parse_datetime(self, value):
+        try:
+            parsed = parse_datetime(value) or parse_date(value)
+        except ValueError:
+            parsed = None
+
+        if parsed is None:
+            raise ValidationError(self.error_messages["invalid_datetime"])
+
+        if not isinstance(parsed, datetime):
+            parsed = datetime.combine(parsed, time.min)
+
+        return make_aware(parsed) if is_naive(parsed) else parsed
@@ -0,0 +1,3 @@
+from .question_rows_readers import read_csv_rows, read_jsonl_rows, get_rows_reader
+from .question_row_validator import QuestionRowValidator
+from .questions_importer import QuestionsImporter, QuestionsImportReport
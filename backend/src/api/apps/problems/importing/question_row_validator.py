@@ -0,0 +1,150 @@
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxLengthValidator
+from django.forms import Field
+from django.utils.translation import gettext_lazy as _
+
+from api.apps.problems.models import Category, Question, Option
+from api.apps.problems.validation import (
+    QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER,
+    QUESTION_TYPES_WITH_OPTIONS,
+    CORRECT_ANSWER_FIELDS,
+    OPTIONS_ERROR_MESSAGES,
+    validate_correct_answer,
+    find_options_error,
+)
+
+QUESTION_FIELDS = ["text", "type", "complexity", "number_of_points", "max_attempts_to_solve", "solution"]
+TEXT_FIELDS = ["text", "solution"]
+
+
+class QuestionRowValidator:
+    # Builds unsaved Question and Option instances from a raw row applying the same rules the admin applies to a
+    # question and its options. Categories are looked up by name (or id) in a map loaded once, so validation doesn't
+    # hit the database per row. Missing categories are kept unsaved, the importer creates them with the first chunk
+    # that is written, so rows that end up rejected don't leave categories behind.
+
+    def __init__(self, create_categories=False):
+        self.create_categories = create_categories
+        self.categories = {}
+
+        for category in Category.objects.all():
+            self.categories[category.name] = category
+            self.categories[str(category.pk)] = category
+
+    def validate(self, row):
+        errors = {}
+        question = Question(**{field: self.__strip(row.get(field)) for field in QUESTION_FIELDS})
+
+        try:
+            question.clean_fields(exclude=["category", "correct_answer"])
+        except ValidationError as e:
+            errors.update(e.message_dict)
+
+        self.__validate_text_lengths(question, errors)
+
+        category = self.__get_category(row.get("category"), errors)
+        question_type = question.type if "type" not in errors else None
+        options = []
+
+        if question_type in QUESTION_TYPES_WITH_OPTIONS:
+            options = self.__validate_options(question_type, row.get("options"), errors)
+        elif question_type:
+            question.correct_answer = self.__validate_correct_answer(question_type, row.get("correct_answer"), errors)
+
+        if errors:
+            raise ValidationError(errors)
+
+        question.category = category
+
+        return question, options
+
+    def __validate_text_lengths(self, question, errors):
+        # the model doesn't check max_length of text fields, the admin form fields do
+        for field_name in TEXT_FIELDS:
+            max_length = Question._meta.get_field(field_name).max_length
+            value = getattr(question, field_name)
+
+            if max_length is None or field_name in errors or not isinstance(value, str):
+                continue
+
+            try:
+                MaxLengthValidator(max_length)(value)
+            except ValidationError as e:
+                errors[field_name] = e.messages
+
+    def __get_category(self, name, errors):
+        name = self.__strip(name)
+
+        if name in (None, ""):
+            errors["category"] = [Field.default_error_messages["required"]]
+            return None
+
+        name = str(name)
+
+        if name not in self.categories:
+            if not self.create_categories or name.isdigit():
+                errors["category"] = [_("Category '%(name)s' does not exist.") % {"name": name}]
+                return None
+
+            self.categories[name] = Category(name=name)
+
+        return self.categories[name]
+
+    def __validate_correct_answer(self, question_type, value, errors):
+        question_type = question_type.lower()
+
+        try:
+            correct_answer = CORRECT_ANSWER_FIELDS[question_type].clean(value)
+            validate_correct_answer(question_type, correct_answer)
+        except ValidationError as e:
+            errors["correct_answer"] = e.messages
+            return None
+
+        if question_type in QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER:
+            return str(correct_answer)
+
+    def __validate_options(self, question_type, raw_options, errors):
+        if raw_options is None:
+            raw_options = []
+
+        if not isinstance(raw_options, list):
+            errors["options"] = [_("Options should be a list.")]
+            return []
+
+        options = []
+        number_of_correct_options = 0
+        distinct_options = set()
+
+        for index, raw_option in enumerate(raw_options):
+            if not isinstance(raw_option, dict):
+                errors[f"options[{index}]"] = [_("An option should be an object with value and is_correct.")]
+                continue
+
+            option = Option(value=self.__strip(raw_option.get("value")), is_correct=raw_option.get("is_correct", False))
+
+            try:
+                option.clean_fields(exclude=["question"])
+            except ValidationError as e:
+                for field, messages in e.message_dict.items():
+                    errors[f"options[{index}].{field}"] = messages
+                continue
+
+            if option.is_correct:
+                number_of_correct_options += 1
+
+            distinct_options.add(option.value)
+            options.append(option)
+
+        if len(options) != len(raw_options):
+            return options
+
+        error = find_options_error(question_type, len(options), number_of_correct_options, len(distinct_options))
+
+        if error:
+            errors["options"] = [OPTIONS_ERROR_MESSAGES[error]]
+
+        return options
+
+    def __strip(self, value):
+        # the same as the admin form fields do
+        return value.strip() if isinstance(value, str) else value
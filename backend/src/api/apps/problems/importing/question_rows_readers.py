@@ -0,0 +1,71 @@
+import csv
+import json
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+# Readers turn a text stream into (row_number, row) pairs, where row is a dict of raw values or a ValidationError
+# when the record itself can't be parsed. Rows are yielded one by one so a file of any size can be imported.
+
+
+def read_csv_rows(stream):
+    reader = csv.DictReader(stream)
+    reader.fieldnames  # reads the header, so line_num points at the end of it
+
+    while True:
+        # a record could span several lines, it's reported by the line it starts at
+        row_number = reader.line_num + 1
+        record = next(reader, None)
+
+        if record is None:
+            return
+
+        if None in record:
+            yield row_number, ValidationError(_("The row has more values than the header."))
+            continue
+
+        row = {key.strip(): _empty_to_none(value) for key, value in record.items() if key}
+
+        if row.get("options") is not None:
+            try:
+                row["options"] = json.loads(row["options"])
+            except ValueError:
+                yield row_number, ValidationError({"options": [_("Options should be a JSON array.")]})
+                continue
+
+        yield row_number, row
+
+
+def read_jsonl_rows(stream):
+    for row_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield row_number, ValidationError(_("The row is not a valid JSON."))
+            continue
+
+        if not isinstance(row, dict):
+            yield row_number, ValidationError(_("The row should be a JSON object."))
+            continue
+
+        yield row_number, row
+
+
+ROWS_READERS = {
+    "csv": read_csv_rows,
+    "jsonl": read_jsonl_rows,
+    "ndjson": read_jsonl_rows,
+}
+
+
+def get_rows_reader(file_name):
+    extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+
+    return ROWS_READERS.get(extension)
+
+
+def _empty_to_none(value):
+    return None if value is None or value.strip() == "" else value
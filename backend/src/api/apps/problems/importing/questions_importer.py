@@ -0,0 +1,133 @@
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connections, router, transaction
+
+from api.apps.problems.importing.question_row_validator import QuestionRowValidator
+from api.apps.problems.models import Category, Question, Option
+
+
+class QuestionsImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.errors = []
+
+    def add_error(self, row_number, error):
+        messages = error.message_dict if hasattr(error, "error_dict") else {"non_field_errors": error.messages}
+        self.errors.append({"row": row_number, "errors": messages})
+
+    def as_dict(self):
+        return {"imported": self.imported, "failed": len(self.errors), "errors": self.errors}
+
+
+class QuestionsImporter:
+    # Imports rows produced by one of the readers. Valid rows are written in chunks, every chunk in its own transaction
+    # with one bulk insert for questions and one for options, invalid rows end up in the report, so one bad row
+    # doesn't prevent the rest of the file from being imported.
+    # Databases that can't return ids from a bulk insert (SQLite in Django 3.2) get choice questions inserted one by one,
+    # their ids are needed to link options, the rest of questions are still inserted in bulk.
+    default_chunk_size = 1000
+
+    def __init__(self, chunk_size=default_chunk_size, create_categories=False):
+        self.chunk_size = chunk_size
+        self.create_categories = create_categories
+        self.using = router.db_for_write(Question)
+
+    def run(self, rows):
+        report = QuestionsImportReport()
+        validator = QuestionRowValidator(create_categories=self.create_categories)
+        rows = iter(rows)
+
+        while True:
+            chunk = []
+            number_of_rows = 0
+
+            for row_number, row in islice(rows, self.chunk_size):
+                number_of_rows += 1
+
+                try:
+                    if isinstance(row, ValidationError):
+                        raise row
+
+                    chunk.append((row_number, *validator.validate(row)))
+                except ValidationError as e:
+                    report.add_error(row_number, e)
+
+            if not number_of_rows:
+                break
+
+            self.__write_chunk(chunk, report)
+
+        report.errors.sort(key=lambda item: item["row"])
+
+        return report
+
+    def __write_chunk(self, chunk, report):
+        if not chunk:
+            return
+
+        try:
+            self.__insert_atomically(chunk)
+            report.imported += len(chunk)
+        except DatabaseError:
+            # something the validation couldn't catch, find the culprits row by row
+            for item in chunk:
+                self.__reset(item)
+
+                try:
+                    self.__insert_atomically([item])
+                    report.imported += 1
+                except DatabaseError as e:
+                    report.add_error(item[0], ValidationError(str(e)))
+
+    def __insert_atomically(self, chunk):
+        created_categories = []
+
+        try:
+            with transaction.atomic(using=self.using):
+                self.__insert(chunk, created_categories)
+        except DatabaseError:
+            # categories created by the rolled back transaction should be created again by the next attempt
+            for category in created_categories:
+                category.pk = None
+                category._state.adding = True
+            raise
+
+    def __insert(self, chunk, created_categories):
+        for _row_number, question, _options in chunk:
+            category = question.category
+
+            if category.pk is None:
+                category.pk = Category.objects.using(self.using).get_or_create(name=category.name)[0].pk
+                category._state.adding = False
+                created_categories.append(category)
+
+            question.category_id = category.pk
+
+        can_return_ids = connections[self.using].features.can_return_rows_from_bulk_insert
+        bulk_questions = [question for _row_number, question, options in chunk if can_return_ids or not options]
+
+        Question.objects.using(self.using).bulk_create(bulk_questions, batch_size=self.chunk_size)
+
+        options_to_create = []
+
+        for _row_number, question, options in chunk:
+            if not options:
+                continue
+
+            if question.pk is None:
+                question.save(using=self.using, force_insert=True)
+
+            for option in options:
+                option.question = question
+                options_to_create.append(option)
+
+        Option.objects.using(self.using).bulk_create(options_to_create, batch_size=self.chunk_size)
+
+    def __reset(self, item):
+        # ids assigned by the rolled back insert are not valid anymore
+        _row_number, question, options = item
+
+        for instance in [question, *options]:
+            instance.pk = None
+            instance._state.adding = True
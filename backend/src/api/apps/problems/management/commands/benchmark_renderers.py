@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from api.apps.problems.models import Question
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.renderers import fast_json_renderer
+
+
+class Command(BaseCommand):
+    help = "Compares JSONRenderer with FastJSONRenderer on a synthetic questions list payload."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, default=50_000, help="Number of questions in the payload.")
+        parser.add_argument("--categories", type=int, default=50, help="Number of distinct categories.")
+        parser.add_argument("--repeat", type=int, default=5, help="How many times every renderer is timed.")
+
+    def handle(self, *args, **options):
+        if fast_json_renderer.orjson is None:
+            self.stdout.write(self.style.WARNING("orjson isn't installed, FastJSONRenderer falls back to JSONRenderer."))
+
+        data = self.__build_payload(options["questions"], options["categories"])
+        expected = JSONRenderer().render(data)
+        baseline = None
+
+        for renderer in [JSONRenderer(), FastJSONRenderer()]:
+            best, rendered = self.__measure(renderer, data, options["repeat"])
+            baseline = baseline or best
+
+            if rendered != expected:
+                raise AssertionError(f"{type(renderer).__name__} rendered different JSON.")
+
+            self.stdout.write(f"{type(renderer).__name__:<20} best of {options['repeat']}: {best * 1000:9.2f} ms "
+                              f"({baseline / best:.2f}x), {len(rendered)} bytes")
+
+    def __measure(self, renderer, data, repeat):
+        timings, rendered = [], None
+
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            rendered = renderer.render(data)
+            timings.append(time.perf_counter() - started_at)
+
+        return min(timings), rendered
+
+    def __build_payload(self, number_of_questions, number_of_categories):
+        # the same shape as a page of QuestionsList, with category dicts shared the way QuestionRowsSerializer does
+        categories = [{"id": i, "name": f"Category #{i}"} for i in range(1, number_of_categories + 1)]
+
+        return {
+            "next": "http://testserver/api/problems/questions/?cursor=cD0yMDIxLTA3LTEyVDE5OjM2OjAwJTdDMTAw",
+            "previous": None,
+            "results": [
+                {
+                    "id": i,
+                    "category": categories[i % number_of_categories],
+                    "type": Question.QuestionType.values[i % len(Question.QuestionType.values)],
+                    "question": f"Question #{i}: what is the value of x if {i}x + 7 = {i * 3 + 7}?",
+                    "complexity": Question.Complexity.values[i % len(Question.Complexity.values)],
+                    "number_of_points": i % 10 + 1,
+                    "max_attempts_to_solve": None if i % 3 else 3,
+                }
+                for i in range(1, number_of_questions + 1)
+            ],
+        }
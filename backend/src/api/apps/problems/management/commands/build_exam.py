@@ -0,0 +1,62 @@
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from api.apps.problems.models import Question
+from api.apps.problems.quiz import ExamBuilder
+
+
+class Command(BaseCommand):
+    help = "Builds an exam worth the given number of points with the given complexity mix and prints its questions " \
+           "and timings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--points", type=int, required=True, help="Total number of points of the exam.")
+        parser.add_argument("--mix", required=True,
+                            help="Percentages of points per complexity, e.g. Easy=30,Medium=50,Hard=20.")
+        parser.add_argument("--category", help="Comma separated ids of categories to take questions from.")
+        parser.add_argument("--seed", type=int, help="Seed of the first run, every next run uses the next seed.")
+        parser.add_argument("--repeat", type=int, default=1, help="How many times the exam is built.")
+
+    def handle(self, *args, **options):
+        mix = self.__parse_mix(options["mix"])
+        queryset = Question.objects.all()
+
+        if options["category"]:
+            queryset = queryset.filter(category_id__in=[int(pk) for pk in options["category"].split(",")])
+
+        timings, exam = [], None
+
+        for run in range(options["repeat"]):
+            seed = options["seed"] + run if options["seed"] is not None else None
+            started_at = time.perf_counter()
+
+            try:
+                exam = ExamBuilder(queryset).build(options["points"], mix, seed)
+            except ValidationError as e:
+                raise CommandError(" ".join(e.messages))
+
+            timings.append((time.perf_counter() - started_at) * 1000)
+
+        questions = Question.objects.in_bulk(exam.question_ids)
+
+        self.stdout.write(f"Seed: {exam.seed}")
+        self.stdout.write(f"Points by complexity: {exam.points_by_complexity}")
+
+        for pk in exam.question_ids:
+            question = questions[pk]
+            self.stdout.write(f"{pk}\t{question.complexity}\t{question.number_of_points}\t{question.text[:60]}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"best {min(timings):.2f} ms, worst {max(timings):.2f} ms over {options['repeat']} runs"
+        ))
+
+    def __parse_mix(self, value):
+        try:
+            return {
+                complexity.strip(): int(percent)
+                for complexity, percent in (item.split("=") for item in value.split(","))
+            }
+        except ValueError:
+            raise CommandError("The mix should look like Easy=30,Medium=50,Hard=20.")
@@ -0,0 +1,80 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.apps.problems.models import Question
+from api.apps.problems.pagination import QuestionsCursorPagination
+from api.apps.problems.seeding import QuestionBankGenerator, QuestionBankSeeder
+
+
+class Command(BaseCommand):
+    help = "Fills problems_questions up to the requested number of rows and prints query plans and timings " \
+           "of the filtered questions list queries. Meant for a benchmark database, it refuses to add rows to a " \
+           "bank that already has questions unless --force is passed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, required=True,
+                            help="Minimal number of questions in the table, e.g. 1000000.")
+        parser.add_argument("--force", action="store_true",
+                            help="Add the missing rows and categories even if there are questions already.")
+        parser.add_argument("--categories", type=int, default=100, help="Number of categories to spread rows over.")
+        parser.add_argument("--batch-size", type=int, default=10_000, help="Number of rows inserted per batch.")
+        parser.add_argument("--repeat", type=int, default=5, help="How many times every query is timed.")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        if not options["force"] and Question.objects.exists():
+            raise CommandError("problems_questions is not empty, pass --force to add generated categories and "
+                               "questions to it.")
+
+        seeder = QuestionBankSeeder(QuestionBankGenerator(options["seed"]), options["batch_size"])
+        categories = seeder.seed_categories(options["categories"])
+        self.__ensure_rows(categories, options["rows"], seeder)
+        self.__analyze()
+
+        category = categories[len(categories) // 2]
+
+        for title, filters in self.__get_scenarios(category).items():
+            queryset = Question.objects.all_with_fk().filter(**filters) \
+                .order_by(*QuestionsCursorPagination.ordering)[:QuestionsCursorPagination.page_size + 1]
+
+            timings = []
+            for _ in range(options["repeat"]):
+                started_at = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started_at) * 1000)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{title}: {filters}"))
+            self.stdout.write(queryset.explain())
+            self.stdout.write(self.style.SUCCESS(
+                f"best {min(timings):.2f} ms, worst {max(timings):.2f} ms over {options['repeat']} runs\n"
+            ))
+
+    def __get_scenarios(self, category):
+        return {
+            "Category": {"category_id__in": [category.id]},
+            "Category, complexity and type": {
+                "category_id__in": [category.id],
+                "complexity__in": [Question.Complexity.HARD.value],
+                "type__in": [Question.QuestionType.MULTIPLE_CHOICE.value],
+            },
+            "Complexity and type": {
+                "complexity__in": [Question.Complexity.HARD.value],
+                "type__in": [Question.QuestionType.MULTIPLE_CHOICE.value],
+            },
+            "Number of points range": {"number_of_points__gte": 9, "number_of_points__lte": 10},
+        }
+
+    def __ensure_rows(self, categories, rows, seeder):
+        missing = rows - Question.objects.count()
+
+        def on_progress(seeded):
+            self.stdout.write(f"{rows - missing + seeded} of {rows} rows are ready")
+
+        if missing > 0:
+            seeder.seed_questions(categories, missing, on_progress)
+
+    def __analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Question._meta.db_table}")
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from api.apps.problems.export import QuestionsNDJSONExport
+
+
+class Command(BaseCommand):
+    help = "Exports the whole question bank as NDJSON, one question with its answers and options per line."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="File to write to, the standard output is used by default.")
+        parser.add_argument("--chunk-size", type=int, default=QuestionsNDJSONExport.default_chunk_size,
+                            help="Number of questions read from the database at once.")
+
+    def handle(self, *args, **options):
+        export = QuestionsNDJSONExport(chunk_size=options["chunk_size"])
+
+        if not options["output"]:
+            for line in export:
+                self.stdout.write(line.decode(), ending="")
+            return
+
+        with open(options["output"], "wb") as output:
+            for line in export:
+                output.write(line)
@@ -0,0 +1,37 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.apps.problems.importing import QuestionsImporter, get_rows_reader
+
+
+class Command(BaseCommand):
+    help = "Imports questions with their options from a CSV or JSONL file validating them the same way the admin does."
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="A .csv, .jsonl or .ndjson file to import.")
+        parser.add_argument("--chunk-size", type=int, default=QuestionsImporter.default_chunk_size,
+                            help="Number of rows written to the database in one transaction.")
+        parser.add_argument("--create-categories", action="store_true",
+                            help="Create categories that don't exist instead of rejecting their rows.")
+        parser.add_argument("--report", help="File to write the JSON report with errors of every rejected row to.")
+
+    def handle(self, *args, **options):
+        reader = get_rows_reader(options["file"])
+
+        if reader is None:
+            raise CommandError("Only .csv, .jsonl and .ndjson files are supported.")
+
+        importer = QuestionsImporter(chunk_size=options["chunk_size"], create_categories=options["create_categories"])
+
+        with open(options["file"], encoding="utf-8", newline="") as stream:
+            report = importer.run(reader(stream))
+
+        if options["report"]:
+            with open(options["report"], "w", encoding="utf-8") as output:
+                json.dump(report.as_dict(), output, ensure_ascii=False, indent=2)
+        else:
+            for error in report.errors:
+                self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}")
+
+        self.stdout.write(f"Imported: {report.imported}, failed: {len(report.errors)}")
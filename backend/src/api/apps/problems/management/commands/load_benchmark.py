@@ -0,0 +1,187 @@
+import asyncio
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from api.apps.problems.aio import database_executor
+from api.apps.problems.models import Question
+from api.apps.problems.urls import ProblemsAppUrls
+
+BENCHMARK_HOST = "benchmark"
+
+ENDPOINTS = {
+    # endpoint: (url of the sync view served by WSGI, url of the async view served by ASGI)
+    "question-details": (ProblemsAppUrls.question_details_url, ProblemsAppUrls.async_question_details_url),
+    "questions-list": (lambda pk: ProblemsAppUrls.questions_list_url(),
+                       lambda pk: ProblemsAppUrls.async_questions_list_url()),
+}
+
+
+class Command(BaseCommand):
+    help = "Compares throughput and latency of the problems API served by WSGI and by ASGI under concurrent load. " \
+           "Both handlers run in-process: WSGI in a pool of worker threads like a threaded server, ASGI on an " \
+           "event loop with the async views."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--connections", type=int, default=1000, help="Number of concurrent connections.")
+        parser.add_argument("--requests", type=int, default=10, help="Requests sent by every connection.")
+        parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="question-details")
+        parser.add_argument("--objects", type=int, default=500, help="Number of distinct questions requested.")
+        parser.add_argument("--wsgi-threads", type=int, default=32, help="Worker threads of the WSGI server.")
+        parser.add_argument("--db-threads", type=int, default=None,
+                            help="Database threads of async views, PROBLEMS_ASYNC_DB_THREADS by default.")
+
+    def handle(self, *args, **options):
+        pks = list(Question.objects.order_by("id").values_list("id", flat=True)[:options["objects"]])
+
+        if not pks:
+            raise CommandError("There are no questions to request.")
+
+        sync_url, async_url = ENDPOINTS[options["endpoint"]]
+        db_threads = options["db_threads"] if options["db_threads"] is not None else \
+            settings.PROBLEMS_ASYNC_DB_THREADS
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, BENCHMARK_HOST],
+                               PROBLEMS_ASYNC_DB_THREADS=db_threads):
+            wsgi = WsgiLoad(WSGIHandler(), options["wsgi_threads"])
+            asgi = AsgiLoad(ASGIHandler())
+
+            # both run against a warm problems cache
+            for pk in pks:
+                wsgi.request(sync_url(pk))
+
+            for name, load, url in [("WSGI", wsgi, sync_url), ("ASGI", asgi, async_url)]:
+                result = asyncio.run(load.run([url(pk) for pk in pks], options["connections"], options["requests"]))
+                self.__report(name, result)
+
+            wsgi.shutdown()
+            database_executor.shutdown()
+
+    def __report(self, name, result):
+        latencies, errors, elapsed = result
+        latencies.sort()
+
+        self.stdout.write(
+            f"{name}: {len(latencies)} requests in {elapsed:.2f} s, {len(latencies) / elapsed:9.1f} req/s, "
+            f"p50 {self.__percentile(latencies, 50) * 1000:8.2f} ms, "
+            f"p99 {self.__percentile(latencies, 99) * 1000:8.2f} ms, {errors} errors"
+        )
+
+    @staticmethod
+    def __percentile(values, percentile):
+        return values[min(len(values) - 1, len(values) * percentile // 100)]
+
+
+class Load:
+    # Every connection sends its requests one after another, the latency of a request includes the time it waits
+    # for the server (e.g. for a free worker thread).
+
+    async def run(self, urls, connections, requests_per_connection):
+        latencies, errors = [], 0
+
+        async def connection(seed):
+            nonlocal errors
+            urls_random = random.Random(seed)
+
+            for _ in range(requests_per_connection):
+                started_at = time.perf_counter()
+                status = await self.send(urls_random.choice(urls))
+                latencies.append(time.perf_counter() - started_at)
+                errors += status != 200
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(connection(seed) for seed in range(connections)))
+
+        return latencies, errors, time.perf_counter() - started_at
+
+    async def send(self, url):
+        raise NotImplementedError("send() must be implemented.")
+
+
+class WsgiLoad(Load):
+    def __init__(self, application, threads):
+        self.application = application
+        self.workers = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="wsgi")
+
+    async def send(self, url):
+        return await asyncio.get_running_loop().run_in_executor(self.workers, self.request, url)
+
+    def request(self, url):
+        path, _, query_string = url.partition("?")
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query_string,
+            "SERVER_NAME": BENCHMARK_HOST,
+            "SERVER_PORT": "80",
+            "HTTP_HOST": BENCHMARK_HOST,
+            "HTTP_ACCEPT": "application/json",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": io.StringIO(),
+        }
+        status = None
+
+        def start_response(response_status, headers, exc_info=None):
+            nonlocal status
+            status = int(response_status.split(" ", 1)[0])
+
+        response = self.application(environ, start_response)
+
+        try:
+            b"".join(response)
+        finally:
+            response.close()
+
+        return status
+
+    def shutdown(self):
+        self.workers.shutdown()
+
+
+class AsgiLoad(Load):
+    def __init__(self, application):
+        self.application = application
+
+    async def send(self, url):
+        path, _, query_string = url.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "query_string": query_string.encode(),
+            "headers": [(b"host", BENCHMARK_HOST.encode()), (b"accept", b"application/json")],
+            "server": (BENCHMARK_HOST, 80),
+            "client": ("127.0.0.1", 0),
+        }
+        request_sent, status = False, None
+
+        async def receive():
+            nonlocal request_sent
+
+            if request_sent:
+                # the client never disconnects
+                await asyncio.Future()
+
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await self.application(scope, receive, send)
+
+        return status
@@ -0,0 +1,99 @@
+import datetime
+import json
+import platform
+import subprocess
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+
+from api.apps.problems.benchmarks import BenchmarkRunner, ProblemsBenchmarks
+from api.apps.problems.models import Question
+
+BENCHMARK_HOST = "benchmark"
+
+
+class Command(BaseCommand):
+    help = "Measures throughput, p50/p99 latency and queries of every problems endpoint and of the serializers " \
+           "alone, and writes the results as JSON to compare them between commits."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="File to write JSON results to, they are printed when it's omitted.")
+        parser.add_argument("--baseline", help="JSON results of an earlier run to compare with.")
+        parser.add_argument("--only", help="Runs scenarios whose names contain this text only.")
+        parser.add_argument("--repeat", type=int, default=50, help="Timed runs of every scenario.")
+        parser.add_argument("--warmup", type=int, default=5, help="Untimed runs of every scenario before timing.")
+
+    def handle(self, *args, **options):
+        runner = BenchmarkRunner(options["repeat"], options["warmup"])
+        results = {}
+
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, BENCHMARK_HOST]):
+            try:
+                benchmarks = ProblemsBenchmarks(Client(SERVER_NAME=BENCHMARK_HOST))
+            except ValueError as e:
+                raise CommandError(str(e))
+
+            for name, (run, setup) in benchmarks.scenarios().items():
+                if options["only"] and options["only"] not in name:
+                    continue
+
+                results[name] = runner.measure(run, setup)
+                self.stderr.write(self.__describe(name, results[name]))
+
+        report = {"environment": self.__get_environment(options), "results": results}
+        content = json.dumps(report, indent=2, sort_keys=True)
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(content + "\n")
+        else:
+            self.stdout.write(content)
+
+        if options["baseline"]:
+            self.__compare(options["baseline"], results)
+
+    def __compare(self, baseline_path, results):
+        with open(baseline_path) as file:
+            baseline = json.load(file)["results"]
+
+        self.stderr.write(self.style.MIGRATE_HEADING(f"Compared with {baseline_path}:"))
+
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+
+            before, after = baseline[name], result
+            change = (after["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100 if before["p50_ms"] else 0
+            style = self.style.ERROR if change > 10 else self.style.SUCCESS if change < -10 else str
+            self.stderr.write(style(
+                f"{name:<45} p50 {before['p50_ms']:9.3f} -> {after['p50_ms']:9.3f} ms ({change:+.1f}%), "
+                f"queries {before['queries_per_run']} -> {after['queries_per_run']}"
+            ))
+
+    @staticmethod
+    def __describe(name, result):
+        return f"{name:<45} {result['throughput_per_second']:9.1f}/s  p50 {result['p50_ms']:9.3f} ms  " \
+               f"p99 {result['p99_ms']:9.3f} ms  {result['queries_per_run']} queries"
+
+    @staticmethod
+    def __get_environment(options):
+        try:
+            commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                    check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "commit": commit,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "questions": Question.objects.count(),
+            "repeat": options["repeat"],
+            "warmup": options["warmup"],
+        }
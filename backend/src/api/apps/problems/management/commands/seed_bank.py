@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.apps.problems.seeding import QuestionBankGenerator, QuestionBankSeeder
+
+
+class Command(BaseCommand):
+    help = "Generates a synthetic question bank of the requested size: categories, questions of every type with " \
+           "valid correct answers and options of choice questions. Existing rows are kept."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, default=100_000, help="Number of questions to add.")
+        parser.add_argument("--categories", type=int, default=180, help="Number of categories to spread them over.")
+        parser.add_argument("--batch-size", type=int, default=QuestionBankSeeder.default_batch_size,
+                            help="Number of questions inserted per transaction.")
+        parser.add_argument("--seed", type=int, default=42, help="The same seed generates the same bank.")
+
+    def handle(self, *args, **options):
+        started_at = time.perf_counter()
+        seeder = QuestionBankSeeder(QuestionBankGenerator(options["seed"]), options["batch_size"])
+        categories = seeder.seed_categories(options["categories"])
+
+        def on_progress(seeded):
+            elapsed = time.perf_counter() - started_at
+            self.stdout.write(f"{seeded} of {options['questions']} questions, {seeded / elapsed:.0f} per second")
+
+        seeder.seed_questions(categories, options["questions"], on_progress)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['questions']} questions in {len(categories)} categories "
+            f"in {time.perf_counter() - started_at:.1f} s"
+        ))
@@ -0,0 +1,5 @@
+from .query_stats import QueryStats, query_stats, current_query_stats, install_query_stats
+from .request_metrics import RequestMetrics, request_metrics
+from .prometheus_text import render_prometheus_text
+from .metrics_middleware import MetricsMiddleware
+from .metrics_view import MetricsView
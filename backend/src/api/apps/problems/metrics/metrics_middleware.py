@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from .query_stats import query_stats
+from .request_metrics import request_metrics
+
+UNRESOLVED_VIEW = "unresolved"
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+class MetricsMiddleware:
+    # Records the latency, database queries, database time and response size of every request by the name of the
+    # resolved URL (e.g. "problems:questions-list"). Requests that don't resolve (404s of unknown paths) and unknown
+    # methods are recorded together, so scanners can't blow up the number of series. It's the first middleware, so
+    # the latency includes the others. Runs the way the handler does (see MiddlewareMixin), so ASGI requests don't pay
+    # for a thread hop here.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            # Django checks this marker to call the middleware as a coroutine function
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__call_async(request)
+
+        started_at = time.perf_counter()
+
+        with query_stats() as stats:
+            response = self.get_response(request)
+
+        return self.__record(request, response, started_at, stats)
+
+    async def __call_async(self, request):
+        started_at = time.perf_counter()
+
+        with query_stats() as stats:
+            response = await self.get_response(request)
+
+        return self.__record(request, response, started_at, stats)
+
+    @staticmethod
+    def __record(request, response, started_at, stats):
+        resolver_match = getattr(request, "resolver_match", None)
+        view = resolver_match.view_name if resolver_match is not None else UNRESOLVED_VIEW
+        method = request.method if request.method in KNOWN_METHODS else "OTHER"
+        response_bytes = 0 if response.streaming else len(response.content)
+
+        request_metrics.record(view, method, response.status_code, time.perf_counter() - started_at,
+                               stats.queries, stats.seconds, response_bytes)
+
+        return response
@@ -0,0 +1,26 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from .prometheus_text import PROMETHEUS_CONTENT_TYPE, render_prometheus_text
+from .request_metrics import request_metrics
+
+
+class MetricsView(View):
+    # A plain Django view: scrapes don't need a session or content negotiation, only the bearer token of
+    # PROBLEMS_METRICS_TOKEN. Without the token the metrics aren't exported at all.
+    def get(self, request):
+        token = settings.PROBLEMS_METRICS_TOKEN
+
+        if not token:
+            raise Http404
+
+        scheme, _, credentials = request.META.get("HTTP_AUTHORIZATION", "").partition(" ")
+
+        if scheme.lower() != "bearer" or not hmac.compare_digest(credentials.encode(), token.encode()):
+            return HttpResponseForbidden()
+
+        content = render_prometheus_text(request_metrics.collect(), request_metrics.buckets)
+        return HttpResponse(content, content_type=PROMETHEUS_CONTENT_TYPE)
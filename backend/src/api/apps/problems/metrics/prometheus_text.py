@@ -0,0 +1,47 @@
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION = "problems_http_request_duration_seconds"
+COUNTERS = [
+    # (name, help, index of the value in the series)
+    ("problems_http_request_db_queries_total", "Database queries made by requests.", 3),
+    ("problems_http_request_db_seconds_total", "Time requests spent in database queries.", 4),
+    ("problems_http_response_bytes_total", "Size of response bodies, streamed responses aren't measured.", 5),
+]
+
+
+def render_prometheus_text(collected, buckets):
+    # renders metrics collected by RequestMetrics in the Prometheus text exposition format
+    keys = sorted(collected)
+    lines = [
+        f"# HELP {DURATION} Latency of requests by the name of the resolved URL.",
+        f"# TYPE {DURATION} histogram",
+    ]
+
+    for key in keys:
+        counts, count, seconds = collected[key][:3]
+        labels = _labels(key)
+        cumulative = 0
+
+        for bucket, bucket_count in zip(buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{DURATION}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+
+        lines.append(f'{DURATION}_bucket{{{labels},le="+Inf"}} {count}')
+        lines.append(f"{DURATION}_sum{{{labels}}} {seconds!r}")
+        lines.append(f"{DURATION}_count{{{labels}}} {count}")
+
+    for name, help_text, index in COUNTERS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f"{name}{{{_labels(key)}}} {collected[key][index]!r}" for key in keys)
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(key):
+    view, method, status = key
+    return f'view="{_escape(view)}",method="{_escape(method)}",status="{status}"'
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
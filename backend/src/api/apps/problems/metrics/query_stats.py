@@ -0,0 +1,57 @@
+import contextvars
+import time
+from contextlib import contextmanager
+
+
+class QueryStats:
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# the same as the database routing state: a context variable, so queries made by async views in the threads of the
+# database executor are counted for their request as well
+_current_query_stats = contextvars.ContextVar("problems_query_stats", default=None)
+
+
+def current_query_stats():
+    return _current_query_stats.get()
+
+
+@contextmanager
+def query_stats():
+    # queries counted by nested stats (e.g. of a request made by the test client) count for the enclosing ones too
+    parent = _current_query_stats.get()
+    stats = QueryStats()
+    token = _current_query_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+        if parent is not None:
+            parent.queries += stats.queries
+            parent.seconds += stats.seconds
+
+
+def count_query(execute, sql, params, many, context):
+    stats = _current_query_stats.get()
+
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.seconds += time.perf_counter() - started_at
+
+
+def install_query_stats(sender, connection, **kwargs):
+    # connected to connection_created: the wrapper stays on the connection object (one per alias and thread) for
+    # good, so requests only pay for setting a context variable
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
@@ -0,0 +1,137 @@
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+
+
+class RequestMetrics:
+    # Request metrics of this process by (view, method, status): latency histogram counts, the number of requests,
+    # the total latency, database queries, database time and response bytes. Recording is a dictionary update under
+    # a lock, so it stays in the microseconds.
+    # With PROBLEMS_METRICS_DIR set, a background thread writes the metrics to a file per process every
+    # PROBLEMS_METRICS_FLUSH_SECONDS and the metrics of all worker processes of the host are summed up on export.
+    # Files of finished processes are kept, their requests still count in the totals.
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, directory=None, flush_seconds=None):
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.__lock = threading.Lock()
+        self.__series = {}
+        self.__pid = None
+
+    def record(self, view, method, status, seconds, queries, db_seconds, response_bytes):
+        key = (view, method, status)
+
+        with self.__lock:
+            if self.__pid != os.getpid():
+                self.__start()
+
+            series = self.__series.get(key)
+
+            if series is None:
+                series = self.__series[key] = [[0] * (len(self.buckets) + 1), 0, 0.0, 0, 0.0, 0]
+
+            # counts of the buckets aren't cumulative here, the last one counts requests over the largest bucket
+            series[0][bisect.bisect_left(self.buckets, seconds)] += 1
+            series[1] += 1
+            series[2] += seconds
+            series[3] += queries
+            series[4] += db_seconds
+            series[5] += response_bytes
+
+    def collect(self):
+        # the metrics of all processes of the host or only of this one when there's no directory to share them
+        if self.__directory is None:
+            return self.__snapshot()
+
+        self.flush()
+        collected = {}
+
+        for file_name in os.listdir(self.__directory):
+            if not (file_name.startswith("metrics-") and file_name.endswith(".json")):
+                continue
+
+            try:
+                with open(os.path.join(self.__directory, file_name)) as file:
+                    process_series = json.load(file)
+            except (OSError, ValueError):
+                # a file can't be half-written (see flush()), but it may disappear while the directory is read
+                continue
+
+            for view, method, status, counts, count, seconds, queries, db_seconds, response_bytes in process_series:
+                self.__merge(collected, (view, method, status),
+                             [counts, count, seconds, queries, db_seconds, response_bytes])
+
+        return collected
+
+    def flush(self):
+        if self.__directory is None:
+            return
+
+        rows = [[*key, *series] for key, series in self.__snapshot().items()]
+        path = os.path.join(self.__directory, f"metrics-{os.getpid()}.json")
+        temporary_path = f"{path}.tmp"
+
+        with open(temporary_path, "w") as file:
+            json.dump(rows, file)
+
+        # readers see either the previous or the new file, never a partial one
+        os.replace(temporary_path, path)
+
+    def reset(self):
+        with self.__lock:
+            self.__series = {}
+
+    @property
+    def __directory(self):
+        return self.directory if self.directory is not None else settings.PROBLEMS_METRICS_DIR
+
+    def __snapshot(self):
+        with self.__lock:
+            return {key: [list(series[0]), *series[1:]] for key, series in self.__series.items()}
+
+    def __start(self):
+        # the first request of a process, or of a process forked from one that already had requests: the metrics
+        # inherited from the parent belong to the parent's file
+        self.__pid = os.getpid()
+        self.__series = {}
+
+        if self.__directory is not None:
+            os.makedirs(self.__directory, exist_ok=True)
+            threading.Thread(target=self.__flush_periodically, name="problems-metrics", daemon=True).start()
+            atexit.register(self.flush)
+
+    def __flush_periodically(self):
+        pid = self.__pid
+        flush_seconds = self.flush_seconds if self.flush_seconds is not None else \
+            settings.PROBLEMS_METRICS_FLUSH_SECONDS
+
+        while pid == os.getpid():
+            time.sleep(flush_seconds)
+
+            try:
+                self.flush()
+            except OSError:
+                # e.g. the directory is being cleaned up, the next flush writes everything again
+                pass
+
+    @staticmethod
+    def __merge(collected, key, series):
+        merged = collected.get(key)
+
+        if merged is None:
+            collected[key] = series
+            return
+
+        merged[0] = [a + b for a, b in zip(merged[0], series[0])]
+
+        for i in range(1, len(series)):
+            merged[i] += series[i]
+
+
+request_metrics = RequestMetrics()
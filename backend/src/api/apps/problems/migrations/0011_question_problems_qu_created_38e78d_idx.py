@@ -0,0 +1,17 @@
+# Generated by Django 3.2.4 on 2026-10-18 19:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0010_alter_option_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['-created', '-id'], name='problems_qu_created_38e78d_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.4 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0011_question_problems_qu_created_38e78d_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', '-created', '-id'], name='problems_qu_categor_1ba5c0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'complexity', 'type', '-created', '-id'], name='problems_qu_categor_432047_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['complexity', 'type', '-created', '-id'], name='problems_qu_complex_ada433_idx'),
+        ),
+    ]
@@ -0,0 +1,156 @@
+from django.db import migrations
+
+# SQLite rebuilds a table for most AlterField/RemoveField operations and the rebuilt table comes back without these
+# triggers, so later migrations touching problems_questions or problems_questions_options must either keep the
+# schema change out of Django's table remake (see 0017) or recreate the triggers; test_questions_search checks
+# that they exist after all migrations
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE problems_questions_search USING fts5(
+        text, solution, options, tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    INSERT INTO problems_questions_search(rowid, text, solution, options)
+    SELECT q.id, q.text, COALESCE(q.solution, ''), COALESCE((
+        SELECT GROUP_CONCAT(o.value, ' ') FROM problems_questions_options o WHERE o.question_id = q.id
+    ), '')
+    FROM problems_questions q
+    """,
+    """
+    CREATE TRIGGER problems_questions_search_insert AFTER INSERT ON problems_questions BEGIN
+        INSERT INTO problems_questions_search(rowid, text, solution, options)
+        VALUES (new.id, new.text, COALESCE(new.solution, ''), '');
+    END
+    """,
+    """
+    CREATE TRIGGER problems_questions_search_update AFTER UPDATE OF text, solution ON problems_questions BEGIN
+        UPDATE problems_questions_search SET text = new.text, solution = COALESCE(new.solution, '')
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER problems_questions_search_delete AFTER DELETE ON problems_questions BEGIN
+        DELETE FROM problems_questions_search WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER problems_questions_options_search_insert AFTER INSERT ON problems_questions_options BEGIN
+        UPDATE problems_questions_search SET options = COALESCE((
+            SELECT GROUP_CONCAT(value, ' ') FROM problems_questions_options WHERE question_id = new.question_id
+        ), '') WHERE rowid = new.question_id;
+    END
+    """,
+    """
+    CREATE TRIGGER problems_questions_options_search_update AFTER UPDATE ON problems_questions_options BEGIN
+        UPDATE problems_questions_search SET options = COALESCE((
+            SELECT GROUP_CONCAT(value, ' ') FROM problems_questions_options WHERE question_id = old.question_id
+        ), '') WHERE rowid = old.question_id;
+        UPDATE problems_questions_search SET options = COALESCE((
+            SELECT GROUP_CONCAT(value, ' ') FROM problems_questions_options WHERE question_id = new.question_id
+        ), '') WHERE rowid = new.question_id;
+    END
+    """,
+    """
+    CREATE TRIGGER problems_questions_options_search_delete AFTER DELETE ON problems_questions_options BEGIN
+        UPDATE problems_questions_search SET options = COALESCE((
+            SELECT GROUP_CONCAT(value, ' ') FROM problems_questions_options WHERE question_id = old.question_id
+        ), '') WHERE rowid = old.question_id;
+    END
+    """,
+]
+
+SQLITE_BACKWARD_SQL = [
+    "DROP TRIGGER IF EXISTS problems_questions_options_search_delete",
+    "DROP TRIGGER IF EXISTS problems_questions_options_search_update",
+    "DROP TRIGGER IF EXISTS problems_questions_options_search_insert",
+    "DROP TRIGGER IF EXISTS problems_questions_search_delete",
+    "DROP TRIGGER IF EXISTS problems_questions_search_update",
+    "DROP TRIGGER IF EXISTS problems_questions_search_insert",
+    "DROP TABLE IF EXISTS problems_questions_search",
+]
+
+POSTGRES_FORWARD_SQL = [
+    "ALTER TABLE problems_questions ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION problems_questions_search_vector(bigint, text, text) RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', COALESCE($2, '')), 'A')
+            || setweight(to_tsvector('english', COALESCE($3, '')), 'B')
+            || setweight(to_tsvector('english', COALESCE((
+                SELECT string_agg(value, ' ') FROM problems_questions_options WHERE question_id = $1
+            ), '')), 'C')
+    $$ LANGUAGE sql STABLE
+    """,
+    """
+    CREATE FUNCTION problems_questions_search_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := problems_questions_search_vector(NEW.id, NEW.text, NEW.solution);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER problems_questions_search BEFORE INSERT OR UPDATE OF text, solution ON problems_questions
+    FOR EACH ROW EXECUTE PROCEDURE problems_questions_search_trigger()
+    """,
+    """
+    CREATE FUNCTION problems_questions_options_search_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE problems_questions SET search_vector = problems_questions_search_vector(id, text, solution)
+            WHERE id = OLD.question_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE problems_questions SET search_vector = problems_questions_search_vector(id, text, solution)
+            WHERE id = NEW.question_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER problems_questions_options_search AFTER INSERT OR UPDATE OR DELETE ON problems_questions_options
+    FOR EACH ROW EXECUTE PROCEDURE problems_questions_options_search_trigger()
+    """,
+    "UPDATE problems_questions SET search_vector = problems_questions_search_vector(id, text, solution)",
+    "CREATE INDEX problems_questions_search_vector_idx ON problems_questions USING GIN (search_vector)",
+]
+
+POSTGRES_BACKWARD_SQL = [
+    "DROP TRIGGER IF EXISTS problems_questions_options_search ON problems_questions_options",
+    "DROP FUNCTION IF EXISTS problems_questions_options_search_trigger()",
+    "DROP TRIGGER IF EXISTS problems_questions_search ON problems_questions",
+    "DROP FUNCTION IF EXISTS problems_questions_search_trigger()",
+    "DROP FUNCTION IF EXISTS problems_questions_search_vector(bigint, text, text)",
+    "DROP INDEX IF EXISTS problems_questions_search_vector_idx",
+    "ALTER TABLE problems_questions DROP COLUMN IF EXISTS search_vector",
+]
+
+FORWARD_SQL = {
+    "sqlite": SQLITE_FORWARD_SQL,
+    "postgresql": POSTGRES_FORWARD_SQL,
+}
+
+BACKWARD_SQL = {
+    "sqlite": SQLITE_BACKWARD_SQL,
+    "postgresql": POSTGRES_BACKWARD_SQL,
+}
+
+
+def execute_vendor_sql(statements_by_vendor):
+    def execute(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return execute
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0012_auto_20261018_1922'),
+    ]
+
+    operations = [
+        migrations.RunPython(execute_vendor_sql(FORWARD_SQL), execute_vendor_sql(BACKWARD_SQL)),
+    ]
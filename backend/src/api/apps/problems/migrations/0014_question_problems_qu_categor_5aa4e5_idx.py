@@ -0,0 +1,17 @@
+# Generated by Django 3.2.4 on 2026-10-18 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0013_questions_full_text_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'complexity', 'id'], name='problems_qu_categor_5aa4e5_idx'),
+        ),
+    ]
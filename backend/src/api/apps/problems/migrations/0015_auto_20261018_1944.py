@@ -0,0 +1,21 @@
+# Generated by Django 3.2.4 on 2026-10-18 19:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0014_question_problems_qu_categor_5aa4e5_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['complexity', 'number_of_points', 'id'], name='problems_qu_complex_2c3988_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'complexity', 'number_of_points', 'id'], name='problems_qu_categor_136572_idx'),
+        ),
+    ]
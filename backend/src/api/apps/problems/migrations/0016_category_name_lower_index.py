@@ -0,0 +1,18 @@
+# Generated by Django 3.2.4 on 2026-10-18 20:14
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0015_auto_20261018_1944'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='problems_ca_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.4 on 2026-10-18 20:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# the index Django created for the foreign key, every composite index of the questions starting with the category
+# covers it; dropped by name because altering the field would rebuild the table on SQLite and lose the triggers of
+# the full text search (see 0013)
+CATEGORY_INDEX = "problems_questions_category_id_088ba42d"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0016_category_name_lower_index'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    f'DROP INDEX "{CATEGORY_INDEX}"',
+                    f'CREATE INDEX "{CATEGORY_INDEX}" ON "problems_questions" ("category_id")',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='question',
+                    name='category',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='questions', to='problems.category', verbose_name='Category'),
+                ),
+            ],
+        ),
+    ]
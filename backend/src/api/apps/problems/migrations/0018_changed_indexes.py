@@ -0,0 +1,25 @@
+# Generated by Django 3.2.4 on 2026-10-18 20:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0017_drop_question_category_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['changed'], name='problems_ca_changed_4d2806_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='option',
+            index=models.Index(fields=['changed'], name='problems_qu_changed_baeb69_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['changed'], name='problems_qu_changed_4303ee_idx'),
+        ),
+    ]
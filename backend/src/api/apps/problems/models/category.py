@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from api.apps.shared.models import ChangeDateInfoModel
@@ -13,5 +14,11 @@ class Category(ChangeDateInfoModel):
     class Meta:
         ordering = ["created"]
         db_table = "problems_categories"
+        # the admin autocomplete looks categories up by a case insensitive prefix of the name and lists them by it,
+        # the latest change is the freshness of the lists
+        indexes = [
+            models.Index(Lower("name"), name="problems_ca_name_lower_idx"),
+            models.Index(fields=["changed"]),
+        ]
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
@@ -22,3 +22,5 @@ class Option(ChangeDateInfoModel):
         constraints = [
             models.UniqueConstraint(fields=("question", "value"), name="question_value_unique_constraint")
         ]
+        # the latest change is the freshness of the search
+        indexes = [models.Index(fields=["changed"])]
@@ -31,8 +31,9 @@ class Question(ChangeDateInfoModel):
         HARD = "Hard", _("Hard")
         EXTREMELY_HARD = "Extremely Hard", _("Extremely Hard")
 
+    # no index of its own, the composite indexes below start with the category
     category = models.ForeignKey(to=Category, on_delete=models.DO_NOTHING, related_name="questions",
-                                 verbose_name=_("Category"))
+                                 db_index=False, verbose_name=_("Category"))
     text = models.TextField(max_length=2048, verbose_name=_("Question"))
     type = models.CharField(max_length=32, verbose_name=_("Type"), choices=QuestionType.choices)
     complexity = models.CharField(max_length=32, verbose_name=_("Complexity"), choices=Complexity.choices)
@@ -66,5 +67,14 @@ class Question(ChangeDateInfoModel):
         )]
         indexes = [
             models.Index(fields=["type"]),
-            models.Index(fields=["complexity"])
+            models.Index(fields=["complexity"]),
+            models.Index(fields=["-created", "-id"]),
+            models.Index(fields=["category", "-created", "-id"]),
+            models.Index(fields=["category", "complexity", "type", "-created", "-id"]),
+            models.Index(fields=["complexity", "type", "-created", "-id"]),
+            models.Index(fields=["category", "complexity", "id"]),
+            models.Index(fields=["complexity", "number_of_points", "id"]),
+            models.Index(fields=["category", "complexity", "number_of_points", "id"]),
+            # the latest change is the freshness of the lists
+            models.Index(fields=["changed"]),
         ]
@@ -0,0 +1 @@
+from .questions_cursor_pagination import QuestionsCursorPagination
@@ -0,0 +1,106 @@
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+# DRF's CursorPagination keys the cursor on the first ordering field only and falls back to OFFSET for rows sharing
+# the same position. Here the position is the whole (created, id) pair, so it is unique, the offset is always zero
+# and every page is a single range scan over the composite index on problems_questions.
+class QuestionsCursorPagination(CursorPagination):
+    ordering = ("-created", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    position_separator = "|"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor.reverse if self.cursor else False
+        current_position = self.cursor.position if self.cursor else None
+
+        if reverse:
+            queryset = queryset.order_by(*[self.__reverse_order(order) for order in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = self.__filter_after_position(queryset, current_position, reverse)
+
+        # fetch an extra item in order to determine if there is a page following on from this one
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+
+        has_following_position = len(results) > len(self.page)
+        following_position = self._get_position_from_instance(results[-1], self.ordering) \
+            if has_following_position else None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+
+        if cursor is not None and (cursor.offset != 0 or cursor.position is None):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = [
+            instance[order.lstrip("-")] if isinstance(instance, dict) else getattr(instance, order.lstrip("-"))
+            for order in ordering
+        ]
+
+        return self.position_separator.join(
+            value.isoformat() if hasattr(value, "isoformat") else str(value)
+            for value in values
+        )
+
+    def __filter_after_position(self, queryset, position, reverse):
+        (created_order, _), (created, pk) = self.ordering, self.__parse_position(position)
+        descending = created_order.startswith("-") != reverse
+
+        # "created <= X and not (created = X and id >= Y)" keeps the range condition on the leading index column,
+        # so both SQLite and Postgres walk the (created, id) index instead of merging two OR-ed scans
+        if descending:
+            return queryset.filter(created__lte=created).exclude(Q(created=created) & Q(id__gte=pk))
+
+        return queryset.filter(created__gte=created).exclude(Q(created=created) & Q(id__lte=pk))
+
+    def __parse_position(self, position):
+        try:
+            created, pk = position.split(self.position_separator)
+            created, pk = parse_datetime(created), int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return created, pk
+
+    @staticmethod
+    def __reverse_order(order):
+        return order[1:] if order.startswith("-") else f"-{order}"
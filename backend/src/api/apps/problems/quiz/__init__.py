@@ -0,0 +1,2 @@
+from .quiz_sampler import QuizSampler
+from .exam_builder import ExamBuilder, Exam
@@ -0,0 +1,146 @@
+import random
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
+
+from api.apps.problems.models import Question
+from api.apps.problems.quiz.quiz_sampler import QuizSampler
+
+Exam = namedtuple("Exam", ["seed", "question_ids", "points_by_complexity"])
+
+
+class ExamBuilder:
+    # Assembles an exam worth exactly total_points whose points are split between complexities by percentages,
+    # e.g. 40 points, 30% Easy / 50% Medium / 20% Hard.
+    # Eligible questions are bucketed by (complexity, number_of_points) with a single aggregate query. For every
+    # complexity a bounded knapsack DP over the buckets counts the ways to pick numbers of questions of every
+    # point value summing up to the complexity's share of points, and one of them is drawn at random weighted by
+    # those counts. The questions themselves are then sampled from their buckets by QuizSampler. The work doesn't
+    # depend on the number of eligible questions, only on the number of points.
+    max_points_per_question = 10
+
+    def __init__(self, queryset=None):
+        self.queryset = (Question.objects.all() if queryset is None else queryset).order_by()
+
+    def build(self, total_points, mix, seed=None):
+        seed = seed if seed is not None else QuizSampler.new_seed()
+        rng = random.Random(seed)
+        buckets = self.__get_buckets()
+        points_by_complexity = self.__split_points(total_points, mix)
+        question_ids = []
+
+        for complexity, points in points_by_complexity.items():
+            counts = buckets.get(complexity, {})
+            picks = self.__pick_numbers_of_questions(rng, counts, points)
+
+            if picks is None:
+                raise ValidationError(
+                    _("There are not enough %(complexity)s questions to make up %(points)d points.") % {
+                        "complexity": complexity, "points": points
+                    }
+                )
+
+            for number_of_points, number_of_questions in picks.items():
+                bucket = self.queryset.filter(complexity=complexity, number_of_points=number_of_points)
+                ids = QuizSampler(bucket, rng.randrange(2 ** 31)).sample_ids(number_of_questions,
+                                                                             counts[number_of_points])
+
+                if len(ids) < number_of_questions:
+                    # questions were deleted since the bucket was counted, whatever is left of it is read as a whole
+                    rest = list(bucket.exclude(id__in=ids).order_by("id").values_list("id", flat=True))
+                    ids += rng.sample(rest, min(number_of_questions - len(ids), len(rest)))
+
+                if len(ids) != number_of_questions:
+                    raise ValidationError(_("Questions have changed while the exam was being built, try again."))
+
+                question_ids.extend(ids)
+
+        return Exam(seed, question_ids, points_by_complexity)
+
+    def __get_buckets(self):
+        buckets = {}
+        rows = self.queryset.values_list("complexity", "number_of_points").annotate(count=Count("id"))
+
+        for complexity, number_of_points, count in rows:
+            buckets.setdefault(complexity, {})[number_of_points] = count
+
+        return buckets
+
+    def __split_points(self, total_points, mix):
+        if total_points < 1:
+            raise ValidationError(_("Number of points should be a positive whole number."))
+
+        for complexity, percent in mix.items():
+            if complexity not in Question.Complexity.values:
+                raise ValidationError(
+                    _("Select a valid choice. %(value)s is not one of the available choices.") % {"value": complexity}
+                )
+
+            if percent < 0:
+                raise ValidationError(_("Percentages should not be negative."))
+
+        if sum(mix.values()) != 100:
+            raise ValidationError(_("Percentages should sum up to 100."))
+
+        # the largest remainder method, so the shares always sum up to total_points
+        exact_shares = {complexity: total_points * percent / 100 for complexity, percent in mix.items() if percent}
+        shares = {complexity: int(share) for complexity, share in exact_shares.items()}
+        by_remainder = sorted(exact_shares, key=lambda complexity: exact_shares[complexity] - shares[complexity],
+                              reverse=True)
+
+        for complexity in by_remainder[:total_points - sum(shares.values())]:
+            shares[complexity] += 1
+
+        return {complexity: points for complexity, points in shares.items() if points}
+
+    def __pick_numbers_of_questions(self, rng, counts, target):
+        # ways[i][s] is the number of ways to make up s points from the first i point values
+        point_values = [value for value in range(1, self.max_points_per_question + 1) if counts.get(value)]
+        ways = [[1] + [0] * target]
+
+        for value in point_values:
+            ways.append(self.__add_point_value(ways[-1], value, counts[value], target))
+
+        if not ways[-1][target]:
+            return None
+
+        picks, remaining = {}, target
+
+        for i in range(len(point_values), 0, -1):
+            value, previous = point_values[i - 1], ways[i - 1]
+            options = range(min(counts[value], remaining // value) + 1)
+            draw = rng.randrange(ways[i][remaining])
+
+            for number_of_questions in options:
+                draw -= previous[remaining - number_of_questions * value]
+
+                if draw < 0:
+                    break
+
+            if number_of_questions:
+                picks[value] = number_of_questions
+
+            remaining -= number_of_questions * value
+
+        return picks
+
+    @staticmethod
+    def __add_point_value(previous, value, count, target):
+        # current[s] = previous[s] + previous[s - value] + ... + previous[s - count * value], computed as a sliding
+        # sum over every residue modulo value, so it costs O(target) whatever count is
+        current = [0] * (target + 1)
+
+        for residue in range(min(value, target + 1)):
+            window = 0
+
+            for k, s in enumerate(range(residue, target + 1, value)):
+                window += previous[s]
+
+                if k > count:
+                    window -= previous[s - (count + 1) * value]
+
+                current[s] = window
+
+        return current
@@ -0,0 +1,94 @@
+import random
+
+
+class QuizSampler:
+    # Picks random questions from a (filtered) queryset without ORDER BY RANDOM(), which reads and sorts every
+    # eligible row. Small pools (relative to the number of questions requested as well) are read as a whole, ids only,
+    # and sampled exactly. Large pools are sampled by probing:
+    # a random id between the smallest and the largest eligible id is drawn and the first eligible id from it on is
+    # taken, which is an index seek. That's the price of not counting rows: a question is picked with a probability
+    # proportional to the gap of ids before it, so where eligible ids are clustered (e.g. a category filled in a few
+    # batches among others) the first question of every cluster comes up far more often than the rest of it.
+    # Probes that keep hitting questions already picked are topped up with the eligible ids following a random one,
+    # so fewer than n questions only come back when the pool itself is smaller.
+    # The same seed over the same questions gives the same quiz, so a quiz could be regenerated from its seed.
+    max_pool_size = 2000
+    min_pool_size_per_question = 20
+    max_probes_per_question = 4
+
+    def __init__(self, queryset, seed=None):
+        self.queryset = queryset.order_by()
+        self.seed = seed if seed is not None else self.new_seed()
+
+    def sample_ids(self, n, pool_size=None):
+        # pool_size is the number of eligible questions when the caller already knows it, a large pool is probed
+        # right away then, without reading the first max_pool_size ids
+        rng = random.Random(self.seed)
+        max_pool_size = max(self.max_pool_size, n * self.min_pool_size_per_question)
+
+        if pool_size is not None and pool_size > max_pool_size:
+            min_id = self.queryset.order_by("id").values_list("id", flat=True).first()
+            return self.__probe(rng, min_id, n, pool_size) if min_id is not None else []
+
+        pool = list(self.queryset.order_by("id").values_list("id", flat=True)[:max_pool_size + 1])
+
+        if len(pool) <= max_pool_size:
+            return rng.sample(pool, min(n, len(pool)))
+
+        return self.__probe(rng, pool[0], n, max_pool_size)
+
+    def __probe(self, rng, min_id, n, pool_size):
+        max_id = self.queryset.order_by("-id").values_list("id", flat=True).first() or min_id
+        # the pool is at least pool_size large, so a window of this width holds an eligible id or more on average
+        window = max((max_id - min_id) // pool_size, 1)
+        ids, seen = [], set()
+
+        for _attempt in range(n * self.max_probes_per_question):
+            if len(ids) == n:
+                break
+
+            pk = self.__first_id_from(rng.randint(min_id, max_id), max_id, window)
+
+            # None when questions were deleted in the meantime
+            if pk is not None and pk not in seen:
+                seen.add(pk)
+                ids.append(pk)
+
+        if len(ids) < n:
+            ids += self.__following_ids(rng.randint(min_id, max_id), n - len(ids), seen)
+
+        return ids
+
+    def __following_ids(self, start, count, seen):
+        # the eligible ids from start on, wrapping around to the smallest one
+        ids = []
+
+        for queryset in (self.queryset.filter(id__gte=start), self.queryset.filter(id__lt=start)):
+            following = queryset.exclude(id__in=seen).order_by("id").values_list("id", flat=True)
+            ids += following[:count - len(ids)]
+
+            if len(ids) == count:
+                break
+
+        return ids
+
+    def __first_id_from(self, start, max_id, window):
+        # the id range is bounded, so a database that can't walk an index over several categories or complexities
+        # in id order sorts a handful of rows instead of every eligible row after start
+        while True:
+            end = start + window
+            queryset = self.queryset.filter(id__gte=start)
+
+            if end <= max_id:
+                queryset = queryset.filter(id__lt=end)
+
+            pk = queryset.order_by("id").values_list("id", flat=True).first()
+
+            if pk is not None or end > max_id:
+                return pk
+
+            window *= 2
+
+    @staticmethod
+    def new_seed():
+        return random.SystemRandom().randrange(2 ** 31)
@@ -0,0 +1,3 @@
+from .routing_state import RoutingState, routing_state, current_routing_state
+from .replica_router import ReplicaRouter
+from .replica_routing_middleware import ReplicaRoutingMiddleware
@@ -0,0 +1,45 @@
+import random
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from .routing_state import current_routing_state
+
+PROBLEMS_APP_LABEL = "problems"
+
+
+class ReplicaRouter:
+    # Reads of the problems models go to one of PROBLEMS_REPLICA_DATABASES when the current request allows it (see
+    # ReplicaRoutingMiddleware), everything else (admin, writes, management commands) goes to the primary.
+
+    def db_for_read(self, model, **hints):
+        state = current_routing_state()
+        replicas = settings.PROBLEMS_REPLICA_DATABASES
+
+        if not replicas or model._meta.app_label != PROBLEMS_APP_LABEL or state is None:
+            return None
+
+        if state.read_from_replica and not state.wrote:
+            return random.choice(replicas)
+
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label != PROBLEMS_APP_LABEL:
+            return None
+
+        state = current_routing_state()
+
+        if state is not None:
+            state.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the same rows as the primary
+        databases = {DEFAULT_DB_ALIAS, *settings.PROBLEMS_REPLICA_DATABASES}
+        return True if obj1._state.db in databases and obj2._state.db in databases else None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas receive the schema from the primary
+        return False if db in settings.PROBLEMS_REPLICA_DATABASES else None
@@ -0,0 +1,61 @@
+import asyncio
+
+from django.conf import settings
+
+from .routing_state import routing_state, current_routing_state
+
+PROBLEMS_NAMESPACE = "problems"
+
+
+class ReplicaRoutingMiddleware:
+    # Lets safe requests of the problems API read from replicas. A client that wrote something is pinned to the
+    # primary by a cookie for PROBLEMS_PRIMARY_PIN_SECONDS, which has to cover the replication lag, so editors always
+    # read their own writes. Responses streamed after the middleware returns (e.g. the export) read from the primary.
+    # Runs the way the handler does (see MiddlewareMixin), so ASGI requests don't pay for a thread hop here.
+    pin_cookie_name = "problems_primary"
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            # Django checks this marker to call the middleware as a coroutine function, a sync process_view would
+            # be run in a thread
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+            self.process_view = self.__process_view_async
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__call_async(request)
+
+        with routing_state() as state:
+            response = self.get_response(request)
+
+        return self.__pin(state, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.__route(request)
+
+    async def __call_async(self, request):
+        with routing_state() as state:
+            response = await self.get_response(request)
+
+        return self.__pin(state, response)
+
+    async def __process_view_async(self, request, view_func, view_args, view_kwargs):
+        self.__route(request)
+
+    def __route(self, request):
+        current_routing_state().read_from_replica = \
+            request.method in self.safe_methods and \
+            request.resolver_match.namespace == PROBLEMS_NAMESPACE and \
+            self.pin_cookie_name not in request.COOKIES
+
+    def __pin(self, state, response):
+        if state.wrote:
+            response.set_cookie(self.pin_cookie_name, "1", max_age=settings.PROBLEMS_PRIMARY_PIN_SECONDS,
+                                httponly=True, samesite="Lax")
+
+        return response
@@ -0,0 +1,30 @@
+import contextvars
+from contextlib import contextmanager
+
+
+class RoutingState:
+    # What the router may do within one request: whether its reads may go to a replica and whether it has already
+    # written something, after which it has to read from the primary to see its own writes.
+    def __init__(self):
+        self.read_from_replica = False
+        self.wrote = False
+
+
+# a context variable rather than a thread local: under ASGI a request moves between the event loop and threads,
+# the state is an object, so changes made in a copied context are seen by the whole request
+_current_routing_state = contextvars.ContextVar("problems_routing_state", default=None)
+
+
+def current_routing_state():
+    return _current_routing_state.get()
+
+
+@contextmanager
+def routing_state():
+    state = RoutingState()
+    token = _current_routing_state.set(state)
+
+    try:
+        yield state
+    finally:
+        _current_routing_state.reset(token)
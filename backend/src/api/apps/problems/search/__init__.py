@@ -0,0 +1 @@
+from .questions_full_text_search import QuestionsFullTextSearch
@@ -0,0 +1,46 @@
+import re
+
+from django.db import connections, DEFAULT_DB_ALIAS
+
+
+class QuestionsFullTextSearch:
+    # the index itself is created and kept in sync by database triggers (see 0013_questions_full_text_search
+    # migration): a tsvector column with a GIN index on Postgres and an FTS5 shadow table on SQLite
+    queries = {
+        "postgresql": """
+            SELECT id FROM problems_questions
+            WHERE search_vector @@ to_tsquery('english', %s)
+            ORDER BY ts_rank(search_vector, to_tsquery('english', %s)) DESC, id DESC
+            LIMIT %s
+        """,
+        "sqlite": """
+            SELECT rowid FROM problems_questions_search
+            WHERE problems_questions_search MATCH %s
+            ORDER BY bm25(problems_questions_search, 10.0, 5.0, 1.0), rowid DESC
+            LIMIT %s
+        """,
+    }
+    token_pattern = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.using = using
+
+    def find_ids(self, search, limit):
+        tokens = self.token_pattern.findall(search.lower())
+
+        if not tokens:
+            return []
+
+        connection = connections[self.using]
+
+        with connection.cursor() as cursor:
+            cursor.execute(self.queries[connection.vendor], self.__get_params(connection.vendor, tokens, limit))
+            return [row[0] for row in cursor.fetchall()]
+
+    def __get_params(self, vendor, tokens, limit):
+        # every token is matched as a prefix, so results are available while a word is still being typed
+        if vendor == "postgresql":
+            query = " & ".join(f"{token}:*" for token in tokens)
+            return [query, query, limit]
+
+        return [" ".join(f'"{token}"*' for token in tokens), limit]
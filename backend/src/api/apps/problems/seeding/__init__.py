@@ -0,0 +1,2 @@
+from .question_bank_generator import QuestionBankGenerator
+from .question_bank_seeder import QuestionBankSeeder
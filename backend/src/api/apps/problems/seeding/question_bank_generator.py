@@ -0,0 +1,148 @@
+import random
+from decimal import Decimal
+
+from api.apps.problems.models import Question, Option
+
+SUBJECTS = [
+    "Arithmetic", "Fractions", "Percentages", "Algebra", "Linear Equations", "Quadratic Equations", "Inequalities",
+    "Functions", "Sequences", "Geometry", "Trigonometry", "Coordinate Geometry", "Vectors", "Probability",
+    "Statistics", "Combinatorics", "Number Theory", "Logarithms", "Calculus", "Matrices",
+]
+
+LEVELS = ["Grade 5", "Grade 6", "Grade 7", "Grade 8", "Grade 9", "Grade 10", "Grade 11", "Grade 12", "Olympiad"]
+
+POLYGONS = {
+    3: "Triangle", 4: "Quadrilateral", 5: "Pentagon", 6: "Hexagon", 7: "Heptagon", 8: "Octagon", 9: "Nonagon",
+    10: "Decagon", 12: "Dodecagon",
+}
+
+# a share of questions of every type and complexity in the bank
+TYPE_WEIGHTS = {
+    Question.QuestionType.INTEGER.value: 30,
+    Question.QuestionType.DECIMAL.value: 15,
+    Question.QuestionType.TEXT.value: 10,
+    Question.QuestionType.BOOLEAN.value: 10,
+    Question.QuestionType.SINGLE_CHOICE.value: 20,
+    Question.QuestionType.MULTIPLE_CHOICE.value: 15,
+}
+
+COMPLEXITY_WEIGHTS = {
+    Question.Complexity.EASY.value: 40,
+    Question.Complexity.MEDIUM.value: 35,
+    Question.Complexity.HARD.value: 20,
+    Question.Complexity.EXTREMELY_HARD.value: 5,
+}
+
+# harder questions are worth more points and use larger numbers
+POINTS_BY_COMPLEXITY = {
+    Question.Complexity.EASY.value: (1, 3),
+    Question.Complexity.MEDIUM.value: (3, 5),
+    Question.Complexity.HARD.value: (5, 8),
+    Question.Complexity.EXTREMELY_HARD.value: (8, 10),
+}
+
+MAGNITUDE_BY_COMPLEXITY = {
+    Question.Complexity.EASY.value: 20,
+    Question.Complexity.MEDIUM.value: 100,
+    Question.Complexity.HARD.value: 1000,
+    Question.Complexity.EXTREMELY_HARD.value: 100_000,
+}
+
+
+class QuestionBankGenerator:
+    # Generates a question bank that looks like a real one: categories named by subject and level, every question type
+    # with a correct answer the admin would accept and choice questions with options that pass the rules of
+    # AdminOptionInlineFormset (at least two distinct options, one correct for single choice, some for multiple).
+    # The same seed always generates the same bank.
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+        self.__types = self.__weighted(TYPE_WEIGHTS)
+        self.__complexities = self.__weighted(COMPLEXITY_WEIGHTS)
+        self.__builders = {
+            Question.QuestionType.INTEGER.value: self.__integer,
+            Question.QuestionType.DECIMAL.value: self.__decimal,
+            Question.QuestionType.TEXT.value: self.__text,
+            Question.QuestionType.BOOLEAN.value: self.__boolean,
+            Question.QuestionType.SINGLE_CHOICE.value: self.__single_choice,
+            Question.QuestionType.MULTIPLE_CHOICE.value: self.__multiple_choice,
+        }
+
+    @staticmethod
+    def category_names(number_of_categories):
+        names = [f"{subject} ({level})" for level in LEVELS for subject in SUBJECTS]
+        names += [f"{name} #{i}" for i in range(2, number_of_categories // len(names) + 2) for name in names]
+
+        return names[:number_of_categories]
+
+    def questions(self, categories, number_of_questions):
+        # yields unsaved questions with lists of their unsaved options
+        for _ in range(number_of_questions):
+            question_type = self.random.choice(self.__types)
+            complexity = self.random.choice(self.__complexities)
+            text, correct_answer, options = self.__builders[question_type](MAGNITUDE_BY_COMPLEXITY[complexity])
+
+            question = Question(
+                category=self.random.choice(categories),
+                text=text,
+                type=question_type,
+                complexity=complexity,
+                number_of_points=self.random.randint(*POINTS_BY_COMPLEXITY[complexity]),
+                max_attempts_to_solve=self.random.choice([None, None, 1, 3, 5]),
+                correct_answer=correct_answer,
+                solution=self.random.choice([None, f"Check the answer by substitution: {correct_answer or '...'}."]),
+            )
+
+            yield question, [Option(value=value, is_correct=is_correct) for value, is_correct in options]
+
+    def __integer(self, magnitude):
+        a, b, c = (self.random.randint(1, magnitude) for _ in range(3))
+        return f"What is the value of {a} * {b} - {c}?", str(a * b - c), []
+
+    def __decimal(self, magnitude):
+        a, b = self.random.randint(1, magnitude), self.random.randint(2, 9)
+        answer = (Decimal(a) / Decimal(b)).quantize(Decimal("0.01"))
+        return f"Solve {b}x = {a} for x, rounded to two decimal places.", str(answer), []
+
+    def __text(self, magnitude):
+        sides = self.random.choice(list(POLYGONS))
+        return f"What is the name of a polygon with {sides} sides?", POLYGONS[sides], []
+
+    def __boolean(self, magnitude):
+        number = self.random.randint(2, magnitude)
+        return f"Is {number} a prime number?", "Yes" if self.__is_prime(number) else "No", []
+
+    def __single_choice(self, magnitude):
+        divisor = self.random.randint(2, 9)
+        correct = divisor * self.random.randint(1, magnitude)
+        wrong = set()
+
+        while len(wrong) < 3:
+            candidate = self.random.randint(1, magnitude * divisor)
+
+            if candidate % divisor:
+                wrong.add(candidate)
+
+        options = [(str(correct), True)] + [(str(value), False) for value in wrong]
+        self.random.shuffle(options)
+
+        return f"Which of these numbers is divisible by {divisor}?", None, options
+
+    def __multiple_choice(self, magnitude):
+        values = self.random.sample(range(1, magnitude * 10), self.random.randint(4, 6))
+
+        # at least one option has to be correct
+        if all(value % 2 for value in values):
+            values[0] += 1
+
+        options = [(str(value), value % 2 == 0) for value in values]
+
+        return "Which of these numbers are even?", None, options
+
+    @staticmethod
+    def __is_prime(number):
+        return number > 1 and all(number % divisor for divisor in range(2, int(number ** 0.5) + 1))
+
+    @staticmethod
+    def __weighted(weights):
+        return [value for value, weight in weights.items() for _ in range(weight)]
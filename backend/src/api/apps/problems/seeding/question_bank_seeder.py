@@ -0,0 +1,69 @@
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+from django.db.models import Max
+
+from api.apps.problems.models import Category, Question, Option
+
+
+class QuestionBankSeeder:
+    # Inserts a bank produced by QuestionBankGenerator through bulk inserts only, every batch of questions together
+    # with their options in its own transaction. Ids of questions are assigned here, so options can be linked to
+    # them on databases that can't return ids from a bulk insert (SQLite in Django 3.2), sequences are reset at the
+    # end. Meant for local and benchmark databases: concurrent inserts would clash with the assigned ids.
+    default_batch_size = 10_000
+
+    def __init__(self, generator, batch_size=default_batch_size):
+        self.generator = generator
+        self.batch_size = batch_size
+        self.using = router.db_for_write(Question)
+
+    def seed_categories(self, number_of_categories):
+        # categories that already exist are reused, so the bank can be grown by running the seeding again
+        names = self.generator.category_names(number_of_categories)
+        existing = set(Category.objects.using(self.using).filter(name__in=names).values_list("name", flat=True))
+
+        Category.objects.using(self.using).bulk_create(
+            [Category(name=name) for name in names if name not in existing], batch_size=self.batch_size
+        )
+
+        return list(Category.objects.using(self.using).filter(name__in=names).order_by("id"))
+
+    def seed_questions(self, categories, number_of_questions, on_progress=None):
+        questions = self.generator.questions(categories, number_of_questions)
+        seeded = 0
+
+        while seeded < number_of_questions:
+            size = min(self.batch_size, number_of_questions - seeded)
+
+            with transaction.atomic(using=self.using):
+                self.__insert_batch([next(questions) for _ in range(size)])
+
+            seeded += size
+
+            if on_progress is not None:
+                on_progress(seeded)
+
+        self.__reset_sequences()
+
+        return seeded
+
+    def __insert_batch(self, batch):
+        next_id = (Question.objects.using(self.using).aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+        options = []
+
+        for i, (question, question_options) in enumerate(batch):
+            question.id = next_id + i
+
+            for option in question_options:
+                option.question_id = question.id
+                options.append(option)
+
+        Question.objects.using(self.using).bulk_create([question for question, _ in batch], batch_size=self.batch_size)
+        Option.objects.using(self.using).bulk_create(options, batch_size=self.batch_size)
+
+    def __reset_sequences(self):
+        connection = connections[self.using]
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Question]):
+                cursor.execute(sql)
@@ -1,3 +1,7 @@
+from .sparse_fieldset_serializer_mixin import SparseFieldsetSerializerMixin
 from .category_serializer import CategorySerializer
 from .question_serializer import QuestionSerializer, QuestionWithOptionsSerializer
 from .option_serializer import OptionSerializer
+from .option_export_serializer import OptionExportSerializer
+from .question_export_serializer import QuestionExportSerializer
+from .question_rows_serializer import QuestionRowsSerializer
@@ -0,0 +1,6 @@
+from .option_serializer import OptionSerializer
+
+
+class OptionExportSerializer(OptionSerializer):
+    class Meta(OptionSerializer.Meta):
+        fields = OptionSerializer.Meta.fields + ("is_correct",)
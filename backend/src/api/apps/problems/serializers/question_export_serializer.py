@@ -0,0 +1,10 @@
+from .option_export_serializer import OptionExportSerializer
+from .question_serializer import QuestionSerializer
+
+
+class QuestionExportSerializer(QuestionSerializer):
+    # the question details plus the answers, everything a copy of the bank needs
+    options = OptionExportSerializer(many=True)
+
+    class Meta(QuestionSerializer.Meta):
+        fields = QuestionSerializer.Meta.fields + ("correct_answer", "solution", "options")
@@ -0,0 +1,76 @@
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+from .question_serializer import QuestionSerializer
+
+
+class QuestionRowsSerializer:
+    # Produces the same data as serializer_class(many=True).data, but from values() rows and without DRF's per-field
+    # machinery for fields whose representation is the database value itself. Field names, sources and order are
+    # read from the serializer, so it stays the only description of the schema. Nested objects (e.g. the category)
+    # are built once and shared by all rows referencing them.
+    identity_fields = (serializers.CharField, serializers.IntegerField, serializers.ChoiceField,
+                       serializers.BooleanField)
+
+    # building fields of a ModelSerializer is expensive, so the description is built once per serializer class
+    descriptions = {}
+
+    def __init__(self, serializer_class=QuestionSerializer, fields=None):
+        if serializer_class not in self.descriptions:
+            self.descriptions[serializer_class] = [
+                self.__describe_field(field) for field in serializer_class().fields.values()
+            ]
+
+        # fields limits the description to some of the fields, like the fields argument of the serializer does
+        self.__fields = [
+            description for description in self.descriptions[serializer_class]
+            if fields is None or description[0] in fields
+        ]
+        self.columns = tuple(column for _, column, _, nested_fields in self.__fields if not nested_fields) + tuple(
+            column for _, _, _, nested_fields in self.__fields for _, column, _, _ in nested_fields or ()
+        )
+
+    def select(self, queryset, *extra_columns):
+        return queryset.values(*self.columns, *[column for column in extra_columns if column not in self.columns])
+
+    def to_representation(self, rows):
+        nested_objects = {}
+
+        return [self.__to_item(row, self.__fields, nested_objects) for row in rows]
+
+    def __to_item(self, row, fields, nested_objects):
+        item = {}
+
+        for name, column, converter, nested_fields in fields:
+            if nested_fields:
+                item[name] = self.__to_nested_item(row, name, nested_fields, nested_objects)
+                continue
+
+            value = row[column]
+            item[name] = converter(value) if converter is not None and value is not None else value
+
+        return item
+
+    def __to_nested_item(self, row, name, fields, nested_objects):
+        key = (name,) + tuple(row[column] for _, column, _, _ in fields)
+
+        if key not in nested_objects:
+            is_empty = all(value is None for value in key[1:])
+            nested_objects[key] = None if is_empty else self.__to_item(row, fields, nested_objects)
+
+        return nested_objects[key]
+
+    def __describe_field(self, field, prefix=""):
+        if field.source == "*" or isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            raise ImproperlyConfigured(f"Field '{field.field_name}' can't be rendered from database rows.")
+
+        column = f"{prefix}{field.source.replace('.', '__')}"
+
+        if isinstance(field, serializers.BaseSerializer):
+            return field.field_name, column, None, [
+                self.__describe_field(nested_field, f"{column}__") for nested_field in field.fields.values()
+            ]
+
+        converter = None if type(field) in self.identity_fields else field.to_representation
+
+        return field.field_name, column, converter, None
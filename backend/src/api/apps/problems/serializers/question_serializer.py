@@ -3,9 +3,10 @@ from rest_framework import serializers
 from api.apps.problems.models import Question
 from .category_serializer import CategorySerializer
 from .option_serializer import OptionSerializer
+from .sparse_fieldset_serializer_mixin import SparseFieldsetSerializerMixin
 
 
-class QuestionSerializer(serializers.ModelSerializer):
+class QuestionSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     category = CategorySerializer()
     question = serializers.CharField(max_length=2048, source="text")
 
@@ -0,0 +1,9 @@
+class SparseFieldsetSerializerMixin:
+    # Takes an optional fields argument and drops all the other fields, see SparseFieldsetsMixin.
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
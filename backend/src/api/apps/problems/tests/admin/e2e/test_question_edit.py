@@ -2,7 +2,7 @@ from collections import namedtuple
 from typing import List
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import ui
+from selenium.webdriver.support import expected_conditions as ec, ui
 
 from api.apps.problems.models import Category, Question
 from .admin_e2e_base_test_case import AdminE2EBaseTestCase
@@ -35,6 +35,9 @@ class QuestionEditTestCase(AdminE2EBaseTestCase):
     category_block_locator = (By.CLASS_NAME, "field-category", "Category")
     category_element_id = "id_category"
     category_element_locator = (By.ID, category_element_id)
+    category_dropdown_locator = (By.CSS_SELECTOR, ".field-category .select2-selection", "Category autocomplete")
+    category_search_locator = (By.CSS_SELECTOR, ".select2-search__field", "Category search")
+    category_options_locator = (By.CSS_SELECTOR, ".select2-results__option[role=option]", "Category options")
 
     question_block_locator = (By.CLASS_NAME, "field-text", "Question")
     question_element_id = "id_text"
@@ -158,24 +161,30 @@ class QuestionEditTestCase(AdminE2EBaseTestCase):
         self.assertRequired(category_element)
         self.assertLabelForFieldMarkedRequired(self.category_element_id)
 
-        # check that if there are no categories added yet category select box should show one empty option by default
-        expected_options = {("", "---------")}
-        actual_options = set(
-            [(option.get_attribute("value"), option.text) for option in ui.Select(category_element).options])
-
-        self.assertEqual(expected_options, actual_options)
+        # categories are loaded by the autocomplete, so the select box doesn't have any options until one is chosen
+        self.assertEqual([], ui.Select(category_element).options)
 
     def test_category_select_should_be_fulfilled_with_all_categories(self):
         self.create_default_categories()
         self.open_add_question_page()
 
-        category_select = self.find_category_select()
+        self.open_category_dropdown()
 
-        expected_options = set(["---------"] + self.default_categories)
-        actual_options = set([option.text for option in category_select.options])
+        expected_options = set(self.default_categories)
+        actual_options = set(self.get_category_dropdown_options())
 
         self.assertEqual(expected_options, actual_options)
 
+    def test_category_select_should_be_filtered_by_name_prefix(self):
+        self.create_default_categories()
+        self.open_add_question_page()
+
+        self.open_category_dropdown()
+        self.find_element(self.category_search_locator).send_keys("elementary")
+
+        self.wait.until(lambda driver: len(self.get_category_dropdown_options()) == 2)
+        self.assertEqual(["Elementary Algebra", "Elementary Geometry"], self.get_category_dropdown_options())
+
     # noinspection DuplicatedCode
     def test_question_field_should_be_required_textarea_with_empty_text_by_default(self):
         self.open_add_question_page()
@@ -693,9 +702,23 @@ class QuestionEditTestCase(AdminE2EBaseTestCase):
     def open_add_question_page(self):
         self.open_page("/admin/problems/question/add/")
 
+    def open_category_dropdown(self):
+        self.find_element(self.category_dropdown_locator).click()
+        self.wait.until(ec.visibility_of_element_located(self.category_search_locator[:2]))
+
+    def get_category_dropdown_options(self):
+        # select2 shows a "Searching…" item while a page of categories is being loaded
+        loading_locator = (By.CSS_SELECTOR, ".select2-results__option.loading-results")
+        self.wait.until_not(ec.presence_of_element_located(loading_locator))
+
+        return [option.text for option in self.selenium.find_elements(*self.category_options_locator[:2])]
+
     def set_category_value_by_name(self, name):
-        category_select = self.find_category_select()
-        category_select.select_by_visible_text(name)
+        self.open_category_dropdown()
+        self.find_element(self.category_search_locator).send_keys(name)
+
+        option_locator = (By.XPATH, f"//li[contains(@class, 'select2-results__option') and text()='{name}']")
+        self.wait.until(ec.element_to_be_clickable(option_locator)).click()
 
     def get_category_name(self):
         category_select = self.find_category_select()
@@ -4,6 +4,7 @@ from collections import OrderedDict
 class QuestionConverter:
     LIST_ITEM_FIELDS = ("id", "category", "type", "question", "complexity", "number_of_points", "max_attempts_to_solve")
     ITEM_DETAILS_FIELDS = LIST_ITEM_FIELDS + ("options",)
+    EXPORT_ITEM_FIELDS = LIST_ITEM_FIELDS + ("correct_answer", "solution", "export_options")
 
     def __init__(self):
         self.__field_mappers = {
@@ -15,6 +16,9 @@ class QuestionConverter:
             "number_of_points": self.__dummy_mapper("number_of_points"),
             "max_attempts_to_solve": self.__dummy_mapper("max_attempts_to_solve"),
             "options": self.__options_mapper,
+            "correct_answer": self.__dummy_mapper("correct_answer"),
+            "solution": self.__dummy_mapper("solution"),
+            "export_options": self.__export_options_mapper,
         }
 
     def __dummy_mapper(self, field_name):
@@ -35,12 +39,24 @@ class QuestionConverter:
             for option in question.options.all()
         ]
 
+    def __export_options_mapper(self, question):
+        return [
+            OrderedDict((("id", option.id), ("value", option.value), ("is_correct", option.is_correct)))
+            for option in question.options.all()
+        ]
+
     def to_list_item(self, question):
         return self.__convert(question, self.LIST_ITEM_FIELDS)
 
     def to_item_details(self, question):
         return self.__convert(question, self.ITEM_DETAILS_FIELDS)
 
+    def to_export_item(self, question):
+        item = self.__convert(question, self.EXPORT_ITEM_FIELDS)
+        item["options"] = item.pop("export_options")
+
+        return item
+
     def __convert(self, question, fields):
         return OrderedDict([
             (field_name, self.__field_mappers[field_name](question))
@@ -0,0 +1,116 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.apps.problems.admin import CategoryAutocompleteView
+from api.apps.problems.models import Category, Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.shared.testing import QueryBudgetMixin
+
+AUTOCOMPLETE_PARAMS = {"app_label": "problems", "model_name": "question", "field_name": "category"}
+
+
+class AdminCategoryAutocompleteTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self) -> None:
+        CategoryAutocompleteView.clear_cache()
+
+        self.api = ApiHelper()
+        self.number_of_categories = 0
+
+        for name in ["Linear Algebra", "elementary algebra", "Algebraic Geometry", "Calculus"]:
+            self.api.create_category(name)
+
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "password"))
+
+    def test_categories_should_be_found_by_case_insensitive_prefix(self):
+        self.assertEqual(["Algebraic Geometry"], self.autocomplete("ALGEB"))
+        self.assertEqual(["Algebraic Geometry", "Calculus", "elementary algebra", "Linear Algebra"],
+                         self.autocomplete(""))
+        self.assertEqual([], self.autocomplete("geometry"))
+
+    def test_categories_should_be_paginated(self):
+        self.add_categories(25)
+
+        first_page = self.get_autocomplete("category")
+        second_page = self.get_autocomplete("category", page=2)
+
+        self.assertEqual(20, len(first_page["results"]))
+        self.assertTrue(first_page["pagination"]["more"])
+        self.assertEqual(5, len(second_page["results"]))
+        self.assertFalse(second_page["pagination"]["more"])
+
+    def test_prefix_search_should_use_the_name_index(self):
+        view = CategoryAutocompleteView()
+        view.request, view.term = None, "alg"
+        view.model_admin = admin.site._registry[Category]
+        view.source_field = Question._meta.get_field("category")
+
+        with connection.cursor() as cursor:
+            sql, params = view.get_queryset().query.sql_with_params()
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+
+        self.assertIn("problems_ca_name_lower_idx", plan)
+
+    def test_pages_should_be_reused_until_they_expire(self):
+        self.assertEqual(["Calculus"], self.autocomplete("calc"))
+        self.api.create_category("Calculus of Variations")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(["Calculus"], self.autocomplete("Calc "))
+
+        # the session and the user are read, the categories aren't
+        self.assertFalse(any("problems_categories" in query["sql"] for query in queries))
+
+        with override_settings(PROBLEMS_CATEGORY_AUTOCOMPLETE_CACHE_SECONDS=0):
+            CategoryAutocompleteView.clear_cache()
+            self.assertEqual(["Calculus", "Calculus of Variations"], self.autocomplete("calc"))
+
+    def test_cached_pages_should_not_be_served_without_permissions(self):
+        self.autocomplete("calc")
+        self.client.logout()
+
+        response = self.client.get(reverse("admin:problems_category_autocomplete"),
+                                   {**AUTOCOMPLETE_PARAMS, "term": "calc"})
+
+        self.assertEqual(302, response.status_code)
+
+    def test_add_question_page_should_not_render_categories(self):
+        url = reverse("admin:problems_question_add")
+        response = self.client.get(url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotContains(response, "Linear Algebra")
+        self.assertContains(response, reverse("admin:problems_category_autocomplete"))
+        self.assertNotContains(response, "add_id_category")
+        self.assertNotContains(response, "change_id_category")
+
+        # the session and the user, the form is rendered in a transaction
+        self.assertQueryBudget(4, lambda: self.client.get(url), lambda: self.add_categories(10))
+
+    def test_change_question_page_should_render_only_the_selected_category(self):
+        category = Category.objects.get(name="Calculus")
+        question = self.api.create_question(category, Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+
+        response = self.client.get(reverse("admin:problems_question_change", args=[question.id]))
+
+        self.assertContains(response, f'<option value="{category.id}" selected>Calculus</option>', html=True)
+        self.assertNotContains(response, "Linear Algebra")
+
+    def add_categories(self, n):
+        for _ in range(n):
+            self.number_of_categories += 1
+            self.api.create_category(f"Category #{self.number_of_categories:02}")
+
+    def autocomplete(self, term):
+        return [result["text"] for result in self.get_autocomplete(term)["results"]]
+
+    def get_autocomplete(self, term, page=1):
+        response = self.client.get(reverse("admin:problems_category_autocomplete"),
+                                   {**AUTOCOMPLETE_PARAMS, "term": term, "page": page})
+        self.assertEqual(200, response.status_code)
+
+        return response.json()
@@ -0,0 +1,102 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase
+from django.urls import reverse
+
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.validation import CORRECT_ANSWER_FIELDS
+
+INTEGER_CORRECT_ANSWER_PATTERN = re.compile(r'name="integer_correct_answer" value="(\d+)"')
+
+
+class AdminQuestionFormTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.editor = User.objects.create_superuser("editor", "editor@example.com", "password")
+
+    def test_forms_built_for_different_questions_should_not_share_answers(self):
+        first = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+        second = self.api.create_question(self.algebra, Question.QuestionType.TEXT.value, "Name of x in 2x = 4?",
+                                          "unknown")
+        first.refresh_from_db()
+        second.refresh_from_db()
+        model_admin = admin.site._registry[Question]
+        request = RequestFactory().get("/")
+        request.user = self.editor
+
+        # the forms of two requests built in an interleaved order, as two threads could do it
+        first_form_class = model_admin.get_form(request, first, change=True)
+        second_form_class = model_admin.get_form(request, second, change=True)
+        first_form, second_form = first_form_class(instance=first), second_form_class(instance=second)
+
+        self.assertEqual("4", first_form["integer_correct_answer"].value())
+        self.assertIsNone(first_form["text_correct_answer"].value())
+        self.assertIsNone(second_form["integer_correct_answer"].value())
+        self.assertEqual("unknown", second_form["text_correct_answer"].value())
+
+        for field in CORRECT_ANSWER_FIELDS.values():
+            self.assertIsNone(field.initial)
+
+    def test_category_manage_buttons_should_stay_disabled(self):
+        self.client.force_login(self.editor)
+        response = self.client.get(reverse("admin:problems_question_add"))
+
+        self.assertNotContains(response, "add_id_category")
+        self.assertNotContains(response, "change_id_category")
+        self.assertNotContains(response, "delete_id_category")
+
+
+class AdminQuestionFormConcurrencyTestCase(TransactionTestCase):
+    number_of_questions = 16
+    number_of_threads = 8
+    number_of_rounds = 4
+
+    def setUp(self) -> None:
+        api = ApiHelper()
+        algebra = api.create_category("Algebra")
+        editor = User.objects.create_superuser("editor", "editor@example.com", "password")
+
+        self.answers = {
+            api.create_question(algebra, Question.QuestionType.INTEGER.value, f"{i} + {i} = ?", i * 2).id: i * 2
+            for i in range(1, self.number_of_questions + 1)
+        }
+        # Client isn't thread safe, every thread gets its own one, logged in before the threads start
+        self.clients = [Client() for _ in range(self.number_of_threads)]
+
+        for client in self.clients:
+            client.force_login(editor)
+
+    def test_change_forms_opened_in_parallel_should_render_their_own_answers(self):
+        barrier = threading.Barrier(self.number_of_threads, timeout=30)
+
+        def open_change_forms(thread_number):
+            client = self.clients[thread_number]
+            barrier.wait()
+            rendered = []
+
+            for round_number in range(self.number_of_rounds):
+                for i, pk in enumerate(self.answers):
+                    if (i + round_number) % self.number_of_threads != thread_number:
+                        continue
+
+                    response = client.get(reverse("admin:problems_question_change", args=[pk]))
+                    rendered.append((pk, response.status_code, INTEGER_CORRECT_ANSWER_PATTERN.findall(
+                        response.content.decode())))
+
+            return rendered
+
+        with ThreadPoolExecutor(self.number_of_threads) as executor:
+            results = [rendered for thread_results in executor.map(open_change_forms, range(self.number_of_threads))
+                       for rendered in thread_results]
+
+        self.assertEqual(self.number_of_questions * self.number_of_rounds, len(results))
+
+        for pk, status_code, answers in results:
+            self.assertEqual(200, status_code)
+            self.assertEqual([str(self.answers[pk])], answers)
@@ -0,0 +1,129 @@
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question, Option
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+from api.apps.shared.testing import QueryBudgetMixin
+
+
+class AdminQuestionOptionsTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.MULTIPLE_CHOICE.value,
+                                                 "Which of the numbers are prime?")
+        self.two = self.api.create_option(self.question, "2", True)
+        self.four = self.api.create_option(self.question, "4", False)
+        self.six = self.api.create_option(self.question, "6", False)
+        self.number_of_saves = 0
+
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "password"))
+
+    def test_options_should_be_written_with_one_statement_per_kind_of_change(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.save_question([
+                (self.two, "2", True, False),
+                (self.four, "3", True, False),
+                (self.six, "6", False, True),
+                (None, "5", True, False),
+            ])
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual({("2", True), ("3", True), ("5", True)},
+                         set(self.question.options.values_list("value", "is_correct")))
+        self.assertEqual(self.four.id, Option.objects.get(value="3").id)
+
+        self.assertEqual(1, self.count_writes(queries, "INSERT INTO"))
+        self.assertEqual(1, self.count_writes(queries, "UPDATE"))
+        self.assertEqual(1, self.count_writes(queries, "DELETE FROM"))
+
+    def test_switching_to_a_simple_type_should_delete_all_options_at_once(self):
+        options = [(option, option.value, option.is_correct, False) for option in [self.two, self.four, self.six]]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.save_question(options, type=Question.QuestionType.INTEGER.value,
+                                          integer_correct_answer=2)
+
+        self.assertEqual(302, response.status_code)
+        self.assertFalse(self.question.options.exists())
+        self.assertEqual(1, self.count_writes(queries, "DELETE FROM"))
+        self.assertEqual(0, self.count_writes(queries, "UPDATE"))
+
+    def test_value_of_another_stored_option_should_be_rejected(self):
+        response = self.save_question([
+            (self.two, "2", True, False),
+            (self.four, "6", False, False),
+            (self.six, "4", False, False),
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "Option with this Question and Value already exists.")
+        self.assertEqual({"2", "4", "6"}, set(self.question.options.values_list("value", flat=True)))
+
+    def test_changed_options_should_invalidate_the_cached_question(self):
+        url = ProblemsAppUrls.question_details_url(self.question.id)
+        self.client.get(url)
+
+        self.save_question([
+            (self.two, "2", True, False),
+            (self.four, "3", True, False),
+            (self.six, "6", False, False),
+        ])
+
+        values = [option["value"] for option in self.client.get(url).json()["options"]]
+        self.assertIn("3", values)
+
+    def test_saving_should_not_make_queries_per_option(self):
+        def run():
+            self.number_of_saves += 1
+            options = [(option, f"{option.value}/{self.number_of_saves}", option.is_correct, False)
+                       for option in self.question.options.order_by("id")]
+
+            self.assertEqual(302, self.save_question(options).status_code)
+
+        def add_options():
+            for _ in range(3):
+                self.api.create_option(self.question, f"{Option.objects.count()}", False)
+
+        # the options listed by the test, the session, the user, the question with its category, the options loaded
+        # and checked for duplicates, the writes, the admin log and the savepoints of the transactions
+        self.assertQueryBudget(15, run, add_options)
+
+    def save_question(self, options, **fields):
+        data = {
+            "category": self.algebra.id,
+            "text": self.question.text,
+            "type": self.question.type,
+            "complexity": self.question.complexity,
+            "number_of_points": self.question.number_of_points,
+            "options-TOTAL_FORMS": len(options),
+            "options-INITIAL_FORMS": sum(option is not None for option, *_ in options),
+            "options-MIN_NUM_FORMS": 0,
+            "options-MAX_NUM_FORMS": 1000,
+            **fields,
+        }
+
+        for i, (option, value, is_correct, delete) in enumerate(options):
+            data[f"options-{i}-id"] = option.id if option else ""
+            data[f"options-{i}-question"] = self.question.id
+            data[f"options-{i}-value"] = value
+
+            if is_correct:
+                data[f"options-{i}-is_correct"] = "on"
+
+            if delete:
+                data[f"options-{i}-DELETE"] = "on"
+
+        return self.client.post(reverse("admin:problems_question_change", args=[self.question.id]), data)
+
+    @staticmethod
+    def count_writes(queries, statement):
+        return sum(query["sql"].startswith(f'{statement} "problems_questions_options"') for query in queries)
@@ -0,0 +1,59 @@
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from api.apps.problems.admin import EstimatedCountPaginator
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+
+
+class AdminQuestionsChangelistTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.logarithm = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value,
+                                                  "What is the logarithm of 100 to base 10?", 2)
+        self.sine = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value,
+                                             "What is the sine of 90 degrees?", 1)
+
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "password"))
+
+    def test_search_should_use_the_full_text_index(self):
+        self.assertEqual([self.logarithm.id], self.search("logarit"))
+        self.assertEqual([self.sine.id], self.search("sine degrees"))
+        self.assertEqual([], self.search("cosine"))
+
+    def test_search_by_number_should_find_the_question_with_this_id(self):
+        self.assertEqual([self.sine.id], self.search(str(self.sine.id)))
+
+    def test_search_by_digits_that_are_not_an_id_should_find_nothing(self):
+        self.assertEqual([], self.search("²"))
+        self.assertEqual([], self.search("99999999999999999999"))
+
+    def test_newest_questions_should_be_listed_first(self):
+        self.assertEqual([self.sine.id, self.logarithm.id], self.search(""))
+
+    def test_paginator_should_count_exactly_on_sqlite(self):
+        paginator = EstimatedCountPaginator(Question.objects.order_by("id"), 1)
+
+        self.assertEqual(2, paginator.count)
+        self.assertEqual(2, paginator.num_pages)
+
+    @skipUnless(connection.vendor == "postgresql", "estimates are taken from the Postgres planner")
+    def test_paginator_should_estimate_large_counts_on_postgres(self):
+        paginator = EstimatedCountPaginator(Question.objects.order_by("id"), 1)
+        paginator.estimate_threshold = -1
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Question._meta.db_table}")
+
+        self.assertGreaterEqual(paginator.count, 0)
+
+    def search(self, search_term):
+        response = self.client.get(reverse("admin:problems_question_changelist"), {"q": search_term})
+        self.assertEqual(200, response.status_code)
+
+        return [question.id for question in response.context["cl"].result_list]
@@ -0,0 +1,127 @@
+import threading
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework.permissions import IsAuthenticated
+
+from api.apps.problems.aio import DatabaseExecutor, database_executor
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+from api.apps.problems.views.questions import QuestionDetails
+
+
+@override_settings(PROBLEMS_ASYNC_DB_THREADS=0)
+class AsyncViewsTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value,
+                                                 "Which function is inverse to exponentiation?")
+        self.api.create_option(self.question, "Logarithm", True)
+
+    async def test_async_lists_should_return_the_same_data_as_sync_lists(self):
+        for async_url, sync_url in [
+            (ProblemsAppUrls.async_categories_list_url(), ProblemsAppUrls.categories_list_url()),
+            (ProblemsAppUrls.async_questions_list_url(), ProblemsAppUrls.questions_list_url()),
+        ]:
+            async_response = await self.async_client.get(async_url)
+            sync_response = await self.async_client.get(sync_url)
+
+            self.assertEqual(200, async_response.status_code)
+            self.assertEqual(sync_response.json(), async_response.json())
+
+    async def test_async_details_should_return_the_same_data_as_sync_details(self):
+        for async_url, sync_url in [
+            (ProblemsAppUrls.async_category_details_url(self.algebra.id),
+             ProblemsAppUrls.category_details_url(self.algebra.id)),
+            (ProblemsAppUrls.async_question_details_url(self.question.id),
+             ProblemsAppUrls.question_details_url(self.question.id)),
+        ]:
+            sync_response = await self.async_client.get(sync_url)
+            first_response = await self.async_client.get(async_url)
+            second_response = await self.async_client.get(async_url)
+
+            self.assertEqual(200, first_response.status_code)
+            self.assertEqual(200, second_response.status_code)
+            self.assertEqual(sync_response.content, first_response.content)
+            self.assertEqual(sync_response.content, second_response.content)
+            self.assertEqual(first_response["ETag"], second_response["ETag"])
+
+    async def test_cache_hits_should_be_served_without_the_executor(self):
+        url = ProblemsAppUrls.async_question_details_url(self.question.id)
+        await self.async_client.get(url)
+
+        with patch.object(database_executor, "run", side_effect=AssertionError("the executor must not be used")):
+            response = await self.async_client.get(url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("Which function is inverse to exponentiation?", response.json()["question"])
+
+    async def test_cache_hits_should_answer_conditional_requests(self):
+        url = ProblemsAppUrls.async_category_details_url(self.algebra.id)
+        etag = (await self.async_client.get(url))["ETag"]
+
+        response = await self.async_client.get(url, **{"if-none-match": etag})
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+
+    async def test_requests_the_cache_cant_answer_should_be_delegated_to_sync_views(self):
+        url = ProblemsAppUrls.async_question_details_url(self.question.id)
+        await self.async_client.get(url)
+
+        with patch.object(database_executor, "run", wraps=database_executor.run) as run:
+            partial = await self.async_client.get(f"{url}?fields=id")
+            html = await self.async_client.get(url, **{"accept": "text/html"})
+            not_canonical = await self.async_client.get(f"{url[:-len(str(self.question.id)) - 1]}0{self.question.id}/")
+
+        self.assertEqual(3, run.call_count)
+        self.assertEqual({"id": self.question.id}, partial.json())
+        self.assertIn("text/html", html["Content-Type"])
+        self.assertEqual(200, not_canonical.status_code)
+
+    async def test_cache_hits_should_be_served_only_when_the_permissions_let_anonymous_users_in(self):
+        url = ProblemsAppUrls.async_question_details_url(self.question.id)
+        await self.async_client.get(url)
+
+        with patch.object(QuestionDetails, "permission_classes", [IsAuthenticated]):
+            response = await self.async_client.get(url)
+
+        self.assertIn(response.status_code, (401, 403))
+
+    async def test_missing_objects_and_writes_should_be_handled_by_sync_views(self):
+        missing = await self.async_client.get(ProblemsAppUrls.async_question_details_url(self.question.id + 1))
+        create = await self.async_client.post(ProblemsAppUrls.async_categories_list_url(), {"name": "Geometry"})
+
+        self.assertEqual(404, missing.status_code)
+        self.assertEqual(403, create.status_code)
+
+
+class DatabaseExecutorTestCase(TransactionTestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.executor = DatabaseExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    async def test_calls_should_run_in_the_bounded_pool(self):
+        names = {(await self.executor.run(lambda: threading.current_thread().name)) for _ in range(10)}
+
+        self.assertTrue(names)
+        self.assertTrue(all(name.startswith("problems-db") for name in names))
+        self.assertLessEqual(len(names), 2)
+
+    @override_settings(PROBLEMS_ASYNC_DB_THREADS=2)
+    async def test_async_views_should_query_the_database_from_the_pool(self):
+        category = await self.executor.run(ApiHelper().create_category, "Algebra")
+
+        response = await self.async_client.get(ProblemsAppUrls.async_category_details_url(category.id))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("Algebra", response.json()["name"])
+        database_executor.shutdown()
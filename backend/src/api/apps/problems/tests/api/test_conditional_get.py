@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.http import http_date
+
+from api.apps.problems.models import Category, Question, Option
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class ConditionalGetTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value,
+                                                 "Which function is inverse to exponentiation?")
+        self.option = self.api.create_option(self.question, "Logarithm", True)
+
+    def test_every_endpoint_should_answer_matching_etag_with_304(self):
+        for url in self.get_all_urls():
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 200, url)
+            self.assertTrue(response.has_header("ETag"), url)
+            self.assertTrue(response.has_header("Last-Modified"), url)
+
+            not_modified_response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+            self.assertEqual(not_modified_response.status_code, 304, url)
+            self.assertEqual(not_modified_response["ETag"], response["ETag"], url)
+
+    def test_not_modified_list_should_be_answered_by_aggregate_queries_only(self):
+        url = ProblemsAppUrls.questions_list_url()
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(2) as queries:
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # the latest change is read from an index, rows aren't counted
+        self.assertFalse([query for query in queries.captured_queries if "COUNT(" in query["sql"]])
+
+    def test_questions_list_etag_should_change_when_a_question_is_deleted(self):
+        # the latest change stays the same, it's a later question
+        self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+        url = ProblemsAppUrls.questions_list_url()
+        etag = self.client.get(url)["ETag"]
+
+        self.question.delete()
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_not_modified_cached_details_should_be_answered_without_queries(self):
+        url = ProblemsAppUrls.question_details_url(self.question.id)
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_question_details_etag_should_change_when_options_change(self):
+        url = ProblemsAppUrls.question_details_url(self.question.id)
+
+        etag = self.client.get(url)["ETag"]
+        sine = self.api.create_option(self.question, "Sine", False)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self.client.get(url)["ETag"]
+        sine.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_question_details_should_be_modified_since_option_deletion(self):
+        url = ProblemsAppUrls.question_details_url(self.question.id)
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        # nothing that is left after the deletion has been changed recently
+        day_ago = timezone.now() - timedelta(days=1)
+        Category.objects.update(changed=day_ago)
+        Question.objects.update(changed=day_ago)
+        Option.objects.update(changed=day_ago)
+        self.option.delete()
+
+        hour_ago = http_date((timezone.now() - timedelta(hours=1)).timestamp())
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=hour_ago).status_code, 200)
+
+    def test_search_etag_should_change_when_matching_options_change(self):
+        url = f"{ProblemsAppUrls.questions_search_url()}?search=logarithm"
+        response = self.client.get(url)
+        self.assertEqual(1, len(response.json()))
+
+        self.option.value = "Logarithmic function"
+        self.option.save()
+        response = self.assert_modified(url, response["ETag"])
+
+        Option.objects.create(question=self.question, value="Sine", is_correct=False)
+        self.option.delete()
+        response = self.assert_modified(url, response["ETag"])
+        self.assertEqual([], response.json())
+
+    def test_questions_list_etag_should_change_when_category_is_renamed(self):
+        url = ProblemsAppUrls.questions_list_url()
+        etag = self.client.get(url)["ETag"]
+
+        self.algebra.name = "Elementary Algebra"
+        self.algebra.save()
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_questions_list_etag_should_depend_on_query_parameters(self):
+        url = ProblemsAppUrls.questions_list_url()
+
+        self.assertNotEqual(self.client.get(url)["ETag"], self.client.get(url, {"page_size": 1})["ETag"])
+
+    def test_details_of_not_existing_objects_should_return_404_without_etag(self):
+        for url in [ProblemsAppUrls.question_details_url(0), ProblemsAppUrls.category_details_url(0),
+                    ProblemsAppUrls.question_details_url(2 ** 63), ProblemsAppUrls.category_details_url(2 ** 63)]:
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 404, url)
+            self.assertFalse(response.has_header("ETag"), url)
+
+    def get_all_urls(self):
+        return [
+            ProblemsAppUrls.categories_list_url(),
+            ProblemsAppUrls.category_details_url(self.algebra.id),
+            ProblemsAppUrls.questions_list_url(),
+            f"{ProblemsAppUrls.questions_search_url()}?search=logarithm",
+            ProblemsAppUrls.question_details_url(self.question.id),
+        ]
+
+    def assert_modified(self, url, etag):
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response["ETag"])
+
+        return response
@@ -0,0 +1,79 @@
+from django.core.cache import caches
+from django.test import TestCase
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class DetailsCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value,
+                                                 "Which function is inverse to exponentiation?")
+        self.option = self.api.create_option(self.question, "Logarithm", True)
+
+    def test_question_details_should_be_served_from_cache_without_queries(self):
+        first_response = self.get_question()
+
+        with self.assertNumQueries(0):
+            second_response = self.get_question()
+
+        self.assertEqual(first_response.data, second_response.data)
+
+    def test_category_details_should_be_served_from_cache_without_queries(self):
+        first_response = self.client.get(ProblemsAppUrls.category_details_url(self.algebra.id))
+
+        with self.assertNumQueries(0):
+            second_response = self.client.get(ProblemsAppUrls.category_details_url(self.algebra.id))
+
+        self.assertEqual(first_response.data, second_response.data)
+
+    def test_question_change_should_invalidate_question_details(self):
+        self.get_question()
+
+        self.question.text = "Which function is inverse to the exponential function?"
+        self.question.save()
+
+        self.assertEqual(self.question.text, self.get_question().data["question"])
+
+    def test_option_changes_should_invalidate_question_details(self):
+        self.get_question()
+
+        self.option.value = "Natural logarithm"
+        self.option.save()
+        self.assertEqual(["Natural logarithm"], [option["value"] for option in self.get_question().data["options"]])
+
+        sine = self.api.create_option(self.question, "Sine", False)
+        self.assertEqual(2, len(self.get_question().data["options"]))
+
+        sine.delete()
+        self.assertEqual(1, len(self.get_question().data["options"]))
+
+    def test_category_rename_should_invalidate_details_of_its_questions_and_category(self):
+        self.get_question()
+        self.client.get(ProblemsAppUrls.category_details_url(self.algebra.id))
+
+        self.algebra.name = "Elementary Algebra"
+        self.algebra.save()
+
+        self.assertEqual("Elementary Algebra", self.get_question().data["category"]["name"])
+        self.assertEqual("Elementary Algebra",
+                         self.client.get(ProblemsAppUrls.category_details_url(self.algebra.id)).data["name"])
+
+    def test_deleted_question_should_not_be_served_from_cache(self):
+        question_id = self.get_question().data["id"]
+
+        self.question.delete()
+
+        self.assertEqual(404, self.client.get(ProblemsAppUrls.question_details_url(question_id)).status_code)
+
+    def get_question(self):
+        response = self.client.get(ProblemsAppUrls.question_details_url(self.question.id))
+        self.assertEqual(response.status_code, 200)
+
+        return response
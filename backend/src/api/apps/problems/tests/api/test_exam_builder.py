@@ -0,0 +1,90 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.apps.problems.models import Question
+from api.apps.problems.quiz import ExamBuilder, QuizSampler
+from api.apps.problems.tests.api.api_helper import ApiHelper
+
+
+class ExamBuilderTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.geometry = self.api.create_category("Geometry")
+
+        for category in (self.algebra, self.geometry):
+            for complexity in (Question.Complexity.EASY, Question.Complexity.MEDIUM, Question.Complexity.HARD):
+                for number_of_points in (1, 2, 3, 5):
+                    for i in range(3):
+                        self.api.create_question(category, Question.QuestionType.INTEGER.value,
+                                                 f"{complexity} #{i}", "1", complexity=complexity.value,
+                                                 number_of_points=number_of_points)
+
+    def test_exam_should_hit_total_points_and_complexity_mix(self):
+        mix = {"Easy": 30, "Medium": 50, "Hard": 20}
+
+        exam = ExamBuilder().build(40, mix, seed=1)
+
+        questions = Question.objects.in_bulk(exam.question_ids)
+        self.assertEqual(len(exam.question_ids), len(set(exam.question_ids)))
+        self.assertEqual({"Easy": 12, "Medium": 20, "Hard": 8}, exam.points_by_complexity)
+        for complexity, points in exam.points_by_complexity.items():
+            self.assertEqual(points, sum(
+                question.number_of_points for question in questions.values() if question.complexity == complexity
+            ))
+
+    def test_exam_should_be_built_from_given_questions_only(self):
+        exam = ExamBuilder(Question.objects.filter(category=self.geometry)).build(20, {"Hard": 100}, seed=3)
+
+        self.assertEqual({self.geometry.id}, set(
+            Question.objects.filter(id__in=exam.question_ids).values_list("category_id", flat=True)
+        ))
+
+    def test_questions_the_sampler_misses_should_be_picked_from_the_whole_bucket(self):
+        sample_ids = QuizSampler.sample_ids
+
+        def sample_one_id_at_most(sampler, n, pool_size=None):
+            return sample_ids(sampler, n, pool_size)[:1]
+
+        with patch.object(QuizSampler, "sample_ids", sample_one_id_at_most):
+            exam = ExamBuilder().build(30, {"Medium": 100}, seed=2)
+
+        questions = Question.objects.in_bulk(exam.question_ids)
+        self.assertEqual(len(exam.question_ids), len(questions))
+        self.assertEqual(30, sum(question.number_of_points for question in questions.values()))
+
+    def test_same_seed_should_build_same_exam(self):
+        mix = {"Easy": 50, "Hard": 50}
+
+        self.assertEqual(ExamBuilder().build(25, mix, seed=5), ExamBuilder().build(25, mix, seed=5))
+
+    def test_shares_should_always_sum_up_to_total_points(self):
+        exam = ExamBuilder().build(10, {"Easy": 33, "Medium": 33, "Hard": 34}, seed=1)
+
+        self.assertEqual(10, sum(exam.points_by_complexity.values()))
+
+    def test_infeasible_exam_should_be_rejected(self):
+        # there are 6 * (1 + 2 + 3 + 5) = 66 points of easy questions
+        with self.assertRaises(ValidationError):
+            ExamBuilder().build(67, {"Easy": 100})
+
+        with self.assertRaises(ValidationError):
+            ExamBuilder(Question.objects.filter(number_of_points=5)).build(7, {"Easy": 100})
+
+    def test_invalid_mix_should_be_rejected(self):
+        for mix in ({"Easy": 50}, {"Trivial": 100}, {"Easy": 120, "Hard": -20}):
+            with self.assertRaises(ValidationError):
+                ExamBuilder().build(10, mix)
+
+    def test_command_should_print_exam(self):
+        output = StringIO()
+
+        call_command("build_exam", points=12, mix="Easy=50,Hard=50", category=str(self.algebra.id), seed=1,
+                     repeat=2, stdout=output)
+
+        self.assertIn("Points by complexity: {'Easy': 6, 'Hard': 6}", output.getvalue())
+        self.assertIn("over 2 runs", output.getvalue())
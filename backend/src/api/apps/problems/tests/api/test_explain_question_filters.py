@@ -0,0 +1,21 @@
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from api.apps.problems.models import Category, Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+
+
+class ExplainQuestionFiltersTestCase(TestCase):
+    def test_command_should_require_the_number_of_rows(self):
+        with self.assertRaisesMessage(CommandError, "--rows"):
+            call_command("explain_question_filters")
+
+    def test_command_should_not_add_rows_to_a_bank_with_questions_unless_forced(self):
+        api = ApiHelper()
+        api.create_question(api.create_category("Algebra"), Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+
+        with self.assertRaisesMessage(CommandError, "--force"):
+            call_command("explain_question_filters", rows=10, categories=2)
+
+        self.assertEqual(1, Question.objects.count())
+        self.assertEqual(1, Category.objects.count())
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.renderers import fast_json_renderer
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    category = {"id": 1, "name": "Алгебра"}
+    data = {
+        "next": None,
+        "results": [
+            {"id": 1, "category": category, "question": "Line\u2028separator and paragraph\u2029separator"},
+            {"id": 2, "category": category, "question": "Em dash — and \"quotes\"", "points": Decimal("4.50")},
+            {"id": 3, "category": None, "created": datetime(2021, 7, 12, 19, 36, 0, 123456, tzinfo=timezone.utc),
+             "label": _("Correct Answer"), 4: [True, False, None]},
+        ],
+    }
+
+    def test_output_should_be_the_same_as_json_renderer_output(self):
+        self.assertEqual(JSONRenderer().render(self.data), FastJSONRenderer().render(self.data))
+
+    def test_output_without_orjson_should_be_the_same_as_json_renderer_output(self):
+        with mock.patch.object(fast_json_renderer, "orjson", None):
+            self.assertEqual(JSONRenderer().render(self.data), FastJSONRenderer().render(self.data))
+
+    def test_indented_output_should_be_the_same_as_json_renderer_output(self):
+        media_type = "application/json; indent=4"
+
+        self.assertEqual(JSONRenderer().render(self.data, media_type), FastJSONRenderer().render(self.data, media_type))
+
+    def test_none_should_be_rendered_as_empty_body(self):
+        self.assertEqual(b"", FastJSONRenderer().render(None))
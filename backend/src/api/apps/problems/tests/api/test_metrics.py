@@ -0,0 +1,122 @@
+import asyncio
+import json
+import os
+import tempfile
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.metrics import MetricsMiddleware, request_metrics
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+QUESTIONS_LIST_LABELS = 'view="problems:questions-list",method="GET",status="200"'
+METRICS_TOKEN = "scrape-token"
+
+
+@override_settings(PROBLEMS_ASYNC_DB_THREADS=0, PROBLEMS_METRICS_TOKEN=METRICS_TOKEN)
+class MetricsTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+        request_metrics.reset()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+
+    def test_metrics_should_be_exported_by_url_name(self):
+        response = self.client.get(ProblemsAppUrls.questions_list_url())
+        metrics = self.get_metrics()
+
+        self.assertEqual(1, metrics[f"problems_http_request_duration_seconds_count{{{QUESTIONS_LIST_LABELS}}}"])
+        self.assertEqual(1, metrics[f'problems_http_request_duration_seconds_bucket{{{QUESTIONS_LIST_LABELS},le="+Inf"}}'])
+        self.assertGreater(metrics[f"problems_http_request_duration_seconds_sum{{{QUESTIONS_LIST_LABELS}}}"], 0)
+        self.assertGreater(metrics[f"problems_http_request_db_queries_total{{{QUESTIONS_LIST_LABELS}}}"], 0)
+        self.assertGreater(metrics[f"problems_http_request_db_seconds_total{{{QUESTIONS_LIST_LABELS}}}"], 0)
+        self.assertEqual(len(response.content),
+                         metrics[f"problems_http_response_bytes_total{{{QUESTIONS_LIST_LABELS}}}"])
+
+    def test_histogram_buckets_should_be_cumulative(self):
+        for _ in range(3):
+            self.client.get(ProblemsAppUrls.questions_list_url())
+
+        metrics = self.get_metrics()
+        buckets = [value for name, value in metrics.items()
+                   if name.startswith(f"problems_http_request_duration_seconds_bucket{{{QUESTIONS_LIST_LABELS}")]
+
+        self.assertEqual(len(request_metrics.buckets) + 1, len(buckets))
+        self.assertEqual(sorted(buckets), buckets)
+        self.assertEqual(3, buckets[-1])
+
+    def test_unresolved_paths_should_be_recorded_together(self):
+        self.client.get("/api/problems/unknown/")
+        self.client.get("/unknown/")
+
+        metrics = self.get_metrics()
+
+        self.assertEqual(2, metrics['problems_http_request_duration_seconds_count'
+                                    '{view="unresolved",method="GET",status="404"}'])
+
+    async def test_queries_of_async_views_should_be_counted(self):
+        await self.async_client.get(ProblemsAppUrls.async_question_details_url(self.question.id))
+
+        metrics = self.get_metrics(await self.async_client.get(reverse("metrics"),
+                                                               authorization=f"Bearer {METRICS_TOKEN}"))
+        labels = 'view="problems:async-question-details",method="GET",status="200"'
+
+        self.assertGreater(metrics[f"problems_http_request_db_queries_total{{{labels}}}"], 0)
+
+    async def test_middleware_should_run_on_the_event_loop_under_asgi(self):
+        async def get_response(request):
+            return HttpResponse(b"1234")
+
+        middleware = MetricsMiddleware(get_response)
+        await middleware(RequestFactory().get("/unknown/"))
+
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        self.assertEqual(4, request_metrics.collect()[("unresolved", "GET", 200)][5])
+
+    def test_metrics_should_be_forbidden_without_the_token(self):
+        for authorization in [None, "Bearer wrong", METRICS_TOKEN, f"Basic {METRICS_TOKEN}"]:
+            extra = {} if authorization is None else {"HTTP_AUTHORIZATION": authorization}
+
+            self.assertEqual(403, self.client.get(reverse("metrics"), **extra).status_code, authorization)
+
+    @override_settings(PROBLEMS_METRICS_TOKEN=None)
+    def test_metrics_should_not_be_exported_unless_the_token_is_set(self):
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ")
+
+        self.assertEqual(404, response.status_code)
+
+    def test_metrics_of_all_processes_should_be_summed_up(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(PROBLEMS_METRICS_DIR=directory):
+            other_process_series = [["problems:questions-list", "GET", 200, [1] + [0] * len(request_metrics.buckets),
+                                     1, 0.001, 2, 0.0005, 100]]
+
+            with open(os.path.join(directory, "metrics-1.json"), "w") as file:
+                json.dump(other_process_series, file)
+
+            response = self.client.get(ProblemsAppUrls.questions_list_url())
+            metrics = self.get_metrics()
+
+            self.assertTrue(os.path.exists(os.path.join(directory, f"metrics-{os.getpid()}.json")))
+
+        self.assertEqual(2, metrics[f"problems_http_request_duration_seconds_count{{{QUESTIONS_LIST_LABELS}}}"])
+        self.assertEqual(len(response.content) + 100,
+                         metrics[f"problems_http_response_bytes_total{{{QUESTIONS_LIST_LABELS}}}"])
+
+    def get_metrics(self, response=None):
+        response = response or self.client.get(reverse("metrics"), HTTP_AUTHORIZATION=f"Bearer {METRICS_TOKEN}")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("text/plain; version=0.0.4; charset=utf-8", response["Content-Type"])
+
+        return {
+            name: float(value)
+            for name, value in (line.rsplit(" ", 1) for line in response.content.decode().splitlines())
+            if not name.startswith("#")
+        }
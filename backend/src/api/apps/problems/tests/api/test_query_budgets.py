@@ -0,0 +1,103 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+from api.apps.shared.testing import QueryBudgetMixin
+
+
+class QueryBudgetsTestCase(QueryBudgetMixin, TestCase):
+    # Budgets of the endpoints of the problems: none of them may make queries per row, so every budget is checked
+    # with more and more rows. Details are requested with an empty problems cache.
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question_ids = []
+        self.question = self.create_choice_question(self.algebra)
+        self.number_of_rows = 0
+
+        self.add_rows()
+
+    def test_categories_list_budget(self):
+        self.assertQueryBudget(2, lambda: self.get(ProblemsAppUrls.categories_list_url()), self.add_rows)
+
+    def test_category_details_budget(self):
+        self.assertQueryBudget(2, lambda: self.get(ProblemsAppUrls.category_details_url(self.algebra.id)),
+                               self.add_rows_and_clear_cache)
+
+    def test_questions_list_budget(self):
+        self.assertQueryBudget(3, lambda: self.get(ProblemsAppUrls.questions_list_url()), self.add_rows)
+
+    def test_questions_list_with_filters_and_sparse_fields_budget(self):
+        url = f"{ProblemsAppUrls.questions_list_url()}?category={self.algebra.id}&fields=id,category,question"
+        self.assertQueryBudget(3, lambda: self.get(url), self.add_rows)
+
+    def test_question_details_budget(self):
+        self.assertQueryBudget(3, lambda: self.get(ProblemsAppUrls.question_details_url(self.question.id)),
+                               self.add_rows_and_clear_cache)
+
+    def test_questions_search_budget(self):
+        # freshness of categories, questions and options, the full text search and the matching questions
+        self.assertQueryBudget(5, lambda: self.get(f"{ProblemsAppUrls.questions_search_url()}?search=function"),
+                               self.add_rows)
+
+    def test_questions_batch_budget(self):
+        self.assertQueryBudget(2, lambda: self.get(f"{ProblemsAppUrls.questions_batch_url()}?ids={self.ids}"),
+                               self.add_rows)
+
+    def test_questions_grade_budget(self):
+        def run():
+            answers = [{"id": pk, "answer": "1"} for pk in self.question_ids]
+            response = self.client.post(ProblemsAppUrls.questions_grade_url(), json.dumps({"answers": answers}),
+                                        content_type="application/json")
+            self.assertEqual(200, response.status_code)
+
+        # answer keys of all questions are compiled again after the new rows invalidated them
+        self.assertQueryBudget(2, run, self.add_rows)
+
+    def test_quiz_budget(self):
+        self.assertQueryBudget(3, lambda: self.get(f"{ProblemsAppUrls.quiz_url()}?n=2&seed=1"), self.add_rows)
+
+    def test_admin_questions_changelist_budget(self):
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "password"))
+
+        # the session and the user are a part of every admin request, categories fill the filter, the count is taken once
+        self.assertQueryBudget(5, lambda: self.get(reverse("admin:problems_question_changelist")), self.add_rows)
+
+    def add_rows(self):
+        for _ in range(3):
+            self.number_of_rows += 1
+            category = self.api.create_category(f"Category #{self.number_of_rows}")
+            self.create_choice_question(category)
+            self.create_choice_question(self.algebra)
+
+    def add_rows_and_clear_cache(self):
+        self.add_rows()
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+    def create_choice_question(self, category):
+        question = self.api.create_question(category, Question.QuestionType.MULTIPLE_CHOICE.value,
+                                            f"Which function is inverse to function #{Question.objects.count()}?")
+        self.api.create_option(question, "Logarithm", True)
+        self.api.create_option(question, "Sine", False)
+        self.question_ids.append(question.id)
+
+        return question
+
+    @property
+    def ids(self):
+        return ",".join(str(pk) for pk in self.question_ids)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+
+        return response
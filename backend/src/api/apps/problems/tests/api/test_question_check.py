@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from api.apps.problems.answers import answer_index
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionCheckTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+        answer_index.clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+
+    def test_integer_answer_should_be_compared_numerically(self):
+        question = self.create_question(Question.QuestionType.INTEGER, "42", number_of_points=3)
+
+        self.assertEqual({"id": question.id, "correct": True, "points": 3}, self.check(question, "42").json())
+        self.assertTrue(self.check(question, 42).data["correct"])
+        self.assertTrue(self.check(question, " 42.0 ").data["correct"])
+        self.assertEqual({"id": question.id, "correct": False, "points": 0}, self.check(question, 41).json())
+
+    @override_settings(PROBLEMS_DECIMAL_ANSWER_TOLERANCE=Decimal("0.01"))
+    def test_decimal_answer_should_be_compared_with_tolerance(self):
+        question = self.create_question(Question.QuestionType.DECIMAL, "3.14")
+
+        self.assertTrue(self.check(question, "3.14").data["correct"])
+        self.assertTrue(self.check(question, 3.141).data["correct"])
+        self.assertTrue(self.check(question, "3.13").data["correct"])
+        self.assertFalse(self.check(question, "3.16").data["correct"])
+
+    def test_boolean_answer_should_accept_yes_and_no(self):
+        question = self.create_question(Question.QuestionType.BOOLEAN, "Yes")
+
+        self.assertTrue(self.check(question, "yes").data["correct"])
+        self.assertTrue(self.check(question, True).data["correct"])
+        self.assertFalse(self.check(question, " NO ").data["correct"])
+        self.assertEqual(400, self.check(question, "maybe").status_code)
+
+    def test_text_answer_should_be_normalized(self):
+        question = self.create_question(Question.QuestionType.TEXT, "Right  Triangle")
+
+        self.assertTrue(self.check(question, "  right triangle").data["correct"])
+        self.assertFalse(self.check(question, "right-triangle").data["correct"])
+
+    def test_choice_answers_should_compare_option_sets(self):
+        single = self.create_question(Question.QuestionType.SINGLE_CHOICE)
+        right, wrong = self.api.create_option(single, "2", True), self.api.create_option(single, "3", False)
+        multiple = self.create_question(Question.QuestionType.MULTIPLE_CHOICE)
+        first, second = self.api.create_option(multiple, "2", True), self.api.create_option(multiple, "4", True)
+        self.api.create_option(multiple, "5", False)
+
+        self.assertTrue(self.check(single, right.id).data["correct"])
+        self.assertTrue(self.check(single, [str(right.id)]).data["correct"])
+        self.assertFalse(self.check(single, [right.id, wrong.id]).data["correct"])
+        self.assertTrue(self.check(multiple, [second.id, first.id]).data["correct"])
+        self.assertFalse(self.check(multiple, [first.id]).data["correct"])
+        self.assertEqual(400, self.check(multiple, ["first"]).status_code)
+
+    def test_malformed_answers_should_be_rejected(self):
+        question = self.create_question(Question.QuestionType.INTEGER, "42")
+
+        self.assertEqual(400, self.check(question, "forty two").status_code)
+        self.assertEqual(400, self.client.post(ProblemsAppUrls.question_check_url(question.id), {},
+                                               content_type="application/json").status_code)
+
+    def test_numbers_out_of_the_decimal_range_should_be_rejected(self):
+        question = self.create_question(Question.QuestionType.DECIMAL, "1.5")
+
+        for answer in ["1e999999999", "-1e999999999", "1e-999999999"]:
+            response = self.check(question, answer)
+
+            self.assertEqual(400, response.status_code, answer)
+            self.assertIn("A number is expected.", str(response.json()))
+
+        self.assertTrue(self.check(question, "15e-1").data["correct"])
+
+    def test_unknown_question_should_return_not_found(self):
+        for pk in (100500, 2 ** 63, "abc"):
+            self.assertEqual(404, self.client.post(ProblemsAppUrls.question_check_url(pk), {"answer": 1},
+                                                   content_type="application/json").status_code, pk)
+
+    def test_repeated_checks_should_not_query_database(self):
+        question = self.create_question(Question.QuestionType.SINGLE_CHOICE)
+        option = self.api.create_option(question, "2", True)
+        self.api.create_option(question, "3", False)
+        self.check(question, option.id)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.check(question, option.id).data["correct"])
+
+    def test_answer_index_should_be_refreshed_on_changes(self):
+        question = self.create_question(Question.QuestionType.INTEGER, "42")
+        self.assertTrue(self.check(question, 42).data["correct"])
+
+        question.correct_answer = "43"
+        question.save()
+        self.assertFalse(self.check(question, 42).data["correct"])
+
+        choice = self.create_question(Question.QuestionType.SINGLE_CHOICE)
+        first, second = self.api.create_option(choice, "2", True), self.api.create_option(choice, "3", False)
+        self.assertTrue(self.check(choice, first.id).data["correct"])
+
+        first.is_correct, second.is_correct = False, True
+        first.save()
+        second.save()
+        self.assertTrue(self.check(choice, second.id).data["correct"])
+
+        question.delete()
+        self.assertEqual(404, self.check(question, 43).status_code)
+
+    def create_question(self, question_type, correct_answer=None, number_of_points=1):
+        return self.api.create_question(self.algebra, question_type.value, "Question", correct_answer=correct_answer,
+                                        number_of_points=number_of_points)
+
+    def check(self, question, answer):
+        return self.client.post(ProblemsAppUrls.question_check_url(question.id), {"answer": answer},
+                                content_type="application/json")
@@ -0,0 +1,45 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from api.apps.problems.models import Question
+from api.apps.problems.serializers import QuestionRowsSerializer, QuestionSerializer, QuestionWithOptionsSerializer
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.tests.api.converters import QuestionConverter
+
+
+class QuestionRowsSerializerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.question_converter = QuestionConverter()
+
+        algebra = self.api.create_category("Algebra")
+        geometry = self.api.create_category("Geometry")
+
+        for i, question_type in enumerate(Question.QuestionType.values):
+            self.api.create_question(algebra if i % 2 else geometry, question_type, f"Question #{i}",
+                                     complexity=Question.Complexity.values[i % len(Question.Complexity.values)],
+                                     number_of_points=i + 1, max_attempts_to_solve=i or None)
+
+    def test_rows_should_be_rendered_exactly_like_question_serializer(self):
+        rows_serializer = QuestionRowsSerializer(QuestionSerializer)
+        questions = Question.objects.all_with_fk()
+
+        expected_data = [self.question_converter.to_list_item(question) for question in questions]
+        actual_data = rows_serializer.to_representation(rows_serializer.select(questions))
+
+        self.assertEqual(expected_data, actual_data)
+        self.assertEqual(JSONRenderer().render(QuestionSerializer(questions, many=True).data),
+                         JSONRenderer().render(actual_data))
+
+    def test_rows_of_the_same_category_should_share_category_object(self):
+        rows_serializer = QuestionRowsSerializer(QuestionSerializer)
+
+        data = rows_serializer.to_representation(rows_serializer.select(Question.objects.all()))
+        categories = {item["category"]["id"]: item["category"] for item in data}
+
+        self.assertTrue(all(item["category"] is categories[item["category"]["id"]] for item in data))
+
+    def test_serializer_with_nested_lists_should_not_be_supported(self):
+        with self.assertRaises(ImproperlyConfigured):
+            QuestionRowsSerializer(QuestionWithOptionsSerializer)
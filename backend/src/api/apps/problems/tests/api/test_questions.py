@@ -16,7 +16,9 @@ class QuestionsTestCase(TestCase):
         response = self.client.get(ProblemsAppUrls.questions_list_url())
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data["results"]), 0)
+        self.assertIsNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
 
     def test_questions_list_all_questions_should_be_returned_without_options_and_correct_answers(self):
         all_questions = self.create_bunch_of_questions()
@@ -28,7 +30,36 @@ class QuestionsTestCase(TestCase):
         ]
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(expected_response, response.data)
+        self.assertEqual(expected_response, response.data["results"])
+
+    def test_questions_list_should_be_paginated_by_cursor_in_both_directions(self):
+        all_questions = self.create_bunch_of_questions()
+
+        pages = self.__walk_pages(f"{ProblemsAppUrls.questions_list_url()}?page_size=4", "next")
+        walked_forward = [item["id"] for page in pages for item in page["results"]]
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual([question.id for question in all_questions], walked_forward)
+
+        pages = self.__walk_pages(pages[-1]["previous"], "previous")
+        walked_backward = [item["id"] for page in reversed(pages) for item in page["results"]]
+
+        self.assertEqual([question.id for question in all_questions[:4]], walked_backward)
+
+    def test_questions_with_the_same_created_date_should_be_ordered_by_id_across_pages(self):
+        all_questions = self.create_bunch_of_questions()
+        Question.objects.update(created=all_questions[0].created)
+
+        pages = self.__walk_pages(f"{ProblemsAppUrls.questions_list_url()}?page_size=2", "next")
+        walked = [item["id"] for page in pages for item in page["results"]]
+
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(sorted([question.id for question in all_questions], reverse=True), walked)
+
+    def test_questions_list_with_invalid_cursor_should_return_404(self):
+        response = self.client.get(f"{ProblemsAppUrls.questions_list_url()}?cursor=invalid")
+
+        self.assertEqual(response.status_code, 404)
 
     def test_single_question_of_simple_type_options_should_be_empty_list(self):
         questions = [question for question in self.create_bunch_of_questions() if
@@ -74,6 +105,18 @@ class QuestionsTestCase(TestCase):
             for response in actual_responses_data
         ]))
 
+    def __walk_pages(self, url, direction):
+        pages = []
+
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+            pages.append(response.data)
+            url = response.data[direction]
+
+        return pages
+
     def create_bunch_of_questions(self):
         algebra = self.api.create_category("Algebra")
         geometry = self.api.create_category("Geometry")
@@ -0,0 +1,63 @@
+from django.test import TestCase
+
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.tests.api.converters import QuestionConverter
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsBatchTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.question_converter = QuestionConverter()
+
+        algebra = self.api.create_category("Algebra")
+        geometry = self.api.create_category("Geometry")
+        self.questions = [
+            self.api.create_question(category, Question.QuestionType.SINGLE_CHOICE.value, f"Question #{i}")
+            for i, category in enumerate([algebra, geometry, algebra])
+        ]
+
+        for question in self.questions:
+            self.api.create_option(question, "Yes", True)
+            self.api.create_option(question, "No", False)
+
+    def test_batch_should_return_details_in_requested_order(self):
+        ids = [self.questions[2].id, self.questions[0].id, self.questions[1].id]
+
+        response = self.get_batch(",".join(map(str, ids)))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({
+            "results": [self.question_converter.to_item_details(Question.objects.get(pk=pk)) for pk in ids],
+            "missing": [],
+        }, response.json())
+
+    def test_missing_ids_should_be_reported(self):
+        response = self.get_batch(f"100500,{self.questions[0].id},100501")
+
+        self.assertEqual([self.questions[0].id], [item["id"] for item in response.data["results"]])
+        self.assertEqual([100500, 100501], response.data["missing"])
+
+    def test_ids_out_of_the_id_range_should_be_rejected(self):
+        response = self.get_batch(f"{self.questions[0].id},{2 ** 63}")
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn("ids", response.data)
+
+    def test_batch_should_run_one_query_for_questions_and_one_for_options(self):
+        with self.assertNumQueries(2):
+            self.get_batch(",".join(str(question.id) for question in self.questions))
+
+    def test_batch_should_support_sparse_fieldsets(self):
+        response = self.get_batch(str(self.questions[0].id), fields="id,type")
+
+        self.assertEqual([{"id": self.questions[0].id, "type": Question.QuestionType.SINGLE_CHOICE.value}],
+                         response.data["results"])
+
+    def test_invalid_ids_should_be_rejected(self):
+        for ids in ("", "1,a", ",".join(map(str, range(1, 502)))):
+            self.assertEqual(400, self.get_batch(ids).status_code)
+
+    def get_batch(self, ids, **params):
+        return self.client.get(ProblemsAppUrls.questions_batch_url(), {"ids": ids, **params})
@@ -0,0 +1,173 @@
+from unittest.mock import Mock, patch
+
+from django.contrib.admin import helpers
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.urls import reverse
+
+from api.apps.problems.bulk import QuestionsBulkEditor
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Category, Question, Option
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsBulkEditTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.geometry = self.api.create_category("Geometry")
+        self.questions = [self.create_question(self.algebra, i) for i in range(5)]
+        self.geometry_question = self.create_question(self.geometry, 5)
+
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "password"))
+
+    def test_update_should_be_committed_in_chunks(self):
+        progress = []
+        editor = QuestionsBulkEditor(chunk_size=2)
+
+        updated = editor.update(Question.objects.filter(category=self.algebra), {"category": self.geometry},
+                                progress.append)
+
+        self.assertEqual(5, updated)
+        self.assertEqual([2, 4, 5], progress)
+        self.assertEqual(6, Question.objects.filter(category=self.geometry).count())
+
+    def test_update_should_invalidate_cached_questions(self):
+        url = ProblemsAppUrls.question_details_url(self.questions[0].id)
+        self.client.get(url)
+        changed = Question.objects.get(id=self.questions[0].id).changed
+
+        QuestionsBulkEditor().update(Question.objects.all(), {"complexity": Question.Complexity.HARD.value})
+
+        self.assertEqual(Question.Complexity.HARD.value, self.client.get(url).json()["complexity"])
+        self.assertGreater(Question.objects.get(id=self.questions[0].id).changed, changed)
+
+    def test_delete_should_remove_questions_with_their_options_in_chunks(self):
+        progress = []
+
+        deleted = QuestionsBulkEditor(chunk_size=3).delete(Question.objects.filter(category=self.algebra),
+                                                          progress.append)
+
+        self.assertEqual(5, deleted)
+        self.assertEqual([3, 5], progress)
+        self.assertEqual([self.geometry_question.id], list(Question.objects.values_list("id", flat=True)))
+        self.assertEqual({self.geometry_question.id}, set(Option.objects.values_list("question_id", flat=True)))
+
+    def test_delete_should_invalidate_the_cache_once_per_chunk_instead_of_per_row(self):
+        url = ProblemsAppUrls.question_details_url(self.questions[0].id)
+        self.client.get(url)
+        receiver = Mock()
+        post_delete.connect(receiver, sender=Option)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Option)
+
+        QuestionsBulkEditor().delete(Question.objects.filter(category=self.algebra))
+
+        receiver.assert_not_called()
+        self.assertEqual(404, self.client.get(url).status_code)
+        self.assertIsNotNone(ProblemsCache().get_deleted_at(ProblemsCache.QUESTION))
+        self.assertIsNotNone(ProblemsCache().get_deleted_at(ProblemsCache.OPTION))
+
+    def test_move_to_category_should_ask_for_the_category_first(self):
+        response = self.post_action("move_to_category", self.questions[:2])
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "The action applies to 2 questions.")
+        self.assertContains(response, reverse("admin:problems_category_autocomplete"))
+        self.assertEqual(5, Question.objects.filter(category=self.algebra).count())
+
+    def test_move_to_category_should_move_the_selected_questions(self):
+        response = self.post_action("move_to_category", self.questions[:2], apply=True, category=self.geometry.id)
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual({self.questions[0].id, self.questions[1].id, self.geometry_question.id},
+                         set(Question.objects.filter(category=self.geometry).values_list("id", flat=True)))
+
+    def test_invalid_value_should_be_asked_for_again(self):
+        response = self.post_action("set_number_of_points", self.questions, apply=True, number_of_points=11)
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "Ensure this value is less than or equal to 10.")
+        self.assertFalse(Question.objects.filter(number_of_points=11).exists())
+
+    def test_actions_should_apply_to_all_filtered_questions_across_pages(self):
+        url = f"{reverse('admin:problems_question_changelist')}?category__id__exact={self.algebra.id}"
+
+        response = self.post_action("set_complexity", self.questions[:1], apply=True, select_across=1,
+                                    complexity=Question.Complexity.HARD.value, url=url)
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(5, Question.objects.filter(complexity=Question.Complexity.HARD.value).count())
+        self.assertEqual(Question.Complexity.EASY.value, Question.objects.get(id=self.geometry_question.id).complexity)
+
+    def test_questions_should_be_deleted_in_chunks_instead_of_the_default_deletion(self):
+        response = self.client.get(reverse("admin:problems_question_changelist"))
+        actions = dict(response.context["action_form"].fields["action"].choices)
+
+        self.assertNotIn("delete_selected", actions)
+        self.assertIn("delete_in_chunks", actions)
+
+        response = self.post_action("delete_in_chunks", self.questions[:3], apply=True)
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(3, Question.objects.count())
+
+    def test_deleting_a_category_should_delete_its_questions(self):
+        url = reverse("admin:problems_category_delete", args=[self.algebra.id])
+
+        self.assertContains(self.client.get(url), "Questions: 5")
+
+        response = self.client.post(url, {"post": "yes"})
+
+        self.assertEqual(302, response.status_code)
+        self.assertFalse(Category.objects.filter(id=self.algebra.id).exists())
+        self.assertEqual([self.geometry_question.id], list(Question.objects.values_list("id", flat=True)))
+
+    def test_category_that_got_a_question_while_being_deleted_should_be_kept(self):
+        delete = QuestionsBulkEditor.delete
+
+        def delete_and_add_question(editor, queryset, on_progress=None):
+            deleted = delete(editor, queryset, on_progress)
+            self.create_question(self.algebra, 10)
+            return deleted
+
+        with patch.object(QuestionsBulkEditor, "delete", delete_and_add_question):
+            response = self.client.post(reverse("admin:problems_category_delete", args=[self.algebra.id]),
+                                        {"post": "yes"}, follow=True)
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, "1 category got new questions while being deleted and was kept.")
+        self.assertTrue(Category.objects.filter(id=self.algebra.id).exists())
+        self.assertEqual(1, Question.objects.filter(category=self.algebra).count())
+
+    def test_deleting_selected_categories_should_delete_their_questions(self):
+        response = self.client.post(reverse("admin:problems_category_changelist"), {
+            "action": "delete_selected",
+            "post": "yes",
+            helpers.ACTION_CHECKBOX_NAME: [self.algebra.id, self.geometry.id],
+        })
+
+        self.assertEqual(302, response.status_code)
+        self.assertFalse(Category.objects.exists())
+        self.assertFalse(Question.objects.exists())
+
+    def post_action(self, action, questions, apply=False, url=None, **data):
+        data = {"action": action, helpers.ACTION_CHECKBOX_NAME: [question.id for question in questions], **data}
+
+        if apply:
+            data["apply"] = "yes"
+
+        return self.client.post(url or reverse("admin:problems_question_changelist"), data)
+
+    def create_question(self, category, number):
+        question = self.api.create_question(category, Question.QuestionType.SINGLE_CHOICE.value,
+                                            f"What is {number} + 1?")
+        self.api.create_option(question, str(number + 1), True)
+        self.api.create_option(question, str(number + 2), False)
+
+        return question
@@ -0,0 +1,78 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.apps.problems.export import QuestionsNDJSONExport
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.tests.api.converters import QuestionConverter
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsExportTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.question_converter = QuestionConverter()
+
+        algebra = self.api.create_category("Algebra")
+        self.questions = [
+            self.api.create_question(algebra, question_type, f"Question #{i}")
+            for i, question_type in enumerate(Question.QuestionType.values)
+        ]
+
+        self.questions[0].solution = "Multi\nline solution"
+        self.questions[0].save()
+
+        for question in self.questions:
+            if question.type in (Question.QuestionType.SINGLE_CHOICE, Question.QuestionType.MULTIPLE_CHOICE):
+                self.api.create_option(question, "Yes", True)
+                self.api.create_option(question, "No", False)
+
+    def test_export_should_stream_every_question_with_answers_and_options_as_json_line(self):
+        self.client.force_login(get_user_model().objects.create_superuser("admin", "admin@example.com", "admin"))
+        response = self.client.get(ProblemsAppUrls.questions_export_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], QuestionsNDJSONExport.content_type)
+        self.assertEqual(self.get_expected_lines(), self.parse(b"".join(response.streaming_content).decode()))
+
+    def test_export_should_be_forbidden_for_anonymous_users(self):
+        response = self.client.get(ProblemsAppUrls.questions_export_url())
+
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_export_should_be_forbidden_for_users_who_are_not_staff(self):
+        self.client.force_login(get_user_model().objects.create_user("student", "student@example.com", "student"))
+
+        response = self.client.get(ProblemsAppUrls.questions_export_url())
+
+        self.assertEqual(403, response.status_code)
+
+    def test_export_should_run_constant_number_of_queries_per_chunk(self):
+        export = QuestionsNDJSONExport(chunk_size=2)
+
+        # one query reading questions in chunks plus one options query per chunk
+        with self.assertNumQueries(1 + len(self.questions) // 2):
+            lines = list(export)
+
+        self.assertEqual(len(self.questions), len(lines))
+
+    def test_export_command_should_write_the_same_lines(self):
+        output = StringIO()
+
+        call_command("export_questions", chunk_size=4, stdout=output)
+
+        self.assertEqual(self.get_expected_lines(), self.parse(output.getvalue()))
+
+    def get_expected_lines(self):
+        return [
+            json.loads(json.dumps(self.question_converter.to_export_item(question)))
+            for question in sorted(self.questions, key=lambda question: question.id)
+        ]
+
+    def parse(self, content):
+        return [json.loads(line) for line in content.splitlines()]
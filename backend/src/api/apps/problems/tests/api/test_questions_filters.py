@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsFiltersTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+
+        self.algebra = self.api.create_category("Algebra")
+        self.geometry = self.api.create_category("Geometry")
+
+        self.easy_integer = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2+2=?", 4,
+                                                     number_of_points=1)
+        self.hard_multiple_choice = self.api.create_question(self.algebra,
+                                                             Question.QuestionType.MULTIPLE_CHOICE.value,
+                                                             "Select correct statements",
+                                                             complexity=Question.Complexity.HARD.value,
+                                                             number_of_points=7)
+        self.hard_geometry = self.api.create_question(self.geometry, Question.QuestionType.MULTIPLE_CHOICE.value,
+                                                      "Select right triangles",
+                                                      complexity=Question.Complexity.HARD.value,
+                                                      number_of_points=10)
+
+    def test_filter_by_category_complexity_and_type_should_return_only_matching_questions(self):
+        response = self.get_questions(category=self.algebra.id, complexity=Question.Complexity.HARD.value,
+                                      type=Question.QuestionType.MULTIPLE_CHOICE.value)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([self.hard_multiple_choice.id], self.get_ids(response))
+
+    def test_filter_by_several_comma_separated_values_should_return_questions_matching_any_of_them(self):
+        response = self.get_questions(category=f"{self.algebra.id},{self.geometry.id}",
+                                      type=f"{Question.QuestionType.INTEGER.value},"
+                                           f"{Question.QuestionType.MULTIPLE_CHOICE.value}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({self.easy_integer.id, self.hard_multiple_choice.id, self.hard_geometry.id},
+                         set(self.get_ids(response)))
+
+    def test_filter_by_number_of_points_range_should_include_both_bounds(self):
+        response = self.get_questions(number_of_points_min=7, number_of_points_max=10)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({self.hard_multiple_choice.id, self.hard_geometry.id}, set(self.get_ids(response)))
+
+    def test_filter_by_created_and_changed_ranges_should_return_questions_inside_the_range(self):
+        created = timezone.now() - timedelta(days=10)
+        Question.objects.filter(id=self.easy_integer.id).update(created=created, changed=created)
+
+        response = self.get_questions(created_before=(created + timedelta(days=1)).date().isoformat())
+        self.assertEqual([self.easy_integer.id], self.get_ids(response))
+
+        response = self.get_questions(changed_after=(created + timedelta(days=1)).date().isoformat())
+        self.assertEqual({self.hard_multiple_choice.id, self.hard_geometry.id}, set(self.get_ids(response)))
+
+    def test_invalid_filter_values_should_return_400_with_errors_for_every_parameter(self):
+        response = self.get_questions(category="algebra", complexity="Trivial", number_of_points_max=11,
+                                      created_after="yesterday")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual({"category", "complexity", "number_of_points_max", "created_after"},
+                         set(response.data.keys()))
+
+    def test_category_ids_out_of_the_id_range_should_return_400(self):
+        response = self.get_questions(category=f"{self.algebra.id},{2 ** 63}")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(["Enter a whole number."], response.data["category"])
+
+    def get_questions(self, **params):
+        return self.client.get(ProblemsAppUrls.questions_list_url(), params)
+
+    def get_ids(self, response):
+        return [item["id"] for item in response.data["results"]]
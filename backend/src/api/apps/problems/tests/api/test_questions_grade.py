@@ -0,0 +1,105 @@
+from django.core.cache import caches
+from django.test import TestCase
+
+from api.apps.problems.answers import answer_index
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsGradeTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+        answer_index.clear()
+
+        self.api = ApiHelper()
+        algebra = self.api.create_category("Algebra")
+        self.integer = self.api.create_question(algebra, Question.QuestionType.INTEGER.value, "2 + 2", "4",
+                                                number_of_points=2)
+        self.decimal = self.api.create_question(algebra, Question.QuestionType.DECIMAL.value, "1 / 2", "0.5",
+                                                number_of_points=3)
+        self.choice = self.api.create_question(algebra, Question.QuestionType.SINGLE_CHOICE.value, "2 * 2",
+                                               number_of_points=5)
+        self.right = self.api.create_option(self.choice, "4", True)
+        self.api.create_option(self.choice, "5", False)
+
+    def test_sheet_should_be_graded_with_total_points(self):
+        response = self.grade([
+            {"id": self.integer.id, "answer": "4"},
+            {"id": self.decimal.id, "answer": 0.6},
+            {"id": self.choice.id, "answer": [self.right.id]},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({
+            "results": [
+                {"id": self.integer.id, "correct": True, "points": 2},
+                {"id": self.decimal.id, "correct": False, "points": 0},
+                {"id": self.choice.id, "correct": True, "points": 5},
+            ],
+            "total_points": 7,
+            "max_points": 10,
+        }, response.json())
+
+    def test_unknown_questions_and_malformed_answers_should_be_reported_per_item(self):
+        response = self.grade([{"id": 100500, "answer": "4"}, {"id": self.integer.id, "answer": "four"}])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["Question does not exist."], response.data["results"][0]["errors"])
+        self.assertEqual(["A number is expected."], response.data["results"][1]["errors"])
+        self.assertEqual((0, 2), (response.data["total_points"], response.data["max_points"]))
+
+    def test_numbers_out_of_the_decimal_range_should_only_invalidate_their_items(self):
+        response = self.grade([
+            {"id": self.decimal.id, "answer": "1e999999999"},
+            {"id": self.integer.id, "answer": "-1e999999999"},
+            {"id": self.choice.id, "answer": [self.right.id]},
+        ])
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["A number is expected."], response.data["results"][0]["errors"])
+        self.assertEqual(["A number is expected."], response.data["results"][1]["errors"])
+        self.assertTrue(response.data["results"][2]["correct"])
+        self.assertEqual((5, 10), (response.data["total_points"], response.data["max_points"]))
+
+    def test_sheet_should_be_graded_with_constant_number_of_queries(self):
+        sheet = [
+            {"id": self.integer.id, "answer": "4"},
+            {"id": self.decimal.id, "answer": "0.5"},
+            {"id": self.choice.id, "answer": self.right.id},
+        ]
+
+        # questions and correct options of choice questions
+        with self.assertNumQueries(2):
+            self.grade(sheet)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(10, self.grade(sheet).data["total_points"])
+
+    def test_only_changed_questions_should_be_reloaded(self):
+        sheet = [{"id": self.integer.id, "answer": "5"}, {"id": self.choice.id, "answer": self.right.id}]
+        self.assertEqual(5, self.grade(sheet).data["total_points"])
+
+        self.integer.correct_answer = "5"
+        self.integer.save()
+
+        # the changed integer question only, options of the choice question are not loaded again
+        with self.assertNumQueries(1):
+            self.assertEqual(7, self.grade(sheet).data["total_points"])
+
+    def test_malformed_sheets_should_be_rejected(self):
+        self.assertEqual(400, self.grade([]).status_code)
+        self.assertEqual(400, self.grade([{"id": "1", "answer": "4"}]).status_code)
+        self.assertEqual(400, self.grade([{"id": self.integer.id}]).status_code)
+        self.assertEqual(400, self.grade([{"id": self.integer.id, "answer": "4"}] * 2).status_code)
+
+    def test_ids_out_of_the_id_range_should_be_rejected(self):
+        response = self.grade([{"id": self.integer.id, "answer": "4"}, {"id": 10 ** 30, "answer": "4"}])
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual({"answers[1]": ["Enter a valid question id."]}, response.json())
+
+    def grade(self, answers):
+        return self.client.post(ProblemsAppUrls.questions_grade_url(), {"answers": answers},
+                                content_type="application/json")
@@ -0,0 +1,220 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.apps.problems.importing import QuestionsImporter, read_csv_rows, read_jsonl_rows
+from api.apps.problems.models import Question, Option, Category
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuestionsImportTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+
+    def test_valid_rows_of_every_type_should_be_imported(self):
+        rows = [
+            self.row("Integer", correct_answer="4"),
+            self.row("Decimal", correct_answer="4.50"),
+            self.row("Boolean", correct_answer="Yes"),
+            self.row("Text", correct_answer=" four "),
+            self.row("Single Choice", options=[self.option("1", True), self.option("2", False)]),
+            self.row("Multiple Choice", options=[self.option("1", True), self.option("2", True)]),
+        ]
+
+        report = self.run_jsonl(rows)
+
+        self.assertEqual({"imported": 6, "failed": 0, "errors": []}, report.as_dict())
+        self.assertEqual(
+            ["4", "4.50", "Yes", "four", None, None],
+            list(Question.objects.order_by("id").values_list("correct_answer", flat=True))
+        )
+        self.assertEqual(4, Option.objects.count())
+        self.assertEqual(
+            [True, False],
+            list(Option.objects.filter(question__type="Single Choice").order_by("id").values_list("is_correct", flat=True))
+        )
+
+    def test_rows_breaking_admin_rules_should_be_reported_and_the_rest_imported(self):
+        rows = [
+            self.row("Integer", correct_answer="four"),
+            self.row("Boolean", correct_answer="True"),
+            self.row("Text", correct_answer="  "),
+            self.row("Single Choice", options=[self.option("1", True), self.option("2", True)]),
+            self.row("Multiple Choice", options=[self.option("1", False), self.option("2", False)]),
+            self.row("Single Choice", options=[self.option("1", True)]),
+            self.row("Single Choice", options=[self.option("1", True), self.option("1", False)]),
+            self.row("Integer", correct_answer="1", number_of_points=11, category="Geometry"),
+            self.row("Integer", correct_answer="1"),
+        ]
+
+        report = self.run_jsonl(rows)
+
+        self.assertEqual(1, report.imported)
+        self.assertEqual(list(range(1, 9)), [error["row"] for error in report.errors])
+        self.assertEqual(["correct_answer"], list(report.errors[0]["errors"]))
+        self.assertEqual(["correct_answer"], list(report.errors[1]["errors"]))
+        self.assertEqual(["This field is required."], report.errors[2]["errors"]["correct_answer"])
+        self.assertEqual(
+            ["For single choice question type you need to specify exactly one correct option."],
+            report.errors[3]["errors"]["options"]
+        )
+        self.assertEqual(
+            ["For multiple choice question type you need to specify at least one correct option."],
+            report.errors[4]["errors"]["options"]
+        )
+        self.assertEqual(["At least two options should be specified."], report.errors[5]["errors"]["options"])
+        self.assertEqual(["Some options have the same values."], report.errors[6]["errors"]["options"])
+        self.assertEqual({"number_of_points", "category"}, set(report.errors[7]["errors"]))
+        self.assertEqual(1, Question.objects.count())
+        self.assertEqual(0, Option.objects.count())
+
+    def test_text_longer_than_the_admin_allows_should_be_rejected(self):
+        rows = [
+            {**self.row("Integer", correct_answer="1"), "text": "x" * 2049},
+            # the solution isn't limited, neither by the admin
+            {**self.row("Integer", correct_answer="1"), "text": "x" * 2048, "solution": "x" * 3000},
+        ]
+
+        report = self.run_jsonl(rows)
+
+        self.assertEqual(1, report.imported)
+        self.assertEqual([{"row": 1, "errors": {
+            "text": ["Ensure this value has at most 2048 characters (it has 2049)."]
+        }}], report.errors)
+
+    def test_missing_categories_should_be_created_when_asked(self):
+        report = self.run_jsonl([self.row("Integer", correct_answer="1", category="Geometry")] * 2,
+                                create_categories=True)
+
+        self.assertEqual(2, report.imported)
+        self.assertEqual(1, Category.objects.filter(name="Geometry").count())
+
+    def test_categories_of_rejected_rows_should_not_be_created(self):
+        report = self.run_jsonl([self.row("Integer", category="Geometry")], create_categories=True)
+
+        self.assertEqual(0, report.imported)
+        self.assertFalse(Category.objects.filter(name="Geometry").exists())
+
+    def test_category_could_be_referenced_by_id(self):
+        report = self.run_jsonl([self.row("Integer", correct_answer="1", category=self.algebra.id)])
+
+        self.assertEqual(1, report.imported)
+        self.assertEqual(self.algebra.id, Question.objects.get().category_id)
+
+    def test_csv_rows_should_be_imported(self):
+        content = "\n".join([
+            "category,text,type,complexity,number_of_points,max_attempts_to_solve,correct_answer,solution,options",
+            'Algebra,"2 + 2 = ?",Integer,Easy,1,,4,,',
+            'Algebra,"Pick one",Single Choice,Easy,2,3,,"Multi\nline",'
+            '"[{""value"": ""A"", ""is_correct"": true}, {""value"": ""B"", ""is_correct"": false}]"',
+            'Algebra,"Broken",Integer,Easy,1,,4,,"[{"',
+        ])
+
+        report = QuestionsImporter().run(read_csv_rows(StringIO(content)))
+
+        self.assertEqual(2, report.imported)
+        self.assertEqual([5], [error["row"] for error in report.errors])
+        choice = Question.objects.get(type="Single Choice")
+        self.assertEqual((3, "Multi\nline"), (choice.max_attempts_to_solve, choice.solution))
+        self.assertEqual(["A", "B"], list(choice.options.order_by("id").values_list("value", flat=True)))
+
+    def test_malformed_jsonl_lines_should_be_reported(self):
+        content = "\n".join([json.dumps(self.row("Integer", correct_answer="1")), "{oops", "", "[1]"])
+
+        report = QuestionsImporter().run(read_jsonl_rows(StringIO(content)))
+
+        self.assertEqual(1, report.imported)
+        self.assertEqual([2, 4], [error["row"] for error in report.errors])
+        self.assertIn("non_field_errors", report.errors[0]["errors"])
+
+    def test_rows_should_be_written_in_chunks(self):
+        rows = [self.row("Integer", correct_answer=str(i)) for i in range(5)]
+
+        # categories, then a savepoint and a bulk insert of questions per chunk (options are not inserted)
+        with self.assertNumQueries(1 + 3 * 3):
+            report = self.run_jsonl(rows, chunk_size=2)
+
+        self.assertEqual(5, report.imported)
+
+    def test_command_should_import_file_and_print_errors(self):
+        path = self.write_file([self.row("Integer", correct_answer="1"), self.row("Integer")])
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command("import_questions", path, stdout=stdout, stderr=stderr)
+
+        self.assertIn("Imported: 1, failed: 1", stdout.getvalue())
+        self.assertIn("Row 2", stderr.getvalue())
+
+    def test_api_should_import_uploaded_file(self):
+        self.client.force_login(get_user_model().objects.create_superuser("admin", "admin@example.com", "admin"))
+        upload = SimpleUploadedFile("questions.jsonl", self.to_jsonl([self.row("Integer", correct_answer="1")]))
+
+        response = self.client.post(ProblemsAppUrls.questions_import_url(), {"file": upload})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"imported": 1, "failed": 0, "errors": []}, response.json())
+
+    def test_api_should_reject_unknown_format(self):
+        self.client.force_login(get_user_model().objects.create_superuser("admin", "admin@example.com", "admin"))
+        upload = SimpleUploadedFile("questions.xlsx", b"")
+
+        response = self.client.post(ProblemsAppUrls.questions_import_url(), {"file": upload})
+
+        self.assertEqual(400, response.status_code)
+
+    def test_api_should_import_nothing_from_file_with_invalid_utf8_in_the_middle(self):
+        self.client.force_login(get_user_model().objects.create_superuser("admin", "admin@example.com", "admin"))
+        # the bad byte comes after the first chunk
+        rows = [self.row("Integer", correct_answer="1")] * (QuestionsImporter.default_chunk_size + 1)
+        content = self.to_jsonl(rows) + b"\n" + b'{"text": "\xff"}'
+        upload = SimpleUploadedFile("questions.jsonl", content)
+
+        response = self.client.post(ProblemsAppUrls.questions_import_url(), {"file": upload})
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual(0, Question.objects.count())
+
+    def test_api_should_be_forbidden_for_anonymous_users(self):
+        upload = SimpleUploadedFile("questions.jsonl", self.to_jsonl([self.row("Integer", correct_answer="1")]))
+
+        response = self.client.post(ProblemsAppUrls.questions_import_url(), {"file": upload})
+
+        self.assertIn(response.status_code, (401, 403))
+        self.assertEqual(0, Question.objects.count())
+
+    def run_jsonl(self, rows, **kwargs):
+        return QuestionsImporter(**kwargs).run(read_jsonl_rows(StringIO(self.to_jsonl(rows).decode())))
+
+    def write_file(self, rows):
+        descriptor, path = tempfile.mkstemp(suffix=".jsonl")
+        self.addCleanup(os.remove, path)
+
+        with os.fdopen(descriptor, "wb") as output:
+            output.write(self.to_jsonl(rows))
+
+        return path
+
+    def to_jsonl(self, rows):
+        return "\n".join(json.dumps(row) for row in rows).encode()
+
+    def row(self, question_type, correct_answer=None, options=None, number_of_points=1, category="Algebra"):
+        return {
+            "category": category,
+            "text": f"{question_type} question",
+            "type": question_type,
+            "complexity": "Easy",
+            "number_of_points": number_of_points,
+            "correct_answer": correct_answer,
+            "options": options,
+        }
+
+    def option(self, value, is_correct):
+        return {"value": value, "is_correct": is_correct}
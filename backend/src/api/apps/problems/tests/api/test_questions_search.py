@@ -0,0 +1,97 @@
+from django.db import connection
+from django.test import TestCase
+
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+SEARCH_TRIGGERS_QUERIES = {
+    "sqlite": "SELECT name FROM sqlite_master WHERE type = 'trigger'",
+    "postgresql": "SELECT tgname FROM pg_trigger WHERE NOT tgisinternal",
+}
+
+SEARCH_TRIGGERS = {
+    "sqlite": {
+        "problems_questions_search_insert",
+        "problems_questions_search_update",
+        "problems_questions_search_delete",
+        "problems_questions_options_search_insert",
+        "problems_questions_options_search_update",
+        "problems_questions_options_search_delete",
+    },
+    "postgresql": {
+        "problems_questions_search",
+        "problems_questions_options_search",
+    },
+}
+
+
+class QuestionsSearchTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+
+    def test_search_triggers_should_survive_all_migrations(self):
+        with connection.cursor() as cursor:
+            cursor.execute(SEARCH_TRIGGERS_QUERIES[connection.vendor])
+            triggers = {name for name, in cursor.fetchall()}
+
+        self.assertEqual(set(), SEARCH_TRIGGERS[connection.vendor] - triggers)
+
+    def test_search_should_rank_matches_in_question_text_above_matches_in_solution(self):
+        in_solution = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2^3=?", 8,
+                                               solution="Exponentiation is repeated multiplication.")
+        in_text = self.api.create_question(self.algebra, Question.QuestionType.TEXT.value,
+                                           "What is the inverse function to exponentiation?", "Logarithm")
+        self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2+2=?", 4)
+
+        response = self.search("exponentiation")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([in_text.id, in_solution.id], self.get_ids(response))
+
+    def test_search_should_match_options_and_word_prefixes(self):
+        question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value,
+                                            "Which function is inverse to exponentiation?")
+        self.api.create_option(question, "Logarithm", True)
+        self.api.create_option(question, "Sine", False)
+
+        self.assertEqual([question.id], self.get_ids(self.search("logar")))
+
+    def test_search_index_should_follow_changes_of_questions_and_options(self):
+        question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value, "Pick one")
+        option = self.api.create_option(question, "Parabola", True)
+
+        question.text = "Pick the conic section"
+        question.save()
+        option.value = "Hyperbola"
+        option.save()
+
+        self.assertEqual([question.id], self.get_ids(self.search("conic hyperbola")))
+        self.assertEqual([], self.get_ids(self.search("parabola")))
+
+        option.delete()
+        self.assertEqual([], self.get_ids(self.search("hyperbola")))
+
+        question.delete()
+        self.assertEqual([], self.get_ids(self.search("conic")))
+
+    def test_search_without_words_should_return_empty_list(self):
+        self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2+2=?", 4)
+
+        response = self.search(" ?* ")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([], response.data)
+
+    def test_search_with_invalid_limit_should_return_400(self):
+        response = self.client.get(ProblemsAppUrls.questions_search_url(), {"search": "any", "limit": "zero"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def search(self, search):
+        return self.client.get(ProblemsAppUrls.questions_search_url(), {"search": search})
+
+    def get_ids(self, response):
+        return [item["id"] for item in response.data]
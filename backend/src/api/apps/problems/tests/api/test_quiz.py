@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from api.apps.problems.models import Question
+from api.apps.problems.quiz import QuizSampler
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.tests.api.converters import QuestionConverter
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class QuizTestCase(TestCase):
+    def setUp(self) -> None:
+        self.api = ApiHelper()
+        self.question_converter = QuestionConverter()
+
+        self.algebra = self.api.create_category("Algebra")
+        self.geometry = self.api.create_category("Geometry")
+        self.questions = [
+            self.api.create_question(category, Question.QuestionType.INTEGER.value, f"Question #{i}",
+                                     complexity=complexity)
+            for i in range(10)
+            for category in (self.algebra, self.geometry)
+            for complexity in (Question.Complexity.EASY.value, Question.Complexity.HARD.value)
+        ]
+
+    def test_quiz_should_contain_requested_number_of_distinct_matching_questions(self):
+        response = self.client.get(ProblemsAppUrls.quiz_url(), {
+            "category": self.algebra.id, "complexity": Question.Complexity.EASY.value, "n": 5
+        })
+
+        self.assertEqual(200, response.status_code)
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual(5, len(set(ids)))
+
+        expected = {
+            question.id for question in self.questions
+            if question.category == self.algebra and question.complexity == Question.Complexity.EASY
+        }
+        self.assertTrue(set(ids) <= expected)
+
+    def test_quiz_items_should_be_question_details(self):
+        response = self.client.get(ProblemsAppUrls.quiz_url(), {"n": 3})
+
+        questions = {question.id: question for question in self.questions}
+        self.assertEqual(
+            [self.question_converter.to_item_details(questions[item["id"]]) for item in response.data["results"]],
+            response.data["results"]
+        )
+
+    def test_same_seed_should_regenerate_same_quiz(self):
+        first = self.client.get(ProblemsAppUrls.quiz_url(), {"n": 10})
+        second = self.client.get(ProblemsAppUrls.quiz_url(), {"n": 10, "seed": first.data["seed"]})
+
+        self.assertEqual(first.data, second.data)
+
+    def test_quiz_should_not_be_larger_than_the_pool(self):
+        response = self.client.get(ProblemsAppUrls.quiz_url(), {
+            "category": self.geometry.id, "complexity": Question.Complexity.HARD.value, "n": 50
+        })
+
+        self.assertEqual(10, len(response.data["results"]))
+
+    def test_large_pools_should_be_sampled_by_probing(self):
+        queryset = Question.objects.filter(category=self.algebra)
+
+        with patch.object(QuizSampler, "max_pool_size", 3):
+            first_ids = QuizSampler(queryset, seed=7).sample_ids(5)
+            second_ids = QuizSampler(queryset, seed=7).sample_ids(5)
+
+        self.assertEqual(first_ids, second_ids)
+        self.assertEqual(5, len(set(first_ids)))
+        self.assertTrue(set(first_ids) <= set(queryset.values_list("id", flat=True)))
+
+    def test_questions_probes_miss_should_be_topped_up(self):
+        queryset = Question.objects.filter(category=self.algebra)
+
+        with patch.object(QuizSampler, "max_pool_size", 3), patch.object(QuizSampler, "max_probes_per_question", 0):
+            first_ids = QuizSampler(queryset, seed=7).sample_ids(5)
+            second_ids = QuizSampler(queryset, seed=7).sample_ids(5)
+
+        self.assertEqual(first_ids, second_ids)
+        self.assertEqual(5, len(set(first_ids)))
+        self.assertTrue(set(first_ids) <= set(queryset.values_list("id", flat=True)))
+
+    def test_known_large_pool_should_be_probed_right_away(self):
+        queryset = Question.objects.filter(category=self.algebra)
+        pool_size = queryset.count()
+
+        with patch.object(QuizSampler, "max_pool_size", 3), patch.object(QuizSampler, "min_pool_size_per_question", 1):
+            # the smallest id, the largest id and a probe per question (none of the windows is empty with this seed)
+            with self.assertNumQueries(2 + 2):
+                ids = QuizSampler(queryset, seed=7).sample_ids(2, pool_size=pool_size)
+
+        self.assertEqual(2, len(set(ids)))
+
+    def test_invalid_parameters_should_be_rejected(self):
+        for params in ({"n": 0}, {"n": 101}, {"n": "many"}, {"seed": "-1"}, {"seed": str(2 ** 63)},
+                       {"complexity": "Trivial"},
+                       {"category": str(2 ** 63)}):
+            self.assertEqual(400, self.client.get(ProblemsAppUrls.quiz_url(), params).status_code)
@@ -0,0 +1,100 @@
+import asyncio
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question, Category
+from api.apps.problems.routing import ReplicaRoutingMiddleware, current_routing_state
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+# the replica mirrors the default database in tests, so it always holds the same rows
+@override_settings(PROBLEMS_REPLICA_DATABASES=["replica"], PROBLEMS_PRIMARY_PIN_SECONDS=30)
+class ReplicaRoutingTestCase(TransactionTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.INTEGER.value, "2 + 2 = ?", 4)
+        self.editor = User.objects.create_superuser("editor", "editor@example.com", "password")
+
+    def test_api_reads_should_go_to_the_replica(self):
+        for url in [ProblemsAppUrls.categories_list_url(), ProblemsAppUrls.questions_list_url(),
+                    ProblemsAppUrls.question_details_url(self.question.id)]:
+            primary_queries, replica_queries, response = self.get(url)
+
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(0, primary_queries, url)
+            self.assertGreater(replica_queries, 0, url)
+
+    def test_admin_reads_should_go_to_the_primary(self):
+        self.client.force_login(self.editor)
+
+        primary_queries, replica_queries, response = self.get(reverse("admin:problems_question_changelist"))
+
+        self.assertEqual(200, response.status_code)
+        self.assertGreater(primary_queries, 0)
+        self.assertEqual(0, replica_queries)
+        self.assertNotIn(ReplicaRoutingMiddleware.pin_cookie_name, response.cookies)
+
+    def test_writes_should_go_to_the_primary_and_pin_the_client_to_it(self):
+        self.client.force_login(self.editor)
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.post(reverse("admin:problems_category_add"), {"name": "Geometry"})
+
+        self.assertEqual(302, response.status_code)
+        self.assertEqual(0, len(replica))
+        self.assertTrue(Category.objects.filter(name="Geometry").exists())
+
+        cookie = response.cookies[ReplicaRoutingMiddleware.pin_cookie_name]
+        self.assertEqual(30, cookie["max-age"])
+
+        primary_queries, replica_queries, _ = self.get(ProblemsAppUrls.categories_list_url())
+        self.assertGreater(primary_queries, 0)
+        self.assertEqual(0, replica_queries)
+
+    def test_reads_should_go_back_to_the_replica_when_the_pin_expires(self):
+        self.client.force_login(self.editor)
+        self.client.post(reverse("admin:problems_category_add"), {"name": "Geometry"})
+
+        del self.client.cookies[ReplicaRoutingMiddleware.pin_cookie_name]
+
+        primary_queries, replica_queries, _ = self.get(ProblemsAppUrls.categories_list_url())
+        self.assertEqual(0, primary_queries)
+        self.assertGreater(replica_queries, 0)
+
+    async def test_middleware_should_run_on_the_event_loop_under_asgi(self):
+        async def get_response(request):
+            current_routing_state().wrote = True
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = await middleware(RequestFactory().post("/"))
+
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        self.assertTrue(asyncio.iscoroutinefunction(middleware.process_view))
+        self.assertIn(ReplicaRoutingMiddleware.pin_cookie_name, response.cookies)
+
+    def test_reads_outside_of_requests_should_go_to_the_primary(self):
+        self.assertEqual("default", Question.objects.all().db)
+
+    def get(self, url):
+        with CaptureQueriesContext(connections["default"]) as primary, \
+                CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(url)
+
+        # sessions and users aren't problems models, they're read from the primary by every request
+        primary_queries = [query for query in primary if "problems_" in query["sql"]]
+
+        return len(primary_queries), len(replica), response
@@ -0,0 +1,89 @@
+import io
+import json
+import tempfile
+from collections import Counter
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.apps.problems.models import Category, Question, Option
+from api.apps.problems.seeding import QuestionBankGenerator, QuestionBankSeeder
+from api.apps.problems.validation import CORRECT_ANSWER_FIELDS, QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER, \
+    QUESTION_TYPES_WITH_OPTIONS, validate_correct_answer, find_options_error
+
+
+class SeedBankTestCase(TestCase):
+    def test_generated_questions_should_pass_the_admin_validation(self):
+        generator = QuestionBankGenerator(seed=1)
+        categories = [Category(id=1, name="Algebra")]
+        types = Counter()
+
+        for question, options in generator.questions(categories, 600):
+            types[question.type] += 1
+            question.full_clean(exclude=["category", "correct_answer"])
+            question_type = question.type.lower()
+
+            if question_type in QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER:
+                cleaned = CORRECT_ANSWER_FIELDS[question_type].clean(question.correct_answer)
+                validate_correct_answer(question_type, cleaned)
+                self.assertEqual([], options)
+
+            if question.type in QUESTION_TYPES_WITH_OPTIONS:
+                values = [option.value for option in options]
+                correct = sum(option.is_correct for option in options)
+                self.assertIsNone(find_options_error(question.type, len(values), correct, len(set(values))))
+
+        self.assertEqual(set(Question.QuestionType.values), set(types))
+
+    def test_the_same_seed_should_generate_the_same_bank(self):
+        categories = [Category(id=1, name="Algebra"), Category(id=2, name="Geometry")]
+
+        def generate():
+            return [
+                (question.text, question.correct_answer, question.category.name, [option.value for option in options])
+                for question, options in QuestionBankGenerator(seed=7).questions(categories, 50)
+            ]
+
+        self.assertEqual(generate(), generate())
+
+    def test_seeder_should_insert_questions_with_options_in_batches(self):
+        seeder = QuestionBankSeeder(QuestionBankGenerator(seed=3), batch_size=40)
+        categories = seeder.seed_categories(5)
+
+        self.assertEqual(100, seeder.seed_questions(categories, 100))
+        self.assertEqual(5, Category.objects.count())
+        self.assertEqual(100, Question.objects.count())
+
+        choice_questions = Question.objects.filter(type__in=QUESTION_TYPES_WITH_OPTIONS)
+        self.assertEqual(set(choice_questions.values_list("id", flat=True)),
+                         set(Option.objects.values_list("question_id", flat=True)))
+
+        # categories are reused and ids keep going after the seeded ones
+        self.assertEqual(categories, seeder.seed_categories(5))
+        question = Question.objects.create(category=categories[0], text="2 + 2 = ?", type="Integer",
+                                           complexity="Easy", number_of_points=1, correct_answer="4")
+        self.assertGreater(question.id, max(Question.objects.exclude(id=question.id).values_list("id", flat=True)))
+
+    def test_seed_bank_command_should_seed_the_requested_number_of_questions(self):
+        call_command("seed_bank", questions=30, categories=3, batch_size=10, stdout=io.StringIO())
+
+        self.assertEqual(30, Question.objects.count())
+        self.assertEqual(3, Category.objects.count())
+
+    def test_run_benchmarks_should_write_results_of_every_scenario(self):
+        seeder = QuestionBankSeeder(QuestionBankGenerator(seed=5))
+        seeder.seed_questions(seeder.seed_categories(3), 50)
+
+        with tempfile.NamedTemporaryFile("r", suffix=".json") as output:
+            call_command("run_benchmarks", output=output.name, repeat=2, warmup=0, stderr=io.StringIO())
+            report = json.load(output)
+
+        self.assertEqual(50, report["environment"]["questions"])
+        self.assertIn("endpoint: questions-list", report["results"])
+        self.assertIn("serializer: QuestionSerializer", report["results"])
+
+        for result in report["results"].values():
+            self.assertEqual(2, result["runs"])
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+        self.assertGreater(report["results"]["endpoint: questions-list"]["queries_per_run"], 0)
@@ -0,0 +1,83 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.apps.problems.cache.problems_cache import PROBLEMS_CACHE_ALIAS
+from api.apps.problems.models import Question
+from api.apps.problems.tests.api.api_helper import ApiHelper
+from api.apps.problems.tests.api.converters import QuestionConverter
+from api.apps.problems.urls import ProblemsAppUrls
+
+
+class SparseFieldsetsTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[PROBLEMS_CACHE_ALIAS].clear()
+
+        self.api = ApiHelper()
+        self.question_converter = QuestionConverter()
+        self.algebra = self.api.create_category("Algebra")
+        self.question = self.api.create_question(self.algebra, Question.QuestionType.SINGLE_CHOICE.value,
+                                                 "Which function is inverse to exponentiation?",
+                                                 solution="Logarithm by definition.")
+        self.api.create_option(self.question, "Logarithm", True)
+        self.api.create_option(self.question, "Sine", False)
+
+    def test_list_should_render_and_select_requested_fields_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(ProblemsAppUrls.questions_list_url(), {"fields": "type,id"})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([{"id": self.question.id, "type": self.question.type}], response.data["results"])
+        self.assertNotIn('"text"', queries[-1]["sql"])
+        self.assertNotIn("problems_categories", queries[-1]["sql"])
+
+    def test_details_should_render_and_select_requested_fields_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(ProblemsAppUrls.question_details_url(self.question.id),
+                                       {"fields": "id,options"})
+
+        expected = self.question_converter.to_item_details(self.question)
+        self.assertEqual({"id": expected["id"], "options": expected["options"]}, response.data)
+
+        question_query, options_query = [query["sql"] for query in queries if "problems_questions" in query["sql"]][-2:]
+        self.assertNotIn('"text"', question_query)
+        self.assertNotIn("problems_categories", question_query)
+        self.assertNotIn('"is_correct"', options_query)
+
+    def test_details_should_never_read_columns_serializer_does_not_render(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(ProblemsAppUrls.question_details_url(self.question.id))
+
+        self.assertEqual(self.question_converter.to_item_details(self.question), response.data)
+
+        # the freshness of the question is calculated from change dates, the question and options are not
+        sql = " ".join(query["sql"] for query in queries if "MAX(" not in query["sql"])
+        for column in ('"solution"', '"correct_answer"', '"is_correct"', '"changed"'):
+            self.assertNotIn(column, sql)
+
+    def test_details_fields_should_be_selected_from_cached_payload(self):
+        self.client.get(ProblemsAppUrls.question_details_url(self.question.id))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(ProblemsAppUrls.question_details_url(self.question.id), {"fields": "id,type"})
+
+        self.assertEqual({"id": self.question.id, "type": self.question.type}, response.data)
+
+    def test_partial_details_should_not_be_cached(self):
+        self.client.get(ProblemsAppUrls.question_details_url(self.question.id), {"fields": "id"})
+
+        response = self.client.get(ProblemsAppUrls.question_details_url(self.question.id))
+
+        self.assertEqual(self.question_converter.to_item_details(self.question), response.data)
+
+    def test_search_should_render_requested_fields_only(self):
+        response = self.client.get(ProblemsAppUrls.questions_search_url(),
+                                   {"search": "exponentiation", "fields": "id,question"})
+
+        self.assertEqual([{"id": self.question.id, "question": self.question.text}], response.data)
+
+    def test_unknown_fields_should_be_rejected(self):
+        for url in (ProblemsAppUrls.questions_list_url(), ProblemsAppUrls.question_details_url(self.question.id)):
+            self.assertEqual(400, self.client.get(url, {"fields": "id,solution"}).status_code)
+            self.assertEqual(400, self.client.get(url, {"fields": ","}).status_code)
@@ -1,19 +1,45 @@
 from django.urls import path, reverse
 
+from api.apps.problems.views.aio import AsyncCategoriesList, AsyncCategoryDetails, AsyncQuestionsList, \
+    AsyncQuestionDetails
 from api.apps.problems.views.categories import CategoriesList, CategoryDetails
-from api.apps.problems.views.questions import QuestionsList, QuestionDetails
+from api.apps.problems.views.questions import QuestionsList, QuestionDetails, QuestionsSearch, QuestionsExport, \
+    QuestionsImport, QuestionCheck, QuestionsGrade, QuestionsBatch
+from api.apps.problems.views.quiz import QuizSample
 
 app_name = "problems"
 categories_list_name = "categories-list"
 category_details_url_name = "category-details"
 questions_list_name = "questions-list"
+questions_search_name = "questions-search"
+questions_export_name = "questions-export"
+questions_import_name = "questions-import"
+questions_grade_name = "questions-grade"
+questions_batch_name = "questions-batch"
 question_details_url_name = "question-details"
+question_check_url_name = "question-check"
+quiz_name = "quiz"
+async_categories_list_name = "async-categories-list"
+async_category_details_url_name = "async-category-details"
+async_questions_list_name = "async-questions-list"
+async_question_details_url_name = "async-question-details"
 
 urlpatterns = [
     path('categories/', CategoriesList.as_view(), name=categories_list_name),
     path('categories/<pk>/', CategoryDetails.as_view(), name=category_details_url_name),
     path('questions/', QuestionsList.as_view(), name=questions_list_name),
+    path('questions/search/', QuestionsSearch.as_view(), name=questions_search_name),
+    path('questions/export/', QuestionsExport.as_view(), name=questions_export_name),
+    path('questions/import/', QuestionsImport.as_view(), name=questions_import_name),
+    path('questions/grade/', QuestionsGrade.as_view(), name=questions_grade_name),
+    path('questions/batch/', QuestionsBatch.as_view(), name=questions_batch_name),
     path('questions/<pk>/', QuestionDetails.as_view(), name=question_details_url_name),
+    path('questions/<pk>/check/', QuestionCheck.as_view(), name=question_check_url_name),
+    path('quiz/', QuizSample.as_view(), name=quiz_name),
+    path('async/categories/', AsyncCategoriesList.as_view(), name=async_categories_list_name),
+    path('async/categories/<pk>/', AsyncCategoryDetails.as_view(), name=async_category_details_url_name),
+    path('async/questions/', AsyncQuestionsList.as_view(), name=async_questions_list_name),
+    path('async/questions/<pk>/', AsyncQuestionDetails.as_view(), name=async_question_details_url_name),
 ]
 
 
@@ -30,6 +56,50 @@ class ProblemsAppUrls:
     def questions_list_url():
         return reverse(f"{app_name}:{questions_list_name}")
 
+    @staticmethod
+    def questions_search_url():
+        return reverse(f"{app_name}:{questions_search_name}")
+
+    @staticmethod
+    def questions_export_url():
+        return reverse(f"{app_name}:{questions_export_name}")
+
+    @staticmethod
+    def questions_import_url():
+        return reverse(f"{app_name}:{questions_import_name}")
+
+    @staticmethod
+    def questions_grade_url():
+        return reverse(f"{app_name}:{questions_grade_name}")
+
+    @staticmethod
+    def questions_batch_url():
+        return reverse(f"{app_name}:{questions_batch_name}")
+
     @staticmethod
     def question_details_url(pk):
         return reverse(f"{app_name}:{question_details_url_name}", kwargs={'pk': pk})
+
+    @staticmethod
+    def question_check_url(pk):
+        return reverse(f"{app_name}:{question_check_url_name}", kwargs={'pk': pk})
+
+    @staticmethod
+    def quiz_url():
+        return reverse(f"{app_name}:{quiz_name}")
+
+    @staticmethod
+    def async_categories_list_url():
+        return reverse(f"{app_name}:{async_categories_list_name}")
+
+    @staticmethod
+    def async_category_details_url(pk):
+        return reverse(f"{app_name}:{async_category_details_url_name}", kwargs={'pk': pk})
+
+    @staticmethod
+    def async_questions_list_url():
+        return reverse(f"{app_name}:{async_questions_list_name}")
+
+    @staticmethod
+    def async_question_details_url(pk):
+        return reverse(f"{app_name}:{async_question_details_url_name}", kwargs={'pk': pk})
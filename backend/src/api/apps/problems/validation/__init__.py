@@ -0,0 +1,10 @@
+from .question_validation import (
+    QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER,
+    QUESTION_TYPES_WITH_OPTIONS,
+    CORRECT_ANSWER_FIELDS,
+    OPTIONS_ERROR_MESSAGES,
+    validate_boolean_value,
+    validate_correct_answer,
+    find_options_error,
+)
+from .id_range import ID_RANGE, is_out_of_id_range
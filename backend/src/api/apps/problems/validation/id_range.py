@@ -0,0 +1,11 @@
+# Values the id columns (BigAutoField) can hold. Larger whole numbers aren't just ids that don't exist, database
+# drivers fail to pass them as parameters (e.g. OverflowError of SQLite), so they're sorted out beforehand.
+ID_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def is_out_of_id_range(value):
+    # a whole number (or its text) no id column can hold, anything else is left to the lookup it's passed to
+    try:
+        return int(value) not in ID_RANGE
+    except (TypeError, ValueError):
+        return False
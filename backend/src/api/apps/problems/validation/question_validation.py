@@ -0,0 +1,95 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms import Field
+from django.utils.translation import gettext_lazy as _
+
+from api.apps.problems.models import Question
+
+# Rules shared by the admin (AdminQuestionChangeForm, AdminOptionInlineFormset) and the questions import,
+# so a question can't be valid in one place and invalid in the other.
+
+
+def validate_boolean_value(value):
+    return value in ["Yes", "No"]
+
+
+QUESTION_TYPES_TO_SAVE_CORRECT_ANSWER = [
+    Question.QuestionType.INTEGER.value.lower(),
+    Question.QuestionType.DECIMAL.value.lower(),
+    Question.QuestionType.BOOLEAN.value.lower(),
+    Question.QuestionType.TEXT.value.lower(),
+]
+
+QUESTION_TYPES_WITH_OPTIONS = [
+    Question.QuestionType.SINGLE_CHOICE.value,
+    Question.QuestionType.MULTIPLE_CHOICE.value
+]
+
+CORRECT_ANSWER_FIELDS = {
+    Question.QuestionType.INTEGER.value.lower(): forms.IntegerField(label=_("Correct Answer"), required=False),
+    Question.QuestionType.DECIMAL.value.lower(): forms.DecimalField(label=_("Correct Answer"), required=False),
+    Question.QuestionType.BOOLEAN.value.lower(): forms.ChoiceField(
+        label=_("Correct Answer"),
+        required=False,
+        choices=(("", "---------"), ("Yes", _("Yes")), ("No", _("No")))
+    ),
+    Question.QuestionType.TEXT.value.lower(): forms.CharField(
+        label=_("Correct Answer"),
+        max_length=255,
+        required=False,
+        widget=forms.Textarea(attrs={"rows": 3, "cols": 40, "class": "vLargeTextField"})
+    ),
+}
+
+CORRECT_ANSWER_VALIDATORS = {
+    Question.QuestionType.BOOLEAN.value.lower(): validate_boolean_value
+}
+
+OPTIONS_ERROR_MESSAGES = {
+    "incorrect_number_of_valid_options": _("At least two options should be specified."),
+    "options_have_duplicates": _("Some options have the same values."),
+    "incorrect_number_of_single_choice_options": _(
+        "For single choice question type you need to specify exactly one correct option."),
+    "incorrect_number_of_multiple_choice_options": _(
+        "For multiple choice question type you need to specify at least one correct option."
+    )
+}
+
+
+def validate_correct_answer(question_type, correct_answer):
+    # question_type is in lower case, correct_answer is already cleaned by the matching CORRECT_ANSWER_FIELDS field
+    if _correct_answer_is_empty(correct_answer):
+        raise ValidationError(Field.default_error_messages["required"])
+
+    if question_type in CORRECT_ANSWER_VALIDATORS:
+        if not CORRECT_ANSWER_VALIDATORS[question_type](correct_answer):
+            raise ValidationError(_('Value of the field is invalid.'))
+
+    return correct_answer
+
+
+def find_options_error(question_type, number_of_valid_options, number_of_correct_options, number_of_distinct_options):
+    # returns a key of OPTIONS_ERROR_MESSAGES or None when the options are fine
+    if number_of_valid_options < 2:
+        return "incorrect_number_of_valid_options"
+
+    if number_of_distinct_options != number_of_valid_options:
+        return "options_have_duplicates"
+
+    if question_type == Question.QuestionType.SINGLE_CHOICE and number_of_correct_options != 1:
+        return "incorrect_number_of_single_choice_options"
+
+    if question_type == Question.QuestionType.MULTIPLE_CHOICE and number_of_correct_options == 0:
+        return "incorrect_number_of_multiple_choice_options"
+
+    return None
+
+
+def _correct_answer_is_empty(value):
+    if value in Field.empty_values:
+        return True
+
+    if isinstance(value, str) and value.strip() in Field.empty_values:
+        return True
+
+    return False
@@ -0,0 +1,4 @@
+from .categories_list import AsyncCategoriesList
+from .category_details import AsyncCategoryDetails
+from .questions_list import AsyncQuestionsList
+from .question_details import AsyncQuestionDetails
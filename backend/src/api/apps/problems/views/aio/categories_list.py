@@ -0,0 +1,6 @@
+from api.apps.problems.aio import AsyncView
+from api.apps.problems.views.categories import CategoriesList
+
+
+class AsyncCategoriesList(AsyncView):
+    sync_view_class = CategoriesList
@@ -0,0 +1,8 @@
+from api.apps.problems.aio import AsyncCachedDetailsView
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.views.categories import CategoryDetails
+
+
+class AsyncCategoryDetails(AsyncCachedDetailsView):
+    sync_view_class = CategoryDetails
+    cache_kind = ProblemsCache.CATEGORY
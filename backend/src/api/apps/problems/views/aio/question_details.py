@@ -0,0 +1,8 @@
+from api.apps.problems.aio import AsyncCachedDetailsView
+from api.apps.problems.cache import ProblemsCache
+from api.apps.problems.views.questions import QuestionDetails
+
+
+class AsyncQuestionDetails(AsyncCachedDetailsView):
+    sync_view_class = QuestionDetails
+    cache_kind = ProblemsCache.QUESTION
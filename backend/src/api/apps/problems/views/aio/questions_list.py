@@ -0,0 +1,6 @@
+from api.apps.problems.aio import AsyncView
+from api.apps.problems.views.questions import QuestionsList
+
+
+class AsyncQuestionsList(AsyncView):
+    sync_view_class = QuestionsList
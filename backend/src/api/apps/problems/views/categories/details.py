@@ -1,9 +1,16 @@
 from rest_framework.generics import RetrieveAPIView
 
+from api.apps.problems.cache import CachedRetrieveMixin, ProblemsCache
+from api.apps.problems.conditional import ConditionalGetMixin, category_freshness
 from api.apps.problems.models import Category
 from api.apps.problems.serializers import CategorySerializer
 
 
-class CategoryDetails(RetrieveAPIView):
+class CategoryDetails(ConditionalGetMixin, CachedRetrieveMixin, RetrieveAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_kind = ProblemsCache.CATEGORY
+
+    def get_freshness_state(self):
+        entry = self.get_cached_entry()
+        return entry.freshness_state if entry is not None else category_freshness(self.kwargs["pk"])
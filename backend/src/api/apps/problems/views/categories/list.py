@@ -1,9 +1,13 @@
 from rest_framework.generics import ListAPIView
 
+from api.apps.problems.conditional import ConditionalGetMixin, categories_freshness
 from api.apps.problems.models import Category
 from api.apps.problems.serializers import CategorySerializer
 
 
-class CategoriesList(ListAPIView):
+class CategoriesList(ConditionalGetMixin, ListAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+
+    def get_freshness_state(self):
+        return categories_freshness()
@@ -1,2 +1,8 @@
+from .bulk_import import QuestionsImport
+from .batch import QuestionsBatch
+from .check import QuestionCheck
 from .details import QuestionDetails
+from .export import QuestionsExport
+from .grade import QuestionsGrade
 from .list import QuestionsList
+from .search import QuestionsSearch
@@ -0,0 +1,54 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from api.apps.problems.fieldsets import SparseFieldsetsMixin
+from api.apps.problems.models import Question
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.serializers import QuestionWithOptionsSerializer
+from api.apps.problems.validation import ID_RANGE
+
+
+class QuestionsBatch(SparseFieldsetsMixin, ListAPIView):
+    # Question details of many questions at once: ?ids=3,1,2. Questions come in the order of ids, ids of questions
+    # that don't exist are listed in missing instead of failing the whole request. Everything is loaded with one
+    # query joining categories plus one query for options.
+    queryset = Question.objects.all_with_fk_and_many()
+    serializer_class = QuestionWithOptionsSerializer
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    ids_query_param = "ids"
+    ids_separator = ","
+    max_ids = 500
+
+    def list(self, request, *args, **kwargs):
+        ids = self.__get_ids(request)
+        questions = self.get_queryset().in_bulk(ids)
+
+        serializer = self.get_serializer([questions[pk] for pk in ids if pk in questions], many=True)
+
+        return Response({"results": serializer.data, "missing": [pk for pk in ids if pk not in questions]})
+
+    def __get_ids(self, request):
+        value = request.query_params.get(self.ids_query_param, "")
+
+        try:
+            # repeated ids are returned once, where they first appear
+            ids = list(dict.fromkeys(int(item) for item in value.split(self.ids_separator) if item.strip()))
+        except ValueError:
+            raise ValidationError({self.ids_query_param: [_("Enter a comma separated list of whole numbers.")]})
+
+        # the database would fail on them, and they couldn't be listed in missing, JSON numbers have 64 bits here
+        if any(pk not in ID_RANGE for pk in ids):
+            raise ValidationError({self.ids_query_param: [_("Enter a comma separated list of whole numbers.")]})
+
+        if not ids:
+            raise ValidationError({self.ids_query_param: [_("Enter at least one id.")]})
+
+        if len(ids) > self.max_ids:
+            raise ValidationError({self.ids_query_param: [
+                _("Ensure there are no more than %(max)d ids.") % {"max": self.max_ids}
+            ]})
+
+        return ids
@@ -0,0 +1,52 @@
+import codecs
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.apps.problems.importing import QuestionsImporter, get_rows_reader
+from api.apps.problems.models import Question
+
+
+class QuestionsImport(APIView):
+    # The queryset is here for the default DjangoModelPermissions, only users who can add questions may import them.
+    queryset = Question.objects.all()
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.data.get("file")
+
+        if upload is None or isinstance(upload, str):
+            raise ValidationError({"file": [_("A .csv, .jsonl or .ndjson file should be uploaded.")]})
+
+        reader = get_rows_reader(upload.name)
+
+        if reader is None:
+            raise ValidationError({"file": [_("Only .csv, .jsonl and .ndjson files are supported.")]})
+
+        # the encoding is checked before anything is imported, chunks written before a bad byte couldn't be rolled back
+        if not self.__is_utf8(upload):
+            raise ValidationError({"file": [_("The file should be encoded in UTF-8.")]})
+
+        create_categories = request.data.get("create_categories") in ("1", "true", "True")
+        # the uploaded file is iterated line by line, so a large file is never read in memory as a whole
+        stream = codecs.iterdecode(upload, "utf-8")
+        report = QuestionsImporter(create_categories=create_categories).run(reader(stream))
+
+        return Response(report.as_dict())
+
+    def __is_utf8(self, upload):
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        try:
+            for chunk in upload.chunks():
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        finally:
+            upload.seek(0)
+
+        return True
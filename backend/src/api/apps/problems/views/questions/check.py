@@ -0,0 +1,45 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.apps.problems.answers import answer_index
+from api.apps.problems.models import Question
+from api.apps.problems.validation import ID_RANGE
+
+
+class QuestionCheck(APIView):
+    # Checking an answer doesn't change anything, so it's open to everyone like reading questions is.
+    permission_classes = [AllowAny]
+
+    def post(self, request, pk, *args, **kwargs):
+        if "answer" not in request.data:
+            raise ValidationError({"answer": [_("This field is required.")]})
+
+        try:
+            pk = int(pk)
+        except ValueError:
+            raise Http404
+
+        # there's no question with an id the column can't hold, and the database would fail on it
+        if pk not in ID_RANGE:
+            raise Http404
+
+        try:
+            answer_key = answer_index.get(pk)
+        except Question.DoesNotExist:
+            raise Http404
+
+        try:
+            correct = answer_key.check(request.data["answer"])
+        except DjangoValidationError as e:
+            raise ValidationError({"answer": e.messages})
+
+        return Response({
+            "id": answer_key.question_id,
+            "correct": correct,
+            "points": answer_key.number_of_points if correct else 0,
+        })
@@ -1,9 +1,27 @@
 from rest_framework.generics import RetrieveAPIView
 
+from api.apps.problems.cache import CachedRetrieveMixin, ProblemsCache
+from api.apps.problems.conditional import ConditionalGetMixin, question_freshness
+from api.apps.problems.fieldsets import SparseFieldsetsMixin
 from api.apps.problems.models import Question
 from api.apps.problems.serializers import QuestionWithOptionsSerializer
 
 
-class QuestionDetails(RetrieveAPIView):
+class QuestionDetails(ConditionalGetMixin, SparseFieldsetsMixin, CachedRetrieveMixin, RetrieveAPIView):
     queryset = Question.objects.all_with_fk_and_many()
     serializer_class = QuestionWithOptionsSerializer
+    cache_kind = ProblemsCache.QUESTION
+
+    def get_freshness_state(self):
+        entry = self.get_cached_entry()
+        return entry.freshness_state if entry is not None else question_freshness(self.kwargs["pk"])
+
+    def get_cached_data(self, entry):
+        return self.select_requested_fields(entry.data)
+
+    def should_cache(self):
+        # only complete payloads are cached, a subset of fields is selected from them
+        return self.get_requested_fields() is None
+
+    def get_cache_dependencies(self, data):
+        return [(ProblemsCache.CATEGORY, data["category"]["id"])]
@@ -0,0 +1,20 @@
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from api.apps.problems.export import QuestionsNDJSONExport
+from api.apps.problems.models import Question
+
+
+class QuestionsExport(APIView):
+    # the export includes the correct answers and solutions of the whole bank, so it's for the admin staff only
+    queryset = Question.objects.all()
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        export = QuestionsNDJSONExport()
+
+        response = StreamingHttpResponse(export, content_type=export.content_type)
+        response["Content-Disposition"] = 'attachment; filename="questions.ndjson"'
+
+        return response
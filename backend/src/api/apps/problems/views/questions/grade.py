@@ -0,0 +1,50 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.apps.problems.answers import SheetGrader
+from api.apps.problems.validation import ID_RANGE
+
+
+class QuestionsGrade(APIView):
+    # Grades a quiz sheet in one request: {"answers": [{"id": <question id>, "answer": <answer>}, ...]}.
+    # The sheet is validated by hand, a serializer would cost more than grading itself.
+    permission_classes = [AllowAny]
+    max_answers = 1000
+
+    def post(self, request, *args, **kwargs):
+        items = self.__get_items(request.data)
+
+        return Response(SheetGrader().grade(items))
+
+    def __get_items(self, data):
+        answers = data.get("answers") if isinstance(data, dict) else None
+
+        if not isinstance(answers, list) or not answers:
+            raise ValidationError({"answers": [_("A non-empty list of answers is expected.")]})
+
+        if len(answers) > self.max_answers:
+            raise ValidationError({"answers": [
+                _("Ensure there are no more than %(max)d answers.") % {"max": self.max_answers}
+            ]})
+
+        items, question_ids = [], set()
+
+        for index, answer in enumerate(answers):
+            if not isinstance(answer, dict) or "answer" not in answer or \
+                    not isinstance(answer.get("id"), int) or isinstance(answer["id"], bool):
+                raise ValidationError({f"answers[{index}]": [_("An object with id and answer is expected.")]})
+
+            # the database would fail on an id the column can't hold
+            if answer["id"] not in ID_RANGE:
+                raise ValidationError({f"answers[{index}]": [_("Enter a valid question id.")]})
+
+            if answer["id"] in question_ids:
+                raise ValidationError({f"answers[{index}]": [_("Every question could be answered only once.")]})
+
+            question_ids.add(answer["id"])
+            items.append({"id": answer["id"], "answer": answer["answer"]})
+
+        return items
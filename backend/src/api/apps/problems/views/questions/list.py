@@ -1,9 +1,34 @@
 from rest_framework.generics import ListAPIView
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 
+from api.apps.problems.conditional import ConditionalGetMixin, questions_freshness
+from api.apps.problems.fieldsets import SparseFieldsetsMixin
+from api.apps.problems.filters import QuestionsFilterBackend
 from api.apps.problems.models import Question
-from api.apps.problems.serializers import QuestionSerializer
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.pagination import QuestionsCursorPagination
+from api.apps.problems.serializers import QuestionSerializer, QuestionRowsSerializer
 
 
-class QuestionsList(ListAPIView):
+class QuestionsList(ConditionalGetMixin, SparseFieldsetsMixin, ListAPIView):
     queryset = Question.objects.all_with_fk()
     serializer_class = QuestionSerializer
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = QuestionsCursorPagination
+    filter_backends = [QuestionsFilterBackend]
+
+    def list(self, request, *args, **kwargs):
+        rows_serializer = QuestionRowsSerializer(self.get_serializer_class(), self.get_requested_fields())
+        ordering_columns = [order.lstrip("-") for order in self.pagination_class.ordering]
+
+        rows = rows_serializer.select(self.filter_queryset(self.get_queryset()), *ordering_columns)
+        page = self.paginate_queryset(rows)
+
+        if page is not None:
+            return self.get_paginated_response(rows_serializer.to_representation(page))
+
+        return Response(rows_serializer.to_representation(rows))
+
+    def get_freshness_state(self):
+        return questions_freshness()
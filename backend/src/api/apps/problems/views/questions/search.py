@@ -0,0 +1,45 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from api.apps.problems.conditional import ConditionalGetMixin, questions_search_freshness
+from api.apps.problems.fieldsets import SparseFieldsetsMixin
+from api.apps.problems.models import Question
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.search import QuestionsFullTextSearch
+from api.apps.problems.serializers import QuestionSerializer
+
+
+class QuestionsSearch(ConditionalGetMixin, SparseFieldsetsMixin, ListAPIView):
+    queryset = Question.objects.all_with_fk()
+    serializer_class = QuestionSerializer
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    search_query_param = "search"
+    limit_query_param = "limit"
+    default_limit = 20
+    max_limit = 100
+
+    def list(self, request, *args, **kwargs):
+        search = request.query_params.get(self.search_query_param, "")
+        ids = QuestionsFullTextSearch(self.get_queryset().db).find_ids(search, self.__get_limit(request))
+
+        questions = self.get_queryset().in_bulk(ids)
+        serializer = self.get_serializer([questions[pk] for pk in ids if pk in questions], many=True)
+
+        return Response(serializer.data)
+
+    def get_freshness_state(self):
+        return questions_search_freshness()
+
+    def __get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
+        except ValueError:
+            limit = 0
+
+        if limit < 1:
+            raise ValidationError({self.limit_query_param: [_("Enter a positive whole number.")]})
+
+        return min(limit, self.max_limit)
@@ -0,0 +1 @@
+from .sample import QuizSample
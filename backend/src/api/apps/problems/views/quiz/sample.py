@@ -0,0 +1,64 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+from api.apps.problems.filters import QuestionsFilterBackend
+from api.apps.problems.models import Question
+from api.apps.problems.quiz import QuizSampler
+from api.apps.problems.renderers import FastJSONRenderer
+from api.apps.problems.serializers import QuestionWithOptionsSerializer
+
+
+class QuizSample(ListAPIView):
+    # Returns n random questions matching the same filters as the questions list. The seed is returned along with
+    # the questions, passing it back regenerates the same quiz.
+    queryset = Question.objects.all()
+    serializer_class = QuestionWithOptionsSerializer
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    filter_backends = [QuestionsFilterBackend]
+    size_query_param = "n"
+    seed_query_param = "seed"
+    default_size = 20
+    max_size = 100
+    max_seed = 2 ** 63 - 1
+
+    def list(self, request, *args, **kwargs):
+        sampler = QuizSampler(self.filter_queryset(self.get_queryset()), self.__get_seed(request))
+        ids = sampler.sample_ids(self.__get_size(request))
+
+        questions = Question.objects.all_with_fk_and_many().in_bulk(ids)
+        serializer = self.get_serializer([questions[pk] for pk in ids if pk in questions], many=True)
+
+        return Response({"seed": sampler.seed, "results": serializer.data})
+
+    def __get_size(self, request):
+        try:
+            size = int(request.query_params.get(self.size_query_param, self.default_size))
+        except ValueError:
+            size = 0
+
+        if not 1 <= size <= self.max_size:
+            raise ValidationError({self.size_query_param: [
+                _("Enter a whole number between 1 and %(max)d.") % {"max": self.max_size}
+            ]})
+
+        return size
+
+    def __get_seed(self, request):
+        if self.seed_query_param not in request.query_params:
+            return None
+
+        try:
+            seed = int(request.query_params[self.seed_query_param])
+        except ValueError:
+            seed = -1
+
+        # the seed is returned with the quiz, and JSON numbers of the renderer have 64 bits
+        if not 0 <= seed <= self.max_seed:
+            raise ValidationError({self.seed_query_param: [
+                _("Enter a whole number between 0 and %(max)d.") % {"max": self.max_seed}
+            ]})
+
+        return seed
@@ -0,0 +1 @@
+from .repeated_queries_middleware import RepeatedQueriesMiddleware
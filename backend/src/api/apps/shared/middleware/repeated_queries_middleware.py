@@ -0,0 +1,47 @@
+import logging
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class RepeatedQueriesMiddleware:
+    # A development aid: logs requests that execute the same SQL (with different parameters or not)
+    # REPEATED_QUERIES_THRESHOLD times or more, which is what an N+1 looks like, along with the stack of the repeated
+    # query, so it's clear which code made it. Only queries made in the thread of the request are seen.
+    # Disabled unless DEBUG is on.
+
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.threshold = settings.REPEATED_QUERIES_THRESHOLD
+
+    def __call__(self, request):
+        counts, stacks = Counter(), {}
+
+        def record(execute, sql, params, many, context):
+            counts[sql] += 1
+
+            if counts[sql] == self.threshold:
+                stacks[sql] = "".join(traceback.format_stack()[:-1])
+
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(record))
+
+            response = self.get_response(request)
+
+        for sql, stack_trace in stacks.items():
+            logger.warning("%s %s executed the same query %d times: %s\n%s",
+                           request.method, request.path, counts[sql], sql, stack_trace)
+
+        return response
@@ -0,0 +1 @@
+from .query_budget import query_budget, QueryBudgetMixin
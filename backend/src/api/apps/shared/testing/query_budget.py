@@ -0,0 +1,57 @@
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class query_budget(ContextDecorator):
+    # Fails the test when the code it wraps (a block or a whole test method) makes more than max_queries queries,
+    # the failure lists all of them. Unlike assertNumQueries a budget is an upper bound, so removing a query doesn't
+    # break the test, only adding one does.
+
+    def __init__(self, max_queries, using=DEFAULT_DB_ALIAS):
+        self.max_queries = max_queries
+        self.using = using
+        self.queries = None
+
+    def __enter__(self):
+        self.__context = CaptureQueriesContext(connections[self.using])
+        self.__context.__enter__()
+        self.queries = self.__context.captured_queries
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.__context.__exit__(exc_type, exc_value, traceback)
+        self.queries = self.__context.captured_queries
+
+        if exc_type is None and len(self) > self.max_queries:
+            queries = "\n".join(f"{i}. {query['sql']}" for i, query in enumerate(self.queries, start=1))
+            raise AssertionError(f"{len(self)} queries executed, the budget is {self.max_queries}:\n{queries}")
+
+    def __len__(self):
+        return len(self.queries)
+
+
+class QueryBudgetMixin:
+    # For TestCase classes: assertQueryBudget() checks that a request stays within its budget and makes the same
+    # number of queries after add_rows() added more rows, so a budget can't hide queries made per row (N+1).
+
+    def assertQueryBudget(self, max_queries, run, add_rows, using=DEFAULT_DB_ALIAS):
+        counts = []
+
+        for _ in range(2):
+            with query_budget(max_queries, using) as budget:
+                run()
+
+            counts.append(len(budget))
+            add_rows()
+
+        with query_budget(max_queries, using) as budget:
+            run()
+
+        counts.append(len(budget))
+
+        if len(set(counts)) != 1:
+            self.fail(f"The number of queries grows with the number of rows: {counts}, the last ones were:\n" +
+                      "\n".join(query["sql"] for query in budget.queries))
@@ -1,3 +1,81 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, override_settings
 
-# Create your tests here.
+from api.apps.shared.middleware import RepeatedQueriesMiddleware
+from api.apps.shared.testing import QueryBudgetMixin, query_budget
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self) -> None:
+        self.number_of_users = 0
+        self.add_users()
+
+    def test_budget_should_fail_when_it_is_exceeded(self):
+        with self.assertRaisesRegex(AssertionError, "2 queries executed, the budget is 1"):
+            with query_budget(1):
+                User.objects.count()
+                User.objects.exists()
+
+    def test_budget_should_allow_fewer_queries(self):
+        with query_budget(2) as budget:
+            User.objects.count()
+
+        self.assertEqual(1, len(budget))
+
+    def test_budget_should_decorate_functions(self):
+        @query_budget(0)
+        def count_users():
+            return User.objects.count()
+
+        with self.assertRaises(AssertionError):
+            count_users()
+
+    def test_budget_growing_with_rows_should_fail(self):
+        def n_plus_one():
+            return [user.groups.count() for user in User.objects.all()]
+
+        with self.assertRaisesRegex(AssertionError, "grows with the number of rows"):
+            self.assertQueryBudget(100, n_plus_one, self.add_users)
+
+    def test_budget_independent_of_rows_should_pass(self):
+        self.assertQueryBudget(2, lambda: list(User.objects.prefetch_related("groups")), self.add_users)
+
+    def add_users(self):
+        for _ in range(3):
+            self.number_of_users += 1
+            User.objects.create_user(f"user{self.number_of_users}")
+
+
+class RepeatedQueriesMiddlewareTestCase(TestCase):
+    def setUp(self) -> None:
+        for i in range(5):
+            User.objects.create_user(f"user{i}")
+
+    @override_settings(DEBUG=True, REPEATED_QUERIES_THRESHOLD=3)
+    def test_repeated_queries_should_be_logged_with_the_stack(self):
+        def view(request):
+            return HttpResponse(str([user.groups.count() for user in User.objects.all()]))
+
+        with self.assertLogs("api.apps.shared.middleware.repeated_queries_middleware", "WARNING") as logs:
+            RepeatedQueriesMiddleware(view)(RequestFactory().get("/users/"))
+
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("GET /users/ executed the same query 5 times", logs.output[0])
+        self.assertIn("in view", logs.output[0])
+
+    @override_settings(DEBUG=True, REPEATED_QUERIES_THRESHOLD=3)
+    def test_distinct_queries_should_not_be_logged(self):
+        def view(request):
+            User.objects.count()
+            User.objects.exists()
+            return HttpResponse()
+
+        with self.assertNoLogs("api.apps.shared.middleware.repeated_queries_middleware", "WARNING"):
+            RepeatedQueriesMiddleware(view)(RequestFactory().get("/users/"))
+
+    @override_settings(DEBUG=False)
+    def test_middleware_should_be_disabled_in_production(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RepeatedQueriesMiddleware(lambda request: HttpResponse())
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 import os
+from decimal import Decimal
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -38,11 +39,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.apps.problems.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.apps.problems.routing.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -74,9 +77,78 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+    },
+    # a stand-in for a read replica: copy db.sqlite3 to db.replica.sqlite3 and set PROBLEMS_REPLICA_DATABASES=replica
+    # to try the routing locally, the copy lags behind until it's copied again
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('REPLICA_DATABASE_NAME', BASE_DIR / 'db.replica.sqlite3'),
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
+}
+
+DATABASE_ROUTERS = ['api.apps.problems.routing.ReplicaRouter']
+
+# aliases of the databases reads of the problems API are spread over, writes and admin always use the primary;
+# after a write the client reads from the primary for PROBLEMS_PRIMARY_PIN_SECONDS, which has to cover the lag
+PROBLEMS_REPLICA_DATABASES = [alias for alias in os.environ.get('PROBLEMS_REPLICA_DATABASES', '').split(',') if alias]
+PROBLEMS_PRIMARY_PIN_SECONDS = int(os.environ.get('PROBLEMS_PRIMARY_PIN_SECONDS', 10))
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'problems': {
+        'BACKEND': os.environ.get('PROBLEMS_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('PROBLEMS_CACHE_LOCATION', 'problems'),
+        'TIMEOUT': int(os.environ.get('PROBLEMS_CACHE_TIMEOUT', 24 * 60 * 60)),
     }
 }
 
+# version tokens of every question have to fit in, the default of 300 entries makes them evicted all the time
+# (memcached clients don't accept MAX_ENTRIES, memcached manages its memory by itself)
+if 'memcached' not in CACHES['problems']['BACKEND'].lower():
+    CACHES['problems']['OPTIONS'] = {
+        'MAX_ENTRIES': int(os.environ.get('PROBLEMS_CACHE_MAX_ENTRIES', 100_000)),
+    }
+
+# Answer checking
+
+PROBLEMS_ANSWER_INDEX_MAX_SIZE = int(os.environ.get('PROBLEMS_ANSWER_INDEX_MAX_SIZE', 100_000))
+PROBLEMS_DECIMAL_ANSWER_TOLERANCE = Decimal(os.environ.get('PROBLEMS_DECIMAL_ANSWER_TOLERANCE', '0.000001'))
+
+# Async views
+# the number of threads (and so of database connections) per process serving the database access of async views,
+# 0 runs it in the thread shared with sync views
+
+PROBLEMS_ASYNC_DB_THREADS = int(os.environ.get('PROBLEMS_ASYNC_DB_THREADS', 8))
+
+# Metrics
+# a directory shared by the worker processes of a host, each of them writes its metrics there to be summed up by
+# /metrics; without it /metrics only reports the process that serves the scrape
+
+PROBLEMS_METRICS_DIR = os.environ.get('PROBLEMS_METRICS_DIR') or None
+PROBLEMS_METRICS_FLUSH_SECONDS = float(os.environ.get('PROBLEMS_METRICS_FLUSH_SECONDS', 1))
+# scrapes have to send "Authorization: Bearer <token>" (bearer_token of the Prometheus scrape config);
+# /metrics answers 404 while it isn't set
+PROBLEMS_METRICS_TOKEN = os.environ.get('PROBLEMS_METRICS_TOKEN') or None
+
+# Admin
+# pages of the category autocomplete are reused by a process for this many seconds, a new category may take that long
+# to show up in the question form
+
+PROBLEMS_CATEGORY_AUTOCOMPLETE_CACHE_SECONDS = float(os.environ.get('PROBLEMS_CATEGORY_AUTOCOMPLETE_CACHE_SECONDS', 30))
+
+# Development
+# RepeatedQueriesMiddleware reports a request running the same query this many times as a probable N+1
+
+REPEATED_QUERIES_THRESHOLD = int(os.environ.get('REPEATED_QUERIES_THRESHOLD', 5))
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -15,17 +15,38 @@ DATABASES = {
     }
 }
 
+# a streaming replica of the database, the problems API reads from it when PROBLEMS_REPLICA_DATABASES=replica
+if 'PG_REPLICA_DATABASE_HOST' in os.environ:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.environ['PG_REPLICA_DATABASE_HOST'],
+        'PORT': os.environ.get('PG_REPLICA_DATABASE_PORT', os.environ['PG_DATABASE_PORT']),
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    }
+
+# the problems cache is shared by all workers, so it can't live in the process memory;
+# the table is created by "python manage.py createcachetable"
+CACHES['problems'].update({
+    'BACKEND': os.environ.get('PROBLEMS_CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+    'LOCATION': os.environ.get('PROBLEMS_CACHE_LOCATION', 'problems_cache'),
+})
+
 INSTALLED_APPS = INSTALLED_APPS + [
     'debug_toolbar'
 ]
 
 MIDDLEWARE = [
+    'api.apps.problems.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'api.apps.shared.middleware.RepeatedQueriesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.apps.problems.routing.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
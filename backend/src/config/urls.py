@@ -2,10 +2,13 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from api.apps.problems.metrics import MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
-    path('api/problems/', include('api.apps.problems.urls'))
+    path('api/problems/', include('api.apps.problems.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
 
 if settings.DEBUG: